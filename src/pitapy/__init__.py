@@ -0,0 +1,29 @@
+import importlib
+
+# Public names are imported on first access, so 'import pitapy' does not load
+# dm_control and mujoco until one of them is used.
+_EXPORTS = {
+    "Portfolio": ("pitapy.portfolio", "Portfolio"),
+    "WorldStream": ("pitapy.world_stream", "WorldStream"),
+    "WorldRandomizer": ("pitapy.world_randomizer", "WorldRandomizer"),
+    "TiledWorld": ("pitapy.tiled_world", "TiledWorld"),
+    "PlacementExporter": ("pitapy.utils.placement_exporter", "PlacementExporter"),
+    "WorldDataset": ("pitapy.utils.world_dataset", "WorldDataset"),
+}
+
+__all__ = list(_EXPORTS) + ["load_placements"]
+
+
+def __getattr__(name: str):
+    if name == "load_placements":
+        return __getattr__("PlacementExporter").load
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'pitapy' has no attribute '{name}'")
+    module_name, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
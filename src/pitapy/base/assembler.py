@@ -1,8 +1,9 @@
 import logging
-import os
-
-print(os.path.dirname(os.path.abspath(__file__)))
+import numpy as np
+from typing import Union
 from pitapy.utils.general_utils import Utils
+from pitapy.utils.random_streams import RandomStreams
+from pitapy.utils.time_budget import TimeBudget
 from pitapy.base.world_sites.area import Area
 from pitapy.base.world_sites.environment import Environment
 from pitapy.base.asset_placement.validator import Validator
@@ -11,6 +12,7 @@ from pitapy.base.asset_parsing.blueprint_manager import BlueprintManager
 from pitapy.base.asset_placement.rules.user_config_rule import UserRules
 from pitapy.base.asset_placement.rules.rule_assembler import RuleAssembler
 from pitapy.base.asset_placement.placer.object_placer import ObjectPlacer
+from pitapy.base.asset_placement.placement_events import PlacementEvents
 
 
 class Assembler:
@@ -29,40 +31,87 @@ class Assembler:
         self.plot = plot
         self.user_rules = UserRules(self.config).get_rules()
         self.rule_assembler = RuleAssembler(self.user_rules)
+        self.mujoco_objects_blueprints = None
+        # Placed object types of the last assembled world (see ObjectPlacer.placements)
+        self.placements: list[dict] = []
+        # Object types of the last assembled world left incomplete by their time budget
+        self.incomplete_placements: list[dict] = []
+
+    def load_blueprints(self) -> dict:
+        """Loads the mujoco object blueprints once and keeps them for all following worlds.
 
-    def assemble_world(self) -> tuple[Environment, list[Area]]:
+        Returns:
+            (dict): Dictionary of mujoco objects blueprints
+        """
+        if self.mujoco_objects_blueprints is None:
+            blueprint_manager = BlueprintManager(self.config, self.xml_dir)
+            self.mujoco_objects_blueprints = blueprint_manager.get_object_blueprints()
+        return self.mujoco_objects_blueprints
+
+    def assemble_world(
+        self,
+        random_seed: Union[int, None] = None,
+        previous_placements: Union[list[dict], None] = None,
+        time_budget: Union[float, None] = None,
+        events: Union[PlacementEvents, None] = None,
+    ) -> tuple[Environment, list[Area]]:
         """Assembles the world according to the users configuration and returns the environment and areas.
 
+        Parameters:
+            random_seed (Union[int, None]): Root seed of the random streams, fresh entropy if None
+            previous_placements (Union[list[dict], None]): Exported placements of sites to restore instead of placing them
+            time_budget (Union[float, None]): Seconds for the whole world, falls back to the time_budget of the config
+            events (Union[PlacementEvents, None]): Sink the placement events are streamed to
+
         Returns:
             tuple[Environment, list[Area]]: Environment and Area instances with objects
         """
         logger = logging.getLogger()
+        world_budget = TimeBudget(
+            time_budget
+            if time_budget is not None
+            else self.config["Environment"].get("time_budget")
+        )
+        random_streams = RandomStreams(self.config, random_seed=random_seed)
+        logger.info(f"Random stream entropy: {random_streams.entropy}")
 
         logger.info("Loading assets..")
-        blueprint_manager = BlueprintManager(self.config, self.xml_dir)
-        mujoco_objects_blueprints = blueprint_manager.get_object_blueprints()
+        mujoco_objects_blueprints = self.load_blueprints()
 
         logger.info("Creating environment..")
-        environment, areas = self._create_environment_and_areas(plot=self.plot)
+        environment, areas = self.create_environment_and_areas(
+            plot=self.plot, rng=random_streams.world
+        )
         validators = self._create_validators(environment.size)
 
         logger.info("Placing objects..")
-        object_placer = ObjectPlacer(self.config, mujoco_objects_blueprints)
-        object_placer.place_objects(environment, areas, validators)
+        object_placer = ObjectPlacer(
+            self.config,
+            mujoco_objects_blueprints,
+            random_streams,
+            world_budget,
+            events=events,
+        )
+        object_placer.place_objects(
+            environment, areas, validators, previous_placements=previous_placements
+        )
+        self.placements = object_placer.placements
+        self.incomplete_placements = object_placer.incomplete_placements
 
-        self._add_base_plane(environment)
+        self.add_base_plane(environment)
         if self.plot:
             validators[0].plot(env_size=environment.size)
 
         return environment, areas
 
-    def _create_environment_and_areas(
-        self, plot: bool
+    def create_environment_and_areas(
+        self, plot: bool, rng: np.random.Generator
     ) -> tuple[Environment, list[Area]]:
         """Creates and returns the environment and areas.
 
         Parameters:
             plot (bool): Set to True for plotting
+            rng (np.random.Generator): Generator for world-level draws
 
         Returns:
             tuple[Environment, list[Area]]: Initialized environment and areas with borders (if borders are placed)
@@ -81,6 +130,7 @@ class Assembler:
             size=size_range,
             pretty_mode=pretty_mode,
             headlight=headlight,
+            rng=rng,
         )
 
         areas = []
@@ -151,7 +201,7 @@ class Assembler:
             validators.append(Validator(rules))
         return validators
 
-    def _add_base_plane(self, environment: Environment) -> None:
+    def add_base_plane(self, environment: Environment) -> None:
         """Adds a base plane to the environment.
 
         Parameters:
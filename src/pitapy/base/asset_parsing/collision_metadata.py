@@ -0,0 +1,450 @@
+import logging
+import mujoco
+import numpy as np
+from typing import Union
+from dm_control import mjcf
+from shapely.geometry import MultiPoint, Polygon
+from pitapy.base.asset_parsing.obj_reader import ObjReader
+
+
+class CollisionMetadata:
+    """Extent of the collision geoms of an asset, computed from its xml without compiling physics.
+
+    All values are given in the frame of the object's body, i.e. before the position and
+    rotation of a placement are applied. Round geoms are outlined by polygons that are
+    slightly enlarged, so the extent always encloses the geoms.
+    """
+
+    # Number of segments used to outline round geoms
+    SEGMENTS = 16
+    # Number of size values of the primitive geom types
+    PRIMITIVE_SIZES = {
+        "sphere": 1,
+        "capsule": 2,
+        "cylinder": 2,
+        "box": 3,
+        "ellipsoid": 3,
+    }
+
+    def __init__(
+        self,
+        center: np.ndarray,
+        radius: float,
+        aabb: np.ndarray,
+        hull: Union[Polygon, None],
+        mesh_vertices: dict[str, np.ndarray],
+        primitive: Union[dict, None] = None,
+    ):
+        """Constructor of the CollisionMetadata class.
+
+        Parameters:
+            center (np.ndarray): Center of the bounding sphere
+            radius (float): Radius of the bounding sphere, inf if the asset has an infinite plane
+            aabb (np.ndarray): Array of shape (2, 3) with the lower and upper corner of the bounding box
+            hull (Union[Polygon, None]): Convex hull of all geoms projected onto the xy-plane, None without geoms
+            mesh_vertices (dict[str, np.ndarray]): Scaled vertices of every mesh in the frame of the mesh
+            primitive (Union[dict, None]): Type, size, pos and quat of the geom if the asset is a single primitive geom
+        """
+        self.center = center
+        self.radius = radius
+        self.aabb = aabb
+        self.hull = hull
+        self.mesh_vertices = mesh_vertices
+        self.primitive = primitive
+        self.planar_radius = (
+            0.0
+            if hull is None
+            else float(np.max(np.linalg.norm(np.asarray(hull.exterior.coords), axis=1)))
+        )
+        if not np.isfinite(radius):
+            self.planar_radius = np.inf
+
+    def __deepcopy__(self, memo: dict) -> "CollisionMetadata":
+        """Metadata is never changed after it is computed, so copies of an object share it.
+
+        Parameters:
+            memo (dict): Objects already copied
+
+        Returns:
+            (CollisionMetadata): This metadata
+        """
+        return self
+
+    @staticmethod
+    def from_mjcf(
+        mjcf_obj: mjcf.RootElement,
+        body_name: str,
+        xml_path: Union[str, None] = None,
+    ) -> "CollisionMetadata":
+        """Computes the metadata of the collision geoms of a body and its child bodies.
+
+        Parameters:
+            mjcf_obj (mjcf.RootElement): Mjcf model of the asset
+            body_name (str): Name of the object's body
+            xml_path (Union[str, None]): Path to the xml-file, its .obj meshes are then read from their files
+
+        Returns:
+            (CollisionMetadata): Metadata of the body
+        """
+        angle_scale = np.pi / 180 if mjcf_obj.compiler.angle != "radian" else 1.0
+        euler_sequence = mjcf_obj.compiler.eulerseq or "xyz"
+        mesh_files = {}
+        if xml_path is not None:
+            mesh_files = {
+                name: vertices
+                for name, (vertices, _) in ObjReader.read_meshes(xml_path).items()
+            }
+        mesh_vertices = {
+            mesh.name: (
+                mesh_files[mesh.name]
+                if mesh.name in mesh_files
+                else CollisionMetadata._get_mesh_vertices(mesh)
+            )
+            for mesh in mjcf_obj.asset.find_all("mesh")
+        }
+
+        points = []
+        primitives = []
+        unbounded = False
+        body = mjcf_obj.find("body", body_name)
+        bodies = [(body, np.zeros(3), np.array([1.0, 0.0, 0.0, 0.0]))]
+        while bodies:
+            body, body_position, body_quaternion = bodies.pop()
+            for geom in body.find_all("geom", immediate_children_only=True):
+                if (
+                    CollisionMetadata._get_attribute(geom, "contype", 1) == 0
+                    and CollisionMetadata._get_attribute(geom, "conaffinity", 1) == 0
+                ):
+                    continue
+                geom_points = CollisionMetadata._get_geom_points(geom, mesh_vertices)
+                if geom_points is None:
+                    unbounded = True
+                    continue
+                # The end points of a geom replace its position and orientation
+                if geom.fromto is None:
+                    position, quaternion = CollisionMetadata._get_frame(
+                        geom, angle_scale, euler_sequence
+                    )
+                    geom_points = CollisionMetadata._transform(
+                        geom_points, position, quaternion
+                    )
+                    primitives.append(
+                        CollisionMetadata._get_primitive(
+                            geom, position, quaternion, body_position, body_quaternion
+                        )
+                    )
+                else:
+                    primitives.append(None)
+                points.append(
+                    CollisionMetadata._transform(
+                        geom_points, body_position, body_quaternion
+                    )
+                )
+            for child in body.find_all("body", immediate_children_only=True):
+                position, quaternion = CollisionMetadata._get_frame(
+                    child, angle_scale, euler_sequence
+                )
+                child_quaternion = np.zeros(4)
+                mujoco.mju_mulQuat(child_quaternion, body_quaternion, quaternion)
+                bodies.append(
+                    (
+                        child,
+                        CollisionMetadata._transform(
+                            position[None], body_position, body_quaternion
+                        )[0],
+                        child_quaternion,
+                    )
+                )
+
+        center, radius, aabb, hull = np.zeros(3), 0.0, np.zeros((2, 3)), None
+        if points:
+            points = np.concatenate(points)
+            aabb = np.array([points.min(axis=0), points.max(axis=0)])
+            center = aabb.mean(axis=0)
+            radius = float(np.max(np.linalg.norm(points - center, axis=1)))
+            hull = MultiPoint(points[:, :2]).convex_hull
+            if not isinstance(hull, Polygon):
+                # Geoms without horizontal extent (e.g. a vertical line) get a tiny footprint
+                hull = hull.buffer(1e-9)
+        if unbounded:
+            aabb = np.array([np.full(3, -np.inf), np.full(3, np.inf)])
+            radius = np.inf
+        return CollisionMetadata(
+            center=center,
+            radius=radius,
+            aabb=aabb,
+            hull=hull,
+            mesh_vertices=mesh_vertices,
+            primitive=primitives[0] if len(primitives) == 1 and not unbounded else None,
+        )
+
+    @staticmethod
+    def _get_primitive(
+        geom: mjcf.Element,
+        position: np.ndarray,
+        quaternion: np.ndarray,
+        body_position: np.ndarray,
+        body_quaternion: np.ndarray,
+    ) -> Union[dict, None]:
+        """Describes a primitive geom in the frame of the object's body.
+
+        Parameters:
+            geom (mjcf.Element): Geom element
+            position (np.ndarray): Position of the geom in its body
+            quaternion (np.ndarray): Orientation of the geom in its body
+            body_position (np.ndarray): Position of the geom's body in the object's body
+            body_quaternion (np.ndarray): Orientation of the geom's body in the object's body
+
+        Returns:
+            (Union[dict, None]): Type, size, pos and quat of the geom, None for other geom types
+        """
+        geom_type = CollisionMetadata._get_attribute(geom, "type", "sphere")
+        size = CollisionMetadata._get_attribute(geom, "size")
+        if geom_type not in CollisionMetadata.PRIMITIVE_SIZES or size is None:
+            return None
+        size = np.asarray(size, float)[: CollisionMetadata.PRIMITIVE_SIZES[geom_type]]
+        if len(size) < CollisionMetadata.PRIMITIVE_SIZES[geom_type]:
+            return None
+        geom_quaternion = np.zeros(4)
+        mujoco.mju_mulQuat(geom_quaternion, body_quaternion, quaternion)
+        return {
+            "type": geom_type,
+            "size": size,
+            "pos": CollisionMetadata._transform(
+                position[None], body_position, body_quaternion
+            )[0],
+            "quat": geom_quaternion,
+        }
+
+    @staticmethod
+    def _get_attribute(element: mjcf.Element, name: str, default=None):
+        """Returns an attribute of an element, falling back to its default class.
+
+        Parameters:
+            element (mjcf.Element): Geom element
+            name (str): Name of the attribute
+            default: Value if neither the element nor a default class sets the attribute
+
+        Returns:
+            Value of the attribute
+        """
+        value = getattr(element, name)
+        if value is not None:
+            return value
+        # The default class is the one of the element or the childclass of the closest body
+        default_class = element.dclass
+        parent = element.parent
+        while default_class is None and parent is not None and parent.tag == "body":
+            default_class = parent.childclass
+            parent = parent.parent
+        if default_class is None:
+            default_class = element.root.default
+        while default_class is not None and default_class.tag == "default":
+            value = getattr(getattr(default_class, element.tag), name)
+            if value is not None:
+                return value
+            default_class = default_class.parent
+        return default
+
+    @staticmethod
+    def _get_frame(
+        element: mjcf.Element, angle_scale: float, euler_sequence: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the position and orientation of a body or geom relative to its parent body.
+
+        Parameters:
+            element (mjcf.Element): Body or geom element
+            angle_scale (float): Factor converting the angles of the model to radians
+            euler_sequence (str): Sequence of the euler angles of the model
+
+        Returns:
+            (tuple[np.ndarray, np.ndarray]): Position and quaternion of the element
+        """
+        position = (
+            np.zeros(3) if element.pos is None else np.asarray(element.pos, float)
+        )
+        quaternion = np.array([1.0, 0.0, 0.0, 0.0])
+        if element.quat is not None:
+            quaternion = np.asarray(element.quat, float)
+            quaternion = quaternion / np.linalg.norm(quaternion)
+        elif element.euler is not None:
+            mujoco.mju_euler2Quat(
+                quaternion,
+                np.asarray(element.euler, float) * angle_scale,
+                euler_sequence,
+            )
+        elif element.axisangle is not None:
+            axis_angle = np.asarray(element.axisangle, float)
+            mujoco.mju_axisAngle2Quat(
+                quaternion,
+                axis_angle[:3] / np.linalg.norm(axis_angle[:3]),
+                axis_angle[3] * angle_scale,
+            )
+        elif element.zaxis is not None:
+            mujoco.mju_quatZ2Vec(quaternion, np.asarray(element.zaxis, float))
+        return position, quaternion
+
+    @staticmethod
+    def _get_geom_points(
+        geom: mjcf.Element, mesh_vertices: dict[str, np.ndarray]
+    ) -> Union[np.ndarray, None]:
+        """Returns points whose convex hull encloses a geom, in the frame given by the
+        position and orientation of the geom.
+
+        Parameters:
+            geom (mjcf.Element): Geom element
+            mesh_vertices (dict[str, np.ndarray]): Scaled vertices of every mesh of the model
+
+        Returns:
+            (Union[np.ndarray, None]): Array of shape (n, 3), None for infinite planes
+        """
+        geom_type = CollisionMetadata._get_attribute(geom, "type", "sphere")
+        size = np.zeros(3)
+        geom_size = CollisionMetadata._get_attribute(geom, "size")
+        if geom_size is not None:
+            size[: len(geom_size)] = np.asarray(geom_size, float)[:3]
+
+        # Geoms given by two end points are moved into a frame along their axis
+        offset = np.zeros(3)
+        quaternion = np.array([1.0, 0.0, 0.0, 0.0])
+        if geom.fromto is not None and geom_type in [
+            "capsule",
+            "cylinder",
+            "box",
+            "ellipsoid",
+        ]:
+            start, end = np.split(np.asarray(geom.fromto, float), 2)
+            offset = (start + end) / 2
+            axis = end - start
+            if np.linalg.norm(axis) > 0:
+                mujoco.mju_quatZ2Vec(quaternion, axis)
+            size = np.array([size[0], size[0], np.linalg.norm(axis) / 2])
+            if geom_type in ["capsule", "cylinder"]:
+                size[1] = size[2]
+
+        unit_sphere = CollisionMetadata._get_unit_sphere()
+        if geom_type == "sphere":
+            points = unit_sphere * size[0]
+        elif geom_type == "ellipsoid":
+            points = unit_sphere * size
+        elif geom_type == "capsule":
+            points = np.concatenate(
+                [unit_sphere * size[0] + [0, 0, z] for z in [-size[1], size[1]]]
+            )
+        elif geom_type == "cylinder":
+            circle = unit_sphere[np.isclose(unit_sphere[:, 2], 0)]
+            points = np.concatenate(
+                [circle * size[0] + [0, 0, z] for z in [-size[1], size[1]]]
+            )
+        elif geom_type == "box":
+            points = CollisionMetadata._get_corners(-size, size)
+        elif geom_type == "plane":
+            if size[0] == 0 or size[1] == 0:
+                return None
+            points = CollisionMetadata._get_corners(
+                [-size[0], -size[1], 0], [size[0], size[1], 0]
+            )
+        elif geom_type == "hfield":
+            elevation = 0.0 if geom_size is None or len(geom_size) < 3 else size[2]
+            points = CollisionMetadata._get_corners(
+                [-size[0], -size[1], 0], [size[0], size[1], elevation]
+            )
+        elif geom_type == "mesh":
+            mesh = CollisionMetadata._get_attribute(geom, "mesh")
+            mesh_name = getattr(mesh, "name", mesh)
+            points = mesh_vertices.get(mesh_name)
+            if points is None or len(points) == 0:
+                logging.getLogger().warning(
+                    f"No vertices known for mesh '{mesh_name}', geom '{geom.name}' has no extent."
+                )
+                points = np.zeros((1, 3))
+        else:
+            logging.getLogger().warning(
+                f"Extent of geom type '{geom_type}' is unknown, geom '{geom.name}' is ignored."
+            )
+            points = np.zeros((1, 3))
+
+        return CollisionMetadata._transform(points, offset, quaternion)
+
+    @staticmethod
+    def _get_mesh_vertices(mesh: mjcf.Element) -> np.ndarray:
+        """Reads the vertices of a mesh from its .obj file or its inline vertices and scales them.
+
+        Parameters:
+            mesh (mjcf.Element): Mesh asset element
+
+        Returns:
+            (np.ndarray): Array of shape (n, 3), empty if the vertices cannot be read
+        """
+        if mesh.vertex is not None:
+            vertices = np.asarray(mesh.vertex, float).reshape(-1, 3)
+        elif mesh.file is not None and mesh.file.extension.lower() == ".obj":
+            vertices = ObjReader.parse(mesh.file.contents)[0]
+        else:
+            logging.getLogger().warning(
+                f"Cannot read vertices of mesh '{mesh.name}', only .obj files are supported."
+            )
+            return np.zeros((0, 3))
+        if mesh.scale is not None:
+            vertices = vertices * np.asarray(mesh.scale, float)
+        return vertices
+
+    @staticmethod
+    def _get_unit_sphere() -> np.ndarray:
+        """Returns points on latitude and longitude rings around the unit sphere, enlarged so
+        their convex hull encloses the sphere.
+
+        Returns:
+            (np.ndarray): Array of shape (n, 3)
+        """
+        segments = CollisionMetadata.SEGMENTS
+        longitudes = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+        latitudes = np.linspace(-np.pi / 2, np.pi / 2, segments // 2 + 1)
+        longitudes, latitudes = np.meshgrid(longitudes, latitudes)
+        points = np.column_stack(
+            [
+                (np.cos(latitudes) * np.cos(longitudes)).ravel(),
+                (np.cos(latitudes) * np.sin(longitudes)).ravel(),
+                np.sin(latitudes).ravel(),
+            ]
+        )
+        return points / np.cos(np.pi / segments) ** 2
+
+    @staticmethod
+    def _get_corners(lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Returns the corners of a box.
+
+        Parameters:
+            lower (np.ndarray): Lower corner
+            upper (np.ndarray): Upper corner
+
+        Returns:
+            (np.ndarray): Array of shape (8, 3)
+        """
+        return np.array(
+            [
+                [x, y, z]
+                for x in [lower[0], upper[0]]
+                for y in [lower[1], upper[1]]
+                for z in [lower[2], upper[2]]
+            ],
+            dtype=float,
+        )
+
+    @staticmethod
+    def _transform(
+        points: np.ndarray, position: np.ndarray, quaternion: np.ndarray
+    ) -> np.ndarray:
+        """Rotates points by a quaternion and moves them by a position.
+
+        Parameters:
+            points (np.ndarray): Array of shape (n, 3)
+            position (np.ndarray): Translation
+            quaternion (np.ndarray): Rotation
+
+        Returns:
+            (np.ndarray): Array of shape (n, 3)
+        """
+        matrix = np.zeros(9)
+        mujoco.mju_quat2Mat(matrix, quaternion)
+        return np.asarray(points, float) @ matrix.reshape(3, 3).T + position
@@ -1,11 +1,20 @@
 import os.path
 from pitapy.base.asset_parsing.parser import Parser
 from pitapy.base.asset_parsing.mujoco_object import MujocoObject
+from pitapy.base.asset_parsing.collision_metadata import CollisionMetadata
 
 
 class MujocoLoader:
     """Loads mujoco objects as dictionary."""
 
+    # Number of blueprints kept per process
+    MAX_CACHED_BLUEPRINTS = 256
+
+    # Parsed blueprints are kept for the lifetime of the process, so repeated runs
+    # (e.g. in a long-lived server) do not parse the same xml-files again.
+    # Blueprints are never mutated by the placers, which always work on copies.
+    _blueprint_cache: dict[tuple, MujocoObject] = {}
+
     def __init__(self, config_file: dict, xml_dir: str):
         """Constructor of MujocoLoader class.
 
@@ -124,8 +133,25 @@ class MujocoLoader:
         Returns:
             mujoco_dict (dict): Dictionary of all objects as mujoco-objects
         """
+        # Read params from yml
+        obj_type, tags, rotation = self._read_params(params)
+
+        # Reuse the blueprint if the same asset was loaded before and did not change since
+        obj_xml_path = os.path.join(self.xml_dir, xml_name) if xml_name else None
+        cache_key = None
+        if obj_xml_path is not None and os.path.isfile(obj_xml_path):
+            cache_key = (
+                os.path.abspath(obj_xml_path),
+                os.path.getmtime(obj_xml_path),
+                obj,
+                repr(tags),
+                repr(rotation),
+            )
+            if cache_key in MujocoLoader._blueprint_cache:
+                mujoco_dict[obj] = MujocoLoader._blueprint_cache[cache_key]
+                return mujoco_dict
+
         # Loads asset
-        obj_xml_path = os.path.join(self.xml_dir, xml_name)
         mjcf = Parser.get_mjcf(xml_path=obj_xml_path)
 
         # Adjust asset name in xml
@@ -136,8 +162,7 @@ class MujocoLoader:
         ).name = obj.lower()  # Overwrites inner body name in xml
         mjcf.root.model = obj.lower()  # Overwrites outer body name in xml (root)
 
-        # Read params from yml and create mujoco object
-        obj_type, tags, rotation = self._read_params(params)
+        # Create mujoco object
         mujoco_obj = MujocoObject(
             name=obj,
             mjcf_obj=mjcf,
@@ -147,6 +172,17 @@ class MujocoLoader:
             size=None,
             tags=tags,
         )
+        # Computed once per asset, the blueprint cache and all copies of the blueprint share it
+        mujoco_obj.collision_metadata = CollisionMetadata.from_mjcf(
+            mjcf_obj=mjcf, body_name=obj.lower(), xml_path=obj_xml_path
+        )
         mujoco_dict[obj] = mujoco_obj
+        if cache_key is not None:
+            if len(MujocoLoader._blueprint_cache) >= MujocoLoader.MAX_CACHED_BLUEPRINTS:
+                # Evict the oldest entry (dicts keep insertion order)
+                del MujocoLoader._blueprint_cache[
+                    next(iter(MujocoLoader._blueprint_cache))
+                ]
+            MujocoLoader._blueprint_cache[cache_key] = mujoco_obj
 
         return mujoco_dict
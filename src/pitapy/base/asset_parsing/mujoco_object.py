@@ -1,5 +1,6 @@
 from typing import Union
 from dm_control import mjcf
+from pitapy.base.asset_parsing.collision_metadata import CollisionMetadata
 
 
 class MujocoObject:
@@ -14,6 +15,7 @@ class MujocoObject:
         color: Union[tuple[float, float, float, float], None] = None,
         size: Union[float, None] = None,
         tags: Union[list[str], None] = None,
+        collision_metadata: Union[CollisionMetadata, None] = None,
     ):
         """Initializes the MujocoObject class.
 
@@ -25,6 +27,7 @@ class MujocoObject:
             color (tuple[float, float, float, float]): Color rgba
             size (float): Size of ball (radius)
             tags (list(str)): User specified tags
+            collision_metadata (CollisionMetadata): Extent of the collision geoms, computed on first access if None
         """
         self._name = name
         self._mjcf_obj = mjcf_obj
@@ -33,6 +36,7 @@ class MujocoObject:
         self._color = color
         self._size = size
         self._tags = tags
+        self._collision_metadata = collision_metadata
 
     @property
     def name(self) -> str:
@@ -69,6 +73,7 @@ class MujocoObject:
             mjcf_obj (mjcf.RootElement): Mjcf model of the object
         """
         self._mjcf_obj = mjcf_obj
+        self._collision_metadata = None
 
     @property
     def obj_class(self) -> str:
@@ -159,6 +164,7 @@ class MujocoObject:
             size (list[float]): size of object
         """
         self._mjcf_obj.find("body", self._name.lower()).geom[0].size = size
+        self._collision_metadata = None
 
     @property
     def tags(self) -> Union[list[str], None]:
@@ -177,3 +183,25 @@ class MujocoObject:
             tags (list): Tag list of the object
         """
         self._tags = tags
+
+    @property
+    def collision_metadata(self) -> CollisionMetadata:
+        """Get collision metadata, computed once and dropped when the geometry changes.
+
+        Returns:
+            collision_metadata (CollisionMetadata): Extent of the collision geoms in the frame of the body
+        """
+        if self._collision_metadata is None:
+            self._collision_metadata = CollisionMetadata.from_mjcf(
+                mjcf_obj=self._mjcf_obj, body_name=self._name.lower()
+            )
+        return self._collision_metadata
+
+    @collision_metadata.setter
+    def collision_metadata(self, collision_metadata: CollisionMetadata) -> None:
+        """Set collision metadata.
+
+        Parameters:
+            collision_metadata (CollisionMetadata): Extent of the collision geoms in the frame of the body
+        """
+        self._collision_metadata = collision_metadata
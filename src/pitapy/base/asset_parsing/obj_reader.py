@@ -0,0 +1,273 @@
+import os
+import mmap
+import hashlib
+import logging
+import numpy as np
+import xml.etree.ElementTree as ET
+from typing import Union
+from collections import OrderedDict
+
+
+class ObjReader:
+    """Reads vertices and faces of .obj meshes with numpy, without compiling them with mujoco."""
+
+    # Files larger than this (in bytes) are memory-mapped instead of read into memory
+    MMAP_THRESHOLD = 16 * 2**20
+
+    # Parsed meshes take up to this many bytes in the cache, the least recently used are dropped
+    CACHE_SIZE = 256 * 2**20
+
+    # Parsed meshes by sha1 of their file content, in order of their last use
+    _cache: OrderedDict[str, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+    _cache_bytes = 0
+    # Content hashes by path, modification time and size, so unchanged files are not hashed again
+    _digests: dict[tuple, str] = {}
+
+    # Lookup table of the whitespace bytes
+    _WHITESPACE = np.isin(np.arange(256), list(b" \t\r\n"))
+
+    @staticmethod
+    def read(path: str) -> tuple[np.ndarray, np.ndarray]:
+        """Reads an .obj file, memory-mapped if it is large.
+
+        Parameters:
+            path (str): Path to the .obj file
+
+        Returns:
+            (tuple[np.ndarray, np.ndarray]): Vertices of shape (n, 3) and triangles of shape (m, 3)
+        """
+        if not os.path.isfile(path):
+            logging.getLogger().error(f"Could not find mesh file '{path}'.")
+            raise ValueError(f"Could not find mesh file '{path}'.")
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime, stat.st_size)
+        digest = ObjReader._digests.get(key)
+        mesh = None if digest is None else ObjReader._get_cached(digest)
+        if mesh is not None:
+            return mesh
+
+        with open(path, "rb") as file:
+            if stat.st_size > ObjReader.MMAP_THRESHOLD:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = file.read()
+            try:
+                digest = hashlib.sha1(buffer).hexdigest()
+                mesh = ObjReader.parse(buffer, digest=digest)
+            finally:
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
+        ObjReader._digests[key] = digest
+        return mesh
+
+    @staticmethod
+    def parse(
+        buffer: Union[bytes, mmap.mmap], digest: Union[str, None] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Parses the content of an .obj file. Polygons are split into triangles.
+
+        Parameters:
+            buffer (Union[bytes, mmap.mmap]): Content of the file
+            digest (Union[str, None]): Sha1 of the content if already known
+
+        Returns:
+            (tuple[np.ndarray, np.ndarray]): Vertices of shape (n, 3) and triangles of shape (m, 3)
+        """
+        if digest is None:
+            digest = hashlib.sha1(buffer).hexdigest()
+        mesh = ObjReader._get_cached(digest)
+        if mesh is not None:
+            return mesh
+
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        file_line_starts = np.concatenate([[0], np.flatnonzero(data == ord("\n")) + 1])
+
+        # Vertices may carry a weight or a color after their coordinates
+        text, line_starts, vertex_offsets = ObjReader._get_lines(
+            data, file_line_starts, b"v"
+        )
+        values = np.fromstring(text.tobytes(), dtype=np.float64, sep=" ")
+        value_starts = np.searchsorted(ObjReader._get_token_starts(text), line_starts)
+        vertices = values[value_starts[:, None] + np.arange(3)].reshape(-1, 3)
+
+        # Entries are "v", "v/vt", "v//vn" or "v/vt/vn", only the vertex index is kept
+        text, line_starts, face_offsets = ObjReader._get_lines(
+            data, file_line_starts, b"f"
+        )
+        corner_starts = ObjReader._get_token_starts(text)
+        corner_counts = np.diff(
+            np.append(np.searchsorted(corner_starts, line_starts), len(corner_starts))
+        )
+        text[text == ord("/")] = ord(" ")
+        values = np.fromstring(text.tobytes(), dtype=np.int64, sep=" ")
+        indices = values[
+            np.searchsorted(ObjReader._get_token_starts(text), corner_starts)
+        ]
+        # Relative indices count back from the last vertex defined before their face
+        vertex_counts = np.repeat(
+            np.searchsorted(vertex_offsets, face_offsets), corner_counts
+        )
+        indices = np.where(indices < 0, indices + vertex_counts, indices - 1)
+        faces = ObjReader._get_triangles(indices, corner_counts)
+
+        vertices.flags.writeable = False
+        faces.flags.writeable = False
+        ObjReader._add_cached(digest, (vertices, faces))
+        return vertices, faces
+
+    @staticmethod
+    def _get_cached(digest: str) -> Union[tuple[np.ndarray, np.ndarray], None]:
+        """Returns a parsed mesh from the cache and marks it as recently used.
+
+        Parameters:
+            digest (str): Sha1 of the file content
+
+        Returns:
+            (Union[tuple[np.ndarray, np.ndarray], None]): Vertices and triangles, None if not cached
+        """
+        mesh = ObjReader._cache.get(digest)
+        if mesh is not None:
+            ObjReader._cache.move_to_end(digest)
+        return mesh
+
+    @staticmethod
+    def _add_cached(digest: str, mesh: tuple[np.ndarray, np.ndarray]) -> None:
+        """Adds a parsed mesh to the cache and drops the least recently used meshes until the
+        cache fits into CACHE_SIZE. Meshes larger than the cache are not kept.
+
+        Parameters:
+            digest (str): Sha1 of the file content
+            mesh (tuple[np.ndarray, np.ndarray]): Vertices and triangles
+        """
+        size = sum(array.nbytes for array in mesh)
+        if size > ObjReader.CACHE_SIZE:
+            return
+        ObjReader._cache[digest] = mesh
+        ObjReader._cache_bytes += size
+        while ObjReader._cache_bytes > ObjReader.CACHE_SIZE:
+            _, dropped = ObjReader._cache.popitem(last=False)
+            ObjReader._cache_bytes -= sum(array.nbytes for array in dropped)
+
+    @staticmethod
+    def read_meshes(xml_path: str) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Reads all .obj meshes referenced by <mesh file=...> in a blueprint xml.
+
+        Parameters:
+            xml_path (str): Path to the xml-file
+
+        Returns:
+            (dict[str, tuple[np.ndarray, np.ndarray]]): Vertices (scaled) and triangles by mesh name
+        """
+        meshes = {}
+        for name, (path, scale) in ObjReader.get_mesh_files(xml_path).items():
+            if os.path.splitext(path)[1].lower() != ".obj":
+                continue
+            vertices, faces = ObjReader.read(path)
+            meshes[name] = (vertices * scale, faces)
+        return meshes
+
+    @staticmethod
+    def get_mesh_files(xml_path: str) -> dict[str, tuple[str, np.ndarray]]:
+        """Resolves the files of all meshes in a blueprint xml like mujoco does, relative to the
+        meshdir (or assetdir) of the compiler and the folder of the xml.
+
+        Parameters:
+            xml_path (str): Path to the xml-file
+
+        Returns:
+            (dict[str, tuple[str, np.ndarray]]): Path and scale by mesh name
+        """
+        root = ET.parse(xml_path).getroot()
+        mesh_dir = ""
+        for compiler in root.iter("compiler"):
+            mesh_dir = compiler.get("meshdir", compiler.get("assetdir", mesh_dir))
+        mesh_dir = os.path.join(os.path.dirname(os.path.abspath(xml_path)), mesh_dir)
+
+        mesh_files = {}
+        for mesh in root.iter("mesh"):
+            if mesh.get("file") is None:
+                continue
+            # Meshes without a name are named after their file
+            name = mesh.get(
+                "name", os.path.splitext(os.path.basename(mesh.get("file")))[0]
+            )
+            scale = np.array(mesh.get("scale", "1 1 1").split(), dtype=float)
+            mesh_files[name] = (os.path.join(mesh_dir, mesh.get("file")), scale)
+        return mesh_files
+
+    @staticmethod
+    def _get_lines(
+        data: np.ndarray, line_starts: np.ndarray, keyword: bytes
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Collects all lines starting with a keyword, with the keyword and trailing comments
+        replaced by spaces.
+
+        Parameters:
+            data (np.ndarray): Content of the file as bytes
+            line_starts (np.ndarray): Offsets where the lines of the file start
+            keyword (bytes): Keyword of the lines (e.g. b"v")
+
+        Returns:
+            (tuple[np.ndarray, np.ndarray, np.ndarray]): Content of the lines, the offsets where
+                                                         they start in it and in the file
+        """
+        line_lengths = np.diff(np.append(line_starts, len(data)))
+        # Keywords are followed by whitespace, e.g. "v" must not match "vn" or "vt"
+        padded = np.append(data, np.frombuffer(b"  ", dtype=np.uint8))
+        selected = (padded[line_starts] == ord(keyword)) & ObjReader._WHITESPACE[
+            padded[line_starts + 1]
+        ]
+
+        text = data[np.repeat(selected, line_lengths)].copy()
+        lengths = line_lengths[selected]
+        starts = np.cumsum(lengths) - lengths
+        text[starts[lengths > 0]] = ord(" ")
+
+        # Comments run from a "#" to the end of its line
+        is_hash = text == ord("#")
+        if is_hash.any():
+            # A byte is commented if its line has a "#" up to it
+            hash_counts = np.cumsum(is_hash)
+            line_hash_counts = np.repeat((hash_counts - is_hash)[starts], lengths)
+            is_comment = hash_counts > line_hash_counts
+            text[is_comment & (text != ord("\n"))] = ord(" ")
+        # Every line ends with a line break, also the last line of the file
+        return np.append(text, np.uint8(ord("\n"))), starts, line_starts[selected]
+
+    @staticmethod
+    def _get_token_starts(text: np.ndarray) -> np.ndarray:
+        """Returns the offsets of all whitespace separated tokens.
+
+        Parameters:
+            text (np.ndarray): Content of the lines as bytes
+
+        Returns:
+            (np.ndarray): Offset of the first byte of every token
+        """
+        is_space = ObjReader._WHITESPACE[text]
+        return np.flatnonzero(~is_space & np.append(True, is_space[:-1]))
+
+    @staticmethod
+    def _get_triangles(indices: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """Splits polygons into fans of triangles around their first vertex.
+
+        Parameters:
+            indices (np.ndarray): Zero-based vertex indices of all polygons in order
+            counts (np.ndarray): Number of vertices per polygon
+
+        Returns:
+            (np.ndarray): Array of shape (m, 3)
+        """
+        starts = np.cumsum(counts) - counts
+        triangle_counts = np.maximum(counts - 2, 0)
+        polygon_starts = np.repeat(starts, triangle_counts)
+        offsets = np.arange(triangle_counts.sum()) - np.repeat(
+            np.cumsum(triangle_counts) - triangle_counts, triangle_counts
+        )
+        return np.column_stack(
+            [
+                indices[polygon_starts],
+                indices[polygon_starts + offsets + 1],
+                indices[polygon_starts + offsets + 2],
+            ]
+        ).reshape(-1, 3)
@@ -1,17 +1,19 @@
-from typing import Tuple
+import numpy as np
+from typing import Tuple, Union
 from abc import ABC, abstractmethod
 
 
 class AbstractPlacerDistribution(ABC):
     """Abstract class for Placer Distributions."""
 
-    def __init__(self, parameters: dict):
+    def __init__(self, parameters: dict, rng: Union[np.random.Generator, None] = None):
         """Constructor of the AbstractPlacerDistribution class.
 
         Parameters:
             parameters (dict): Parameters for the placer distribution
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
         """
-        pass
+        self.rng = np.random.default_rng() if rng is None else rng
 
     @abstractmethod
     def __call__(self) -> Tuple[float, float]:
@@ -21,3 +23,14 @@ class AbstractPlacerDistribution(ABC):
             Tuple[float, float]: Sampled x and y coordinates
         """
         pass
+
+    def sample(self, amount: int) -> np.ndarray:
+        """Draws multiple 2D samples from the distribution.
+
+        Parameters:
+            amount (int): Number of samples
+
+        Returns:
+            (np.ndarray): Array of shape (amount, 2) with sampled x and y coordinates
+        """
+        return np.array([self() for _ in range(amount)], dtype=float).reshape(amount, 2)
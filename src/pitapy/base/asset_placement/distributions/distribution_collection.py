@@ -1,5 +1,6 @@
 import logging
 import numpy as np
+from typing import Union
 from pitapy.base.asset_placement.distributions.abstract_placer_distribution import (
     AbstractPlacerDistribution,
 )
@@ -29,7 +30,7 @@ class MultivariateNormalDistribution(AbstractPlacerDistribution):
       resulting in a wider distribution.
     """
 
-    def __init__(self, parameters: dict):
+    def __init__(self, parameters: dict, rng: Union[np.random.Generator, None] = None):
         """Constructor of the MultivariateNormalDistribution class.
 
         Note: default values are "mean" [0, 0] and "cov" [site_length,     0     ]
@@ -37,8 +38,9 @@ class MultivariateNormalDistribution(AbstractPlacerDistribution):
 
         Parameters:
             parameters (dict): Parameters for the multivariate normal distribution
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
         """
-        super().__init__(parameters=parameters)
+        super().__init__(parameters=parameters, rng=rng)
         self.mean = np.array(parameters["mean"]) if "mean" in parameters else [0, 0]
         self.cov = (
             np.array(parameters["cov"])
@@ -56,24 +58,36 @@ class MultivariateNormalDistribution(AbstractPlacerDistribution):
         Returns:
             sample (np.ndarray): Sampled coordinates
         """
-        sample = np.random.multivariate_normal(self.mean, self.cov)
+        sample = self.rng.multivariate_normal(self.mean, self.cov)
         x, y = sample
 
         return x, y
 
+    def sample(self, amount: int) -> np.ndarray:
+        """Draws multiple samples from a multivariate normal distribution at once.
+
+        Parameters:
+            amount (int): Number of samples
+
+        Returns:
+            (np.ndarray): Array of shape (amount, 2) with sampled x and y coordinates
+        """
+        return self.rng.multivariate_normal(self.mean, self.cov, size=amount)
+
 
 class MultivariateUniformDistribution(AbstractPlacerDistribution):
     """Multivariate uniform distribution."""
 
-    def __init__(self, parameters: dict):
+    def __init__(self, parameters: dict, rng: Union[np.random.Generator, None] = None):
         """Constructor of the MultivariateUniform class.
 
         Note: default values are "low": [-site.size[0], -site.size[1]], "high": [site.size[0], site.size[1]],
 
         Parameters:
             parameters (dict): Parameters for the multivariate uniform distribution
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
         """
-        super().__init__(parameters=parameters)
+        super().__init__(parameters=parameters, rng=rng)
         self.low = (
             parameters["low"]
             if "low" in parameters
@@ -97,18 +111,34 @@ class MultivariateUniformDistribution(AbstractPlacerDistribution):
         """
         # Generate samples for each dimension
         samples = [
-            np.round(np.random.uniform(low=low, high=high, size=1)[0], 4)
+            np.round(self.rng.uniform(low=low, high=high, size=1)[0], 4)
             for low, high in zip(self.low, self.high)
         ]
         x, y = samples
 
         return x, y
 
+    def sample(self, amount: int) -> np.ndarray:
+        """Draws multiple 2D samples from a multivariate uniform distribution at once.
+
+        Parameters:
+            amount (int): Number of samples
+
+        Returns:
+            (np.ndarray): Array of shape (amount, 2) with sampled x and y coordinates
+        """
+        return np.round(
+            self.rng.uniform(
+                low=np.ravel(self.low), high=np.ravel(self.high), size=(amount, 2)
+            ),
+            4,
+        )
+
 
 class RandomWalkDistribution(AbstractPlacerDistribution):
     """Random walk distribution for object placement on a 2D plane."""
 
-    def __init__(self, parameters: dict):
+    def __init__(self, parameters: dict, rng: Union[np.random.Generator, None] = None):
         """Constructor of the RandomWalkDistribution class.
 
         Note: default values are "step_size_range": [5, 10], "bounds": [-site.size[0],
@@ -120,8 +150,9 @@ class RandomWalkDistribution(AbstractPlacerDistribution):
             parameters (dict): Parameters for the random walk distribution
                 parameters["step_size_range"]: (min_step_size, max_step_size) - Range of step sizes
                 parameters["bounds"]: (min_x, max_x, min_y, max_y) - Bounds of the 2D plane
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
         """
-        super().__init__(parameters=parameters)
+        super().__init__(parameters=parameters, rng=rng)
         self.step_size_range = (
             parameters["step_size_range"]
             if "step_size_range" in parameters
@@ -149,10 +180,10 @@ class RandomWalkDistribution(AbstractPlacerDistribution):
             (x, y) coordinates: Next randomly generated object placement
         """
         # Randomly choose the step size from the given range
-        step_size = np.random.uniform(self.step_size_range[0], self.step_size_range[1])
+        step_size = self.rng.uniform(self.step_size_range[0], self.step_size_range[1])
 
         # Randomly choose the direction of the step (random angle)
-        angle = np.random.uniform(0, 2 * np.pi)
+        angle = self.rng.uniform(0, 2 * np.pi)
         x_step = step_size * np.cos(angle)
         y_step = step_size * np.sin(angle)
 
@@ -169,15 +200,16 @@ class RandomWalkDistribution(AbstractPlacerDistribution):
 class CircularUniformDistribution(AbstractPlacerDistribution):
     """Circular uniform distribution."""
 
-    def __init__(self, parameters: dict):
+    def __init__(self, parameters: dict, rng: Union[np.random.Generator, None] = None):
         """Constructor of the CircularUniformDistribution class.
 
         Note: default values are "loc": 0.0, "scale": min(site.size[0], site.size[1])
 
         Parameters:
             parameters (dict): Parameters for the circular uniform distribution
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
         """
-        super().__init__(parameters=parameters)
+        super().__init__(parameters=parameters, rng=rng)
         self.loc = parameters["loc"] if "loc" in parameters else 0.0
         self.scale = (
             parameters["scale"]
@@ -195,9 +227,22 @@ class CircularUniformDistribution(AbstractPlacerDistribution):
         Returns:
             x, y (float, float): Sampled x and y coordinates
         """
-        length = np.sqrt(np.random.uniform(self.loc, self.scale**2))
-        angle = np.pi * np.random.uniform(0, 2)
+        length = np.sqrt(self.rng.uniform(self.loc, self.scale**2))
+        angle = np.pi * self.rng.uniform(0, 2)
         x = length * np.cos(angle)
         y = length * np.sin(angle)
 
         return x, y
+
+    def sample(self, amount: int) -> np.ndarray:
+        """Draws multiple 2D samples from a circular uniform distribution at once.
+
+        Parameters:
+            amount (int): Number of samples
+
+        Returns:
+            (np.ndarray): Array of shape (amount, 2) with sampled x and y coordinates
+        """
+        length = np.sqrt(self.rng.uniform(self.loc, self.scale**2, size=amount))
+        angle = np.pi * self.rng.uniform(0, 2, size=amount)
+        return np.stack([length * np.cos(angle), length * np.sin(angle)], axis=1)
@@ -0,0 +1,98 @@
+import sys
+import json
+import time
+from typing import Union
+from dm_control import mjcf
+from pitapy.base.world_sites.abstract_site import AbstractSite
+from pitapy.base.asset_parsing.mujoco_object import MujocoObject
+
+
+class PlacementEvents:
+    """Streams placement events as json lines while a world is generated.
+
+    An "add" line is written as soon as an object is added to its site, with its site, name,
+    class, pose, the number of sampled positions and the time. Objects that are removed again
+    by backtracking are reported by a "remove" line, so replaying the lines in order gives the
+    placed objects at any point of the generation. Every line is flushed right away.
+    """
+
+    def __init__(self, path: str = "-"):
+        """Constructor of the PlacementEvents class.
+
+        Parameters:
+            path (str): Path of the jsonl file, "-" writes to stdout
+        """
+        self.path = path
+        self._file = sys.stdout if path == "-" else open(path, "w")
+
+    def add(
+        self,
+        site: AbstractSite,
+        mujoco_object: MujocoObject,
+        tries: Union[int, None] = None,
+    ) -> None:
+        """Writes the event of an object added to a site.
+
+        Parameters:
+            site (AbstractSite): Site the object was added to
+            mujoco_object (MujocoObject): Added mujoco object
+            tries (Union[int, None]): Number of sampled positions, None for objects that are not sampled
+        """
+        # Sites move the rotation of objects with a free joint to the attachment frame
+        rotation = mjcf.get_attachment_frame(mujoco_object.mjcf_obj).euler
+        if rotation is None:
+            rotation = mujoco_object.rotation
+        self._write(
+            {
+                "event": "add",
+                "site": site.name,
+                "name": mujoco_object.xml_id,
+                "class": mujoco_object.obj_class,
+                "position": PlacementEvents._to_list(mujoco_object.position),
+                "rotation": PlacementEvents._to_list(rotation),
+                "tries": tries,
+                "time": time.time(),
+            }
+        )
+
+    def remove(self, site: AbstractSite, mujoco_object: MujocoObject) -> None:
+        """Writes the event of an object removed from a site.
+
+        Parameters:
+            site (AbstractSite): Site the object was removed from
+            mujoco_object (MujocoObject): Removed mujoco object
+        """
+        self._write(
+            {
+                "event": "remove",
+                "site": site.name,
+                "name": mujoco_object.xml_id,
+                "time": time.time(),
+            }
+        )
+
+    def close(self) -> None:
+        """Closes the file, stdout is left open."""
+        if self._file is not sys.stdout:
+            self._file.close()
+
+    def _write(self, event: dict) -> None:
+        """Writes an event as one line and flushes it.
+
+        Parameters:
+            event (dict): Event to write
+        """
+        self._file.write(json.dumps(event) + "\n")
+        self._file.flush()
+
+    @staticmethod
+    def _to_list(values) -> Union[list[float], None]:
+        """Converts a position or rotation to a list of floats.
+
+        Parameters:
+            values: Array-like values or None
+
+        Returns:
+            (Union[list[float], None]): Values as floats
+        """
+        return None if values is None else [float(value) for value in values]
@@ -1,7 +1,9 @@
 import copy
 import logging
+import numpy as np
 from typing import Union
 from abc import ABC, abstractmethod
+from pitapy.utils.object_property_randomization import ObjectPropertyRandomization
 from pitapy.base.asset_placement.validator import Validator
 from pitapy.base.world_sites.abstract_site import AbstractSite
 from pitapy.base.asset_parsing.mujoco_object import MujocoObject
@@ -62,6 +64,65 @@ class AbstractPlacer(ABC):
                     f"Not enough objects for specified sizes. Objects: {amount}, Sizes: {size_groups}."
                 )
 
+    def _get_colors_and_sizes(
+        self,
+        amount: int,
+        color_groups: Union[tuple[int, int], None],
+        size_groups: Union[tuple[int, int], None],
+        size_value_range: Union[tuple[float, float], None],
+        colors: Union[list, None],
+        sizes: Union[list, None],
+        rng: np.random.Generator,
+    ) -> tuple[Union[np.ndarray, None], Union[np.ndarray, None]]:
+        """Returns the colors and sizes of the objects. Given colors and sizes are used as they
+        are, otherwise they are sampled from the color and size groups.
+
+        Parameters:
+            amount (int): Amount of object to be placed
+            color_groups (Union[tuple[int, int], None]): Range of possible different colors for object
+            size_groups (Union[tuple[int, int], None]): Range of possible different sizes for object
+            size_value_range (Union[tuple[float, float], None]): Range of size values allowed in randomization
+            colors (Union[list, None]): Rgba color per object, sampled from color_groups if None
+            sizes (Union[list, None]): Size per object, sampled from size_groups if None
+            rng (np.random.Generator): Generator to draw samples from
+
+        Returns:
+            (tuple[Union[np.ndarray, None], Union[np.ndarray, None]]): Colors and sizes per object
+        """
+        # Check for mismatch of objects and color-/size-groups in configuration
+        self._check_user_input(
+            color_groups=color_groups if colors is None else None,
+            size_groups=size_groups if sizes is None else None,
+            amount=amount,
+        )
+        colors_for_placement = (
+            ObjectPropertyRandomization.get_random_colors(
+                amount=amount, color_groups=color_groups, rng=rng
+            )
+            if colors is None
+            else np.array(colors, dtype=float)
+        )
+        sizes_for_placement = (
+            ObjectPropertyRandomization.get_random_sizes(
+                amount=amount,
+                size_groups=size_groups,
+                size_value_range=size_value_range,
+                rng=rng,
+            )
+            if sizes is None
+            else np.array(sizes, dtype=float)
+        )
+        for name, values in (
+            ("colors", colors_for_placement),
+            ("sizes", sizes_for_placement),
+        ):
+            if values is not None and len(values) != amount:
+                logging.getLogger().error(
+                    f"Got {len(values)} {name} for {amount} objects."
+                )
+                raise ValueError(f"Got {len(values)} {name} for {amount} objects.")
+        return colors_for_placement, sizes_for_placement
+
     @abstractmethod
     def add(
         self,
@@ -76,7 +137,10 @@ class AbstractPlacer(ABC):
         size_value_range: Union[tuple[int, int], None] = None,
         asset_pool: Union[list, None] = None,
         mujoco_objects_blueprints: Union[dict, None] = None,
-    ) -> None:
+        rng: Union[np.random.Generator, None] = None,
+        colors: Union[list, None] = None,
+        sizes: Union[list, None] = None,
+    ) -> list[MujocoObject]:
         """
         Parameters:
             site (AbstractSite): AbstractSite class instance where the object is added to
@@ -90,9 +154,16 @@ class AbstractPlacer(ABC):
             size_value_range (Union[tuple[float, float], None]): Range of size values allowed in randomization
             asset_pool (Union[list, None]): List of xml-names of assets which should be sampled from
             mujoco_objects_blueprints (Union[dict, None]): Dictionary of all objects as mujoco-objects
+            rng (Union[np.random.Generator, None]): Generator for all random draws of this object type
+            colors (Union[list, None]): Rgba color per object, sampled from color_groups if None
+            sizes (Union[list, None]): Size per object, sampled from size_groups if None
+
+        Returns:
+            (list[MujocoObject]): The placed mujoco objects
         """
         mujoco_object = self._copy(mujoco_object_blueprint)
         site.add(mujoco_object=mujoco_object)
+        return [mujoco_object]
 
     @abstractmethod
     def remove(self, site: AbstractSite, mujoco_object: MujocoObject) -> None:
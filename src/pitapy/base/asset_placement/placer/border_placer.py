@@ -1,7 +1,9 @@
 import copy
 from tqdm import tqdm
+from typing import Union
 from pitapy.base.world_sites.environment import Environment
 from pitapy.base.asset_parsing.mujoco_object import MujocoObject
+from pitapy.base.asset_placement.placement_events import PlacementEvents
 
 
 class BorderPlacer:
@@ -17,6 +19,7 @@ class BorderPlacer:
         mujoco_object_blueprint: MujocoObject,
         amount: int = 4,
         has_border: bool = False,
+        events: Union[PlacementEvents, None] = None,
     ) -> None:
         """Adds the borders around the environment.
 
@@ -25,6 +28,7 @@ class BorderPlacer:
             mujoco_object_blueprint (MujocoObject): Blueprint of to-be-placed mujoco object
             amount (int): Number of to-be-placed borders
             has_border (bool): True if border is added to environment, else False
+            events (Union[PlacementEvents, None]): Sink of the placement events
         """
         if has_border:
             size = environment.size
@@ -66,3 +70,5 @@ class BorderPlacer:
                     border_body.pos[2] = blueprint_z
 
                 environment.add(mujoco_object=border)
+                if events is not None:
+                    events.add(site=environment, mujoco_object=border)
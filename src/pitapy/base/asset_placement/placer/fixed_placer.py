@@ -1,9 +1,11 @@
-import random
 import logging
+import numpy as np
 from tqdm import tqdm
 from typing import Union
 from pitapy.base.world_sites.area import Area
+from pitapy.base.world_sites.tile import Tile
 from pitapy.base.asset_placement.validator import Validator
+from pitapy.base.asset_placement.placement_events import PlacementEvents
 from pitapy.base.world_sites.environment import Environment
 from pitapy.base.world_sites.abstract_site import AbstractSite
 from pitapy.base.asset_parsing.mujoco_object import MujocoObject
@@ -33,7 +35,11 @@ class FixedPlacer(AbstractPlacer):
         size_value_range: Union[tuple[int, int], None] = None,
         asset_pool: Union[list, None] = None,
         mujoco_objects_blueprints: Union[dict, None] = None,
-    ) -> None:
+        rng: Union[np.random.Generator, None] = None,
+        colors: Union[list, None] = None,
+        sizes: Union[list, None] = None,
+        events: Union[PlacementEvents, None] = None,
+    ) -> list[MujocoObject]:
         """Adds a mujoco object to a site by calling the sites add method
         after checking placement via the validator.
 
@@ -49,34 +55,39 @@ class FixedPlacer(AbstractPlacer):
             size_value_range (Union[tuple[float, float], None]): Range of size values allowed in randomization
             asset_pool (Union[list, None]): List of xml-names of assets which should be sampled from
             mujoco_objects_blueprints (Union[dict, None]): Dictionary of all objects as mujoco-objects
-        """
-        # Check for mismatch of objects and color-/size-groups in configuration
-        self._check_user_input(
-            color_groups=color_groups, size_groups=size_groups, amount=amount
-        )
+            rng (Union[np.random.Generator, None]): Generator for all random draws of this object type
+            colors (Union[list, None]): Rgba color per object, sampled from color_groups if None
+            sizes (Union[list, None]): Size per object, sampled from size_groups if None
+            events (Union[PlacementEvents, None]): Sink of the placement events
 
-        # Get colors rgba
-        colors_for_placement = ObjectPropertyRandomization.get_random_colors(
-            amount=amount, color_groups=color_groups
-        )
-
-        # Get object size
-        sizes_for_placement = ObjectPropertyRandomization.get_random_sizes(
-            amount=amount, size_groups=size_groups, size_value_range=size_value_range
+        Returns:
+            placed_mujoco_objects (list[MujocoObject]): The placed mujoco objects
+        """
+        rng = np.random.default_rng() if rng is None else rng
+
+        colors_for_placement, sizes_for_placement = self._get_colors_and_sizes(
+            amount=amount,
+            color_groups=color_groups,
+            size_groups=size_groups,
+            size_value_range=size_value_range,
+            colors=colors,
+            sizes=sizes,
+            rng=rng,
         )
 
         # Get object z-axis rotation
         z_rotation_for_placement = ObjectPropertyRandomization.get_random_rotation(
-            amount=amount, z_rotation_range=z_rotation_range
+            amount=amount, z_rotation_range=z_rotation_range, rng=rng
         )
 
+        placed_mujoco_objects = []
         for obj_idx in tqdm(range(amount)):
             # Get new clean blueprint
             mutable_mujoco_object_blueprint = self._copy(mujoco_object_blueprint)
 
             # Sample from asset pool if asset_pool is given by user
             if asset_pool is not None:
-                asset_name = random.choice(asset_pool).split(".xml")[0]
+                asset_name = rng.choice(asset_pool).split(".xml")[0]
                 mutable_mujoco_object_blueprint = self._copy(
                     mujoco_objects_blueprints[asset_name]
                 )
@@ -119,6 +130,11 @@ class FixedPlacer(AbstractPlacer):
 
             # Add the object to the site
             site.add(mujoco_object=mutable_mujoco_object_blueprint)
+            placed_mujoco_objects.append(mutable_mujoco_object_blueprint)
+            if events is not None:
+                events.add(site=site, mujoco_object=mutable_mujoco_object_blueprint)
+
+        return placed_mujoco_objects
 
     def remove(self, site: AbstractSite, mujoco_object: MujocoObject) -> None:
         """Removes a mujoco object from a site by calling the sites remove method.
@@ -145,6 +161,9 @@ class FixedPlacer(AbstractPlacer):
             obj_idx (int): Index of for-loop of "amount"; given by amount of fixed objects to be placed
             mujoco_object_rule_blueprint (MujocoObject): To-be-checked mujoco object
         """
+        # Coordinates in a tile are given relative to the whole environment
+        if isinstance(site, Tile):
+            site = site.environment
         x_min = float
         y_min = float
         if isinstance(site, Environment):
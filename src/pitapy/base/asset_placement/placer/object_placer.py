@@ -1,32 +1,65 @@
 import logging
+import numpy as np
+from typing import Union
 from shapely import geometry
+from dm_control import mjcf
 from pitapy.utils.general_utils import Utils
+from pitapy.utils.random_streams import RandomStreams
+from pitapy.utils.time_budget import TimeBudget, TimeBudgetExceeded
 from pitapy.base.world_sites.area import Area
+from pitapy.base.world_sites.tile import Tile
 from pitapy.base.world_sites.environment import Environment
 from pitapy.base.asset_placement.validator import Validator
+from pitapy.base.asset_placement.placement_events import PlacementEvents
 from pitapy.base.world_sites.abstract_site import AbstractSite
+from pitapy.base.asset_parsing.mujoco_object import MujocoObject
+from pitapy.base.asset_placement.placer.abstract_placer import AbstractPlacer
 from pitapy.base.asset_placement.placer.fixed_placer import FixedPlacer
 from pitapy.base.asset_placement.placer.random_placer import RandomPlacer
+from pitapy.base.asset_placement.placer.relaxation_placer import RelaxationPlacer
 from pitapy.base.asset_placement.placer.border_placer import BorderPlacer
 
 
 class ObjectPlacer:
     """Places objects in the world (environment and areas)."""
 
-    def __init__(self, config: dict, blueprints: dict):
+    def __init__(
+        self,
+        config: dict,
+        blueprints: dict,
+        random_streams: RandomStreams,
+        time_budget: Union[TimeBudget, None] = None,
+        events: Union[PlacementEvents, None] = None,
+        object_properties: Union[dict, None] = None,
+    ):
         """Constructor of the ObjectPlacer class.
 
         Parameters:
             config (dict): Configuration dictionary
             blueprints (dict): Dictionary of Mujoco objects blueprints
-            rule_blueprints (dict): Dictionary of Mujoco objects rule blueprints
-
+            random_streams (RandomStreams): Random number generators per site and object type
+            time_budget (Union[TimeBudget, None]): Wall-clock budget of the whole world
+            events (Union[PlacementEvents, None]): Sink of the placement events, none are written if None
+            object_properties (Union[dict, None]): Pre-sampled "colors" and "sizes" per object, keyed by
+                                                  site key and object name, sampled from the groups if None
         """
         self.config = config
         self.blueprints = blueprints
+        self.random_streams = random_streams
+        self.time_budget = TimeBudget() if time_budget is None else time_budget
+        self.events = events
+        self.object_properties = {} if object_properties is None else object_properties
+        # Every placed object type in placement order, used to re-randomize the world in place
+        self.placements: list[dict] = []
+        # Object types left incomplete because their time budget ran out
+        self.incomplete_placements: list[dict] = []
 
     def place_objects(
-        self, environment: Environment, areas: list[Area], validators: list[Validator]
+        self,
+        environment: Environment,
+        areas: list[Area],
+        validators: list[Validator],
+        previous_placements: Union[list[dict], None] = None,
     ) -> None:
         """Places all types of objects (border, fixed, random) in the world.
 
@@ -34,8 +67,16 @@ class ObjectPlacer:
             environment (Environment): Environment object
             areas (list[Area]): List of Area objects
             validators (list[Validator]): List of Validator objects
+            previous_placements (Union[list[dict], None]): Exported placements (see get_state) to restore,
+                                                           their sites are not placed again
         """
+        self.on_time_budget = self._get_time_budget_action()
         self._place_border(environment, validators[0])
+        restored_sites = set()
+        if previous_placements:
+            restored_sites = self._restore_placements(
+                [environment, *areas], validators, previous_placements
+            )
         # Global placer
         self._place_objects_in_sites(
             [
@@ -43,18 +84,158 @@ class ObjectPlacer:
             ],
             validators,
             is_fixed=True,
+            skipped_sites=restored_sites,
         )
         if self.config.get("Areas") is not None:
-            self._place_objects_in_sites(areas, validators, is_fixed=True)
+            self._place_objects_in_sites(
+                areas, validators, is_fixed=True, skipped_sites=restored_sites
+            )
+        if self._get_placement_order() == "difficulty":
+            object_types = self._get_object_types(
+                [environment], is_fixed=False, skipped_sites=restored_sites
+            )
+            if self.config.get("Areas") is not None:
+                object_types += self._get_object_types(
+                    areas, is_fixed=False, skipped_sites=restored_sites
+                )
+            self._place_object_types(
+                self._sort_by_difficulty(object_types), validators, is_fixed=False
+            )
+            return
         self._place_objects_in_sites(
             [
                 environment,
             ],
             validators,
             is_fixed=False,
+            skipped_sites=restored_sites,
         )
         if self.config.get("Areas") is not None:
-            self._place_objects_in_sites(areas, validators, is_fixed=False)
+            self._place_objects_in_sites(
+                areas, validators, is_fixed=False, skipped_sites=restored_sites
+            )
+
+    @staticmethod
+    def get_state(placements: list[dict]) -> list[dict]:
+        """Returns the placements in a json serializable form, from which they can be restored.
+
+        Parameters:
+            placements (list[dict]): Placements as recorded by the ObjectPlacer
+
+        Returns:
+            (list[dict]): Site, object name and properties of every placed object per placement
+        """
+        return [
+            {
+                "site": placement["site"].name,
+                "site_key": ObjectPlacer._get_site_key(placement["site"]),
+                "object_name": placement["object_name"],
+                "is_fixed": placement["is_fixed"],
+                "validator_indices": placement["validator_indices"],
+                "mujoco_objects": [
+                    ObjectPlacer._get_object_state(mujoco_object)
+                    for mujoco_object in placement["mujoco_objects"]
+                ],
+            }
+            for placement in placements
+        ]
+
+    @staticmethod
+    def _get_object_state(mujoco_object: MujocoObject) -> dict:
+        """Returns the properties of a placed object needed to restore it.
+
+        Parameters:
+            mujoco_object (MujocoObject): Placed mujoco object
+
+        Returns:
+            (dict): Blueprint name, position, rotation, color and size of the object
+        """
+        # Sites move the rotation of objects with a free joint to the attachment frame
+        frame_rotation = mjcf.get_attachment_frame(mujoco_object.mjcf_obj).euler
+        values = {
+            "position": mujoco_object.position,
+            "rotation": mujoco_object.rotation
+            if frame_rotation is None
+            else frame_rotation,
+            "color": mujoco_object.color,
+            "size": mujoco_object.size,
+        }
+        return {
+            "blueprint": mujoco_object.name,
+            **{
+                key: None if value is None else [float(x) for x in value]
+                for key, value in values.items()
+            },
+        }
+
+    @staticmethod
+    def restore_object(blueprints: dict, object_state: dict) -> MujocoObject:
+        """Creates an object from the state of a placed object, ready to be added to a site.
+
+        Parameters:
+            blueprints (dict): Dictionary of Mujoco objects blueprints
+            object_state (dict): Exported properties of the object (see _get_object_state)
+
+        Returns:
+            (MujocoObject): Copy of the blueprint with the properties of the state
+        """
+        mujoco_object = AbstractPlacer._copy(blueprints[object_state["blueprint"]])
+        for key in ["color", "size", "rotation", "position"]:
+            if object_state[key] is not None:
+                setattr(mujoco_object, key, object_state[key])
+        return mujoco_object
+
+    def _restore_placements(
+        self,
+        sites: list[AbstractSite],
+        validators: list[Validator],
+        previous_placements: list[dict],
+    ) -> set[str]:
+        """Adds the objects of exported placements to their sites and validators again.
+
+        Parameters:
+            sites (list[AbstractSite]): List of Site objects
+            validators (list[Validator]): List of Validator objects
+            previous_placements (list[dict]): Exported placements (see get_state)
+
+        Returns:
+            (set[str]): Names of the restored sites
+        """
+        sites_by_name = {site.name: site for site in sites}
+        for placement in previous_placements:
+            site = sites_by_name[placement["site"]]
+            logging.info(
+                f"Restoring object(s) '{placement['object_name']}' in '{site.name}'"
+            )
+            mujoco_objects = []
+            for object_state in placement["mujoco_objects"]:
+                mujoco_object = ObjectPlacer.restore_object(
+                    self.blueprints, object_state
+                )
+                for validator_index in placement["validator_indices"]:
+                    validators[validator_index].add(mujoco_object)
+                site.add(mujoco_object=mujoco_object)
+                mujoco_objects.append(mujoco_object)
+                if self.events is not None:
+                    self.events.add(site=site, mujoco_object=mujoco_object)
+
+            object_settings = self._get_site_configs([site])[0][
+                placement["object_name"]
+            ]
+            self.placements.append(
+                {
+                    "site": site,
+                    "object_name": placement["object_name"],
+                    "is_fixed": placement["is_fixed"],
+                    "validator_indices": placement["validator_indices"],
+                    "placer_params": self._get_placer_params(
+                        {k: v for dict_ in object_settings for k, v in dict_.items()},
+                        placement["is_fixed"],
+                    ),
+                    "mujoco_objects": mujoco_objects,
+                }
+            )
+        return {placement["site"] for placement in previous_placements}
 
     def _place_border(self, environment: Environment, validator: Validator) -> None:
         """Places borders in the environment.
@@ -76,23 +257,40 @@ class ObjectPlacer:
             mujoco_object_blueprint=self.blueprints["Border"],
             amount=4,
             has_border=has_border,
+            events=self.events,
         )
 
         if has_border:
             validator.map_2D[self.blueprints["Border"].name] = [
-                geometry.LineString(
-                    [
-                        [-environment.size[0], -environment.size[1]],
-                        [-environment.size[0], environment.size[1]],
-                        [environment.size[0], environment.size[1]],
-                        [environment.size[0], -environment.size[1]],
-                        [-environment.size[0], -environment.size[1]],
-                    ]
-                )
+                self.get_border_shape(environment)
             ]
 
+    @staticmethod
+    def get_border_shape(environment: Environment) -> geometry.LineString:
+        """Returns the 2d representation of the borders of the environment.
+
+        Parameters:
+            environment (Environment): Environment object
+
+        Returns:
+            (geometry.LineString): Closed line along the borders
+        """
+        return geometry.LineString(
+            [
+                [-environment.size[0], -environment.size[1]],
+                [-environment.size[0], environment.size[1]],
+                [environment.size[0], environment.size[1]],
+                [environment.size[0], -environment.size[1]],
+                [-environment.size[0], -environment.size[1]],
+            ]
+        )
+
     def _place_objects_in_sites(
-        self, sites: list[AbstractSite], validators: list[Validator], is_fixed: bool
+        self,
+        sites: list[AbstractSite],
+        validators: list[Validator],
+        is_fixed: bool,
+        skipped_sites: set[str] = frozenset(),
     ) -> None:
         """Places fixed or random objects in the world sites.
 
@@ -100,29 +298,220 @@ class ObjectPlacer:
             sites (list[AbstractSite]): List of Site objects
             validators (list[Validator]): List of Validator objects
             is_fixed (bool): True if the objects should be placed with fixed coordinates, False otherwise
+            skipped_sites (set[str]): Names of sites whose objects were restored and are not placed
+        """
+        self._place_object_types(
+            self._get_object_types(sites, is_fixed, skipped_sites), validators, is_fixed
+        )
+
+    def _get_object_types(
+        self,
+        sites: list[AbstractSite],
+        is_fixed: bool,
+        skipped_sites: set[str] = frozenset(),
+    ) -> list[tuple[AbstractSite, int, str, list[dict]]]:
+        """Returns the fixed or random object types of the world sites in config order.
+
+        Parameters:
+            sites (list[AbstractSite]): List of Site objects
+            is_fixed (bool): True for the objects with fixed coordinates, False otherwise
+            skipped_sites (set[str]): Names of sites whose objects were restored and are not placed
+
+        Returns:
+            (list[tuple[AbstractSite, int, str, list[dict]]]): Site, its index, object name and settings
         """
         sites_configs = self._get_site_configs(sites)
-        for site_index, site in enumerate(sites):
-            logging.info(f"Entering site '{sites[site_index].name}'..")
-            for object_name, object_settings in sites_configs[site_index].items():
-                logging.info(
-                    f"Trying to place object(s) '{object_name}' in '{sites[site_index].name}'"
-                )
-                placer: FixedPlacer | RandomPlacer = (
-                    FixedPlacer() if is_fixed else RandomPlacer()
+        return [
+            (site, site_index, object_name, object_settings)
+            for site_index, site in enumerate(sites)
+            if site.name not in skipped_sites
+            for object_name, object_settings in sites_configs[site_index].items()
+            if self._should_place_object(is_fixed, object_settings)
+        ]
+
+    def _place_object_types(
+        self,
+        object_types: list[tuple[AbstractSite, int, str, list[dict]]],
+        validators: list[Validator],
+        is_fixed: bool,
+    ) -> None:
+        """Places the given object types in the given order.
+
+        Parameters:
+            object_types (list[tuple[AbstractSite, int, str, list[dict]]]): Site, its index, object name and settings
+            validators (list[Validator]): List of Validator objects
+            is_fixed (bool): True if the objects should be placed with fixed coordinates, False otherwise
+        """
+        current_site = None
+        for site, site_index, object_name, object_settings in object_types:
+            if site is not current_site:
+                logging.info(f"Entering site '{site.name}'..")
+                current_site = site
+            logging.info(f"Trying to place object(s) '{object_name}' in '{site.name}'")
+            object_config_dict = {
+                k: v for dict_ in object_settings for k, v in dict_.items()
+            }
+            placer: FixedPlacer | RandomPlacer = self._get_placer(
+                object_config_dict, is_fixed
+            )
+            placer_params = self._get_placer_params(object_config_dict, is_fixed)
+            # Fixed objects take no tries, only random placement is limited in time
+            budget_params = (
+                {}
+                if is_fixed
+                else {
+                    "time_budget": self.time_budget.sub(
+                        object_config_dict.get("time_budget")
+                    )
+                }
+            )
+            try:
+                mujoco_objects = placer.add(
+                    site=site,
+                    mujoco_object_blueprint=self.blueprints[object_name],
+                    validators=[validators[0], validators[site_index]],
+                    amount=object_config_dict["amount"],
+                    mujoco_objects_blueprints=self.blueprints,
+                    rng=self.random_streams.get(self._get_site_key(site), object_name),
+                    events=self.events,
+                    **placer_params,
+                    **self.object_properties.get(
+                        (self._get_site_key(site), object_name), {}
+                    ),
+                    **budget_params,
                 )
-                if self._should_place_object(is_fixed, object_settings):
-                    object_config_dict = {
-                        k: v for dict_ in object_settings for k, v in dict_.items()
+            except TimeBudgetExceeded as e:
+                if self.on_time_budget == "fail":
+                    raise
+                # Keep the objects placed so far and continue with the next object type
+                mujoco_objects = e.placed_mujoco_objects
+                self.incomplete_placements.append(
+                    {
+                        "site": site.name,
+                        "object_name": object_name,
+                        "placed": len(mujoco_objects),
+                        "amount": e.amount,
                     }
-                    placer.add(
-                        site=site,
-                        mujoco_object_blueprint=self.blueprints[object_name],
-                        validators=[validators[0], validators[site_index]],
-                        amount=object_config_dict["amount"],
-                        mujoco_objects_blueprints=self.blueprints,
-                        **self._get_placer_params(object_config_dict, is_fixed),
-                    )
+                )
+            self.placements.append(
+                {
+                    "site": site,
+                    "object_name": object_name,
+                    "is_fixed": is_fixed,
+                    "validator_indices": [0, site_index],
+                    "placer_params": placer_params,
+                    "mujoco_objects": mujoco_objects,
+                }
+            )
+
+    def _sort_by_difficulty(
+        self, object_types: list[tuple[AbstractSite, int, str, list[dict]]]
+    ) -> list[tuple[AbstractSite, int, str, list[dict]]]:
+        """Sorts object types by their estimated placement difficulty: largest footprint first,
+        then most constrained distribution (smallest spread), then highest count.
+
+        Parameters:
+            object_types (list[tuple[AbstractSite, int, str, list[dict]]]): Site, its index, object name and settings
+
+        Returns:
+            (list[tuple[AbstractSite, int, str, list[dict]]]): Object types, hardest first
+        """
+        difficulties = {}
+        for site, _, object_name, object_settings in object_types:
+            object_config_dict = {
+                k: v for dict_ in object_settings for k, v in dict_.items()
+            }
+            amount = object_config_dict["amount"]
+            difficulties[(site.name, object_name)] = (
+                -self._estimate_footprint(object_name, object_config_dict),
+                self._estimate_spread(site, object_config_dict),
+                -(max(amount) if isinstance(amount, (list, tuple)) else amount),
+            )
+        order = sorted(
+            object_types,
+            key=lambda object_type: difficulties[(object_type[0].name, object_type[2])],
+        )
+        logging.info(
+            "Placing random objects by difficulty: "
+            f"{[f'{site.name}/{object_name}' for site, _, object_name, _ in order]}"
+        )
+        return order
+
+    def _estimate_footprint(self, object_name: str, config_dict: dict) -> float:
+        """Estimates the ground area an object covers from its (largest possible) footprint.
+
+        Parameters:
+            object_name (str): Name of the object type
+            config_dict (dict): Dictionary containing the object settings
+
+        Returns:
+            (float): Squared horizontal extent of the object
+        """
+        if config_dict.get("size_value_range") is not None:
+            return float(max(config_dict["size_value_range"])) ** 2
+
+        blueprint_names = [object_name] + [
+            asset.split(".xml")[0] for asset in config_dict.get("asset_pool") or []
+        ]
+        extent = max(
+            self.blueprints[blueprint_name].collision_metadata.planar_radius
+            for blueprint_name in blueprint_names
+        )
+        return extent**2
+
+    @staticmethod
+    def _estimate_spread(site: AbstractSite, config_dict: dict) -> float:
+        """Estimates the area a distribution spreads its samples over.
+
+        Parameters:
+            site (AbstractSite): Site object
+            config_dict (dict): Dictionary containing the object settings
+
+        Returns:
+            (float): Product of the standard deviations of sampled x and y coordinates
+        """
+        distribution_class, distr_parameters = RandomPlacer._get_distribution(
+            distribution_config=config_dict.get("distribution"), site=site
+        )
+        # A fixed generator keeps the estimate independent of the random streams of the world
+        distribution = distribution_class(
+            parameters=distr_parameters, rng=np.random.default_rng(0)
+        )
+        samples = np.array([distribution()[:2] for _ in range(64)], dtype=float)
+        return float(np.prod(np.std(samples, axis=0)))
+
+    def _get_placement_order(self) -> str:
+        """Returns the order of random placements given in the environment config.
+
+        Returns:
+            (str): "config" for the order of the config (default) or "difficulty"
+        """
+        placement_order = self.config["Environment"].get("placement_order", "config")
+        if placement_order not in ["config", "difficulty"]:
+            logging.getLogger().error(
+                f"Unknown placement_order '{placement_order}', use 'config' or 'difficulty'."
+            )
+            raise ValueError(
+                f"Unknown placement_order '{placement_order}', use 'config' or 'difficulty'."
+            )
+        return placement_order
+
+    def _get_time_budget_action(self) -> str:
+        """Returns what happens when a time budget runs out, as set by the environment key
+        "on_time_budget".
+
+        Returns:
+            (str): "fail" to raise an error (default) or "partial" to keep the partial world
+        """
+        on_time_budget = self.config["Environment"].get("on_time_budget", "fail")
+        if on_time_budget not in ["fail", "partial"]:
+            logging.getLogger().error(
+                f"Unknown on_time_budget '{on_time_budget}', use 'fail' or 'partial'."
+            )
+            raise ValueError(
+                f"Unknown on_time_budget '{on_time_budget}', use 'fail' or 'partial'."
+            )
+        return on_time_budget
 
     def _get_site_configs(self, sites: list[AbstractSite]) -> list[dict]:
         """Returns the object configurations for all world sites.
@@ -135,11 +524,25 @@ class ObjectPlacer:
         """
         return [
             self.config["Environment"]["Objects"]
-            if "Environment" in site.name
+            if self._get_site_key(site) == "Environment"
             else self.config["Areas"][site.name]["Objects"]
             for site in sites
         ]
 
+    @staticmethod
+    def _get_site_key(site: AbstractSite) -> str:
+        """Returns the key of a world site in the configuration.
+
+        Parameters:
+            site (AbstractSite): Site object
+
+        Returns:
+            (str): "Environment" for the environment and its tiles, the name of the area otherwise
+        """
+        if isinstance(site, Tile):
+            return "Environment"
+        return "Environment" if "Environment" in site.name else site.name
+
     @staticmethod
     def _should_place_object(is_fixed: bool, object_settings: list[dict]) -> bool:
         """Returns whether an object should be placed based on the given settings.
@@ -156,6 +559,29 @@ class ObjectPlacer:
         ]
         return has_coordinates if is_fixed else not has_coordinates
 
+    @staticmethod
+    def _get_placer(config_dict: dict, is_fixed: bool) -> AbstractPlacer:
+        """Returns the placer for an object type, based on the given settings.
+
+        Parameters:
+            config_dict (dict): Dictionary containing the object settings
+            is_fixed (bool): True if the objects should be placed with fixed coordinates, False otherwise
+
+        Returns:
+            (AbstractPlacer): FixedPlacer for fixed objects, RandomPlacer or RelaxationPlacer otherwise
+        """
+        if is_fixed:
+            return FixedPlacer()
+        placement = config_dict.get("placement", "rejection")
+        if placement not in ["rejection", "relaxation"]:
+            logging.getLogger().error(
+                f"Unknown placement '{placement}', use 'rejection' or 'relaxation'."
+            )
+            raise ValueError(
+                f"Unknown placement '{placement}', use 'rejection' or 'relaxation'."
+            )
+        return RelaxationPlacer() if placement == "relaxation" else RandomPlacer()
+
     @staticmethod
     def _get_placer_params(config_dict: dict, is_fixed: bool) -> dict:
         """Returns the specific parameters needed for the placer, based on the given settings.
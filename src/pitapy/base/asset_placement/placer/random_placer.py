@@ -1,11 +1,19 @@
+import heapq
 import logging
-import random
 import importlib.util
+import numpy as np
 from tqdm import tqdm
 from typing import Union
 from pitapy.utils.general_utils import Utils
+from pitapy.utils.time_budget import TimeBudget, TimeBudgetExceeded
 from pitapy.base.world_sites.area import Area
+from pitapy.base.world_sites.tile import Tile
 from pitapy.base.asset_placement.validator import Validator
+from pitapy.base.asset_placement.rules.abstract_rule import Rule
+from pitapy.base.asset_placement.rules.min_distance_mujoco_physics_rule import (
+    MinDistanceMujocoPhysicsRule,
+)
+from pitapy.base.asset_placement.placement_events import PlacementEvents
 from pitapy.base.world_sites.abstract_site import AbstractSite
 from pitapy.base.asset_parsing.mujoco_object import MujocoObject
 from pitapy.base.asset_placement.placer.abstract_placer import AbstractPlacer
@@ -18,8 +26,13 @@ class RandomPlacer(AbstractPlacer):
     """Places objects in a random manner."""
 
     # The validator does not check, if the addition of an item is possible.
-    # Instead, after placement has failed for MAX_TRIES times, an error is thrown.
+    # Instead, after placement has failed for MAX_TRIES times, the most recently placed
+    # objects of the same type that block the rejected positions are removed again and placed
+    # anew (one more object on every consecutive backtrack). If no object of the type blocks
+    # them, or after MAX_BACKTRACKS backtracks, an error is thrown.
+    # A time budget ends the placement independently of the number of tries.
     MAX_TRIES = 10000
+    MAX_BACKTRACKS = 3
 
     def __init__(self):
         """Constructor of the RandomPlacer class."""
@@ -39,7 +52,12 @@ class RandomPlacer(AbstractPlacer):
         size_value_range: Union[tuple[int, int], None] = None,
         asset_pool: Union[list, None] = None,
         mujoco_objects_blueprints: Union[dict, None] = None,
-    ) -> None:
+        rng: Union[np.random.Generator, None] = None,
+        colors: Union[list, None] = None,
+        sizes: Union[list, None] = None,
+        time_budget: Union[TimeBudget, None] = None,
+        events: Union[PlacementEvents, None] = None,
+    ) -> list[MujocoObject]:
         """Adds a mujoco object to a site by calling the sites add method
         after checking placement via the validator.
 
@@ -56,125 +74,123 @@ class RandomPlacer(AbstractPlacer):
             size_value_range (Union[tuple[float, float], None]): Range of size values allowed in randomization
             asset_pool (Union[list, None]): List of xml-names of assets which should be sampled from
             mujoco_objects_blueprints (Union[dict, None]): Dictionary of all objects as mujoco-objects
-        """
-        logger = logging.getLogger()
+            rng (Union[np.random.Generator, None]): Generator for all random draws of this object type
+            colors (Union[list, None]): Rgba color per object, sampled from color_groups if None
+            sizes (Union[list, None]): Size per object, sampled from size_groups if None
+            time_budget (Union[TimeBudget, None]): Wall-clock budget for placing all objects of the type
+            events (Union[PlacementEvents, None]): Sink of the placement events
 
-        # Sample from amount range
-        amount: int = ObjectPropertyRandomization.sample_from_amount(amount=amount)
+        Returns:
+            placed_mujoco_objects (list[MujocoObject]): The placed mujoco objects
 
-        # Check for mismatch of objects and color-/size-groups in configuration
-        self._check_user_input(
-            color_groups=color_groups, size_groups=size_groups, amount=amount
-        )
+        Raises:
+            TimeBudgetExceeded: If the time budget runs out, the objects placed so far stay in the site
+        """
+        rng = np.random.default_rng() if rng is None else rng
 
-        # Get colors rgba
-        colors_for_placement = ObjectPropertyRandomization.get_random_colors(
-            amount=amount, color_groups=color_groups
+        # Sample from amount range
+        amount: int = ObjectPropertyRandomization.sample_from_amount(
+            amount=amount, rng=rng
         )
 
-        # Get object size
-        sizes_for_placement = ObjectPropertyRandomization.get_random_sizes(
-            amount=amount, size_groups=size_groups, size_value_range=size_value_range
+        colors_for_placement, sizes_for_placement = self._get_colors_and_sizes(
+            amount=amount,
+            color_groups=color_groups,
+            size_groups=size_groups,
+            size_value_range=size_value_range,
+            colors=colors,
+            sizes=sizes,
+            rng=rng,
         )
 
         # Get object z-axis rotation
         z_rotation_for_placement = ObjectPropertyRandomization.get_random_rotation(
-            amount=amount, z_rotation_range=z_rotation_range
+            amount=amount, z_rotation_range=z_rotation_range, rng=rng
         )
 
-        # Get distribution name and parameters - load respective module
-        distr_name, distr_parameters = self._get_distr_params(
+        # Get distribution class and parameters
+        distribution_class, distr_parameters = self._get_distribution(
             distribution_config=distribution, site=site
         )
-        module_path = (
-            "pitapy.base.asset_placement.distributions.distribution_collection"
-        )
-        module = importlib.import_module(module_path)
-        distribution_class = getattr(module, distr_name)
 
-        for i in tqdm(range(amount)):
-            # Get new clean blueprint
-            mutable_mujoco_object_blueprint = self._copy(mujoco_object_blueprint)
-
-            # Sample from asset pool if asset_pool is given by user
-            if asset_pool is not None:
-                asset_name = random.choice(asset_pool).split(".xml")[0]
-                mutable_mujoco_object_blueprint = self._copy(
-                    mujoco_objects_blueprints[asset_name]
+        logger = logging.getLogger()
+        placed_mujoco_objects = []
+        # Index of every placed object into the randomized properties, backtracking may remove
+        # objects anywhere in the order, the smallest free index is placed next
+        placed_indices = []
+        free_indices = list(range(amount))
+        backtracks = 0
+        progress = tqdm(total=amount)
+        while len(placed_mujoco_objects) < amount:
+            if time_budget is not None and time_budget.expired():
+                progress.close()
+                self.raise_time_budget_error(
+                    mujoco_object=mujoco_object_blueprint,
+                    site=site,
+                    placed_mujoco_objects=placed_mujoco_objects,
+                    amount=amount,
                 )
-
-            if colors_for_placement is not None:
-                # Apply colors to objects
-                mutable_mujoco_object_blueprint.color = colors_for_placement[i]
-
-            if sizes_for_placement is not None:
-                # Apply sizes to objects
-                mutable_mujoco_object_blueprint.size = sizes_for_placement[i]
-
-            if z_rotation_for_placement is not None:
-                # Apply rotation to z-axis of object
-                rotation = mutable_mujoco_object_blueprint.rotation
-                if rotation is None:
-                    rotation = [0, 0, z_rotation_for_placement[i]]
-                else:
-                    rotation[2] = z_rotation_for_placement[i]
-                mutable_mujoco_object_blueprint.rotation = rotation
-
-            # Save size of object for setting the z coordinate
-            new_z_position = mutable_mujoco_object_blueprint.size[0]
-
-            # Sample a new position
-            mutable_mujoco_object_blueprint.position = (
-                *distribution_class(parameters=distr_parameters)(),
-                new_z_position,
+            index = heapq.heappop(free_indices)
+            mutable_mujoco_object_blueprint = self._prepare_object(
+                index=index,
+                mujoco_object_blueprint=mujoco_object_blueprint,
+                asset_pool=asset_pool,
+                mujoco_objects_blueprints=mujoco_objects_blueprints,
+                colors_for_placement=colors_for_placement,
+                sizes_for_placement=sizes_for_placement,
+                z_rotation_for_placement=z_rotation_for_placement,
+                rng=rng,
             )
 
-            count = 0
-            # Ask every validator for approval until all approve or MAX_TRIES is reached,
-            # then throw error
-            while not all(
-                [
-                    validator.validate(
+            rejected_positions = []
+            tries = self.sample_valid_position(
+                site=site,
+                mujoco_object=mutable_mujoco_object_blueprint,
+                validators=validators,
+                distribution_class=distribution_class,
+                distr_parameters=distr_parameters,
+                rng=rng,
+                time_budget=time_budget,
+                rejected_positions=rejected_positions,
+            )
+            if not tries:
+                heapq.heappush(free_indices, index)
+                if time_budget is not None and time_budget.expired():
+                    # Ends the placement at the top of the loop
+                    continue
+                if backtracks >= RandomPlacer.MAX_BACKTRACKS:
+                    self.raise_placement_error(
                         mujoco_object=mutable_mujoco_object_blueprint, site=site
                     )
-                    for validator in validators
-                ]
-            ):
-                count += 1
-                if count >= RandomPlacer.MAX_TRIES:
-                    logger.error(
-                        "Placement of object '{}' in site '{}' has failed '{}' times, please check your config.yaml".format(
-                            mutable_mujoco_object_blueprint.name,
-                            site.name,
-                            RandomPlacer.MAX_TRIES,
-                        )
-                    )
-                    raise RuntimeError(
-                        "Placement of object '{}' in site '{}' has failed '{}' times, please check your config.yaml".format(
-                            mutable_mujoco_object_blueprint.name,
-                            site.name,
-                            RandomPlacer.MAX_TRIES,
-                        )
-                    )
-                # If placement is not possible, sample a new position
-                mutable_mujoco_object_blueprint.position = (
-                    *distribution_class(parameters=distr_parameters)(),
-                    new_z_position,
-                )
-
-            # If Site is area type, offset the coordinates to the boundaries
-            if isinstance(site, Area):
-                reference_boundaries = (
-                    (-site.environment.size[0], -site.environment.size[0]),
-                    (site.environment.size[1], site.environment.size[1]),
-                )
-                mutable_mujoco_object_blueprint.position = (
-                    Utils.offset_coordinates_to_boundaries(
-                        mutable_mujoco_object_blueprint.position,
-                        site.boundary,
-                        reference_boundaries=reference_boundaries,
+                backtracks += 1
+                blocking_mujoco_objects = self._get_blocking_objects(
+                    mujoco_object=mutable_mujoco_object_blueprint,
+                    placed_mujoco_objects=placed_mujoco_objects,
+                    rejected_positions=rejected_positions,
+                    validators=validators,
+                )[-backtracks:]
+                # Objects of other types, other sites or the rules themselves block the
+                # placement, removing objects of this type would not help
+                if not blocking_mujoco_objects:
+                    self.raise_placement_error(
+                        mujoco_object=mutable_mujoco_object_blueprint, site=site
                     )
+                logger.warning(
+                    f"Placement of object '{mutable_mujoco_object_blueprint.name}' in site '{site.name}' "
+                    f"has failed '{RandomPlacer.MAX_TRIES}' times, removing {len(blocking_mujoco_objects)} "
+                    f"blocking object(s)"
                 )
+                for mujoco_object in blocking_mujoco_objects:
+                    position = placed_mujoco_objects.index(mujoco_object)
+                    del placed_mujoco_objects[position]
+                    heapq.heappush(free_indices, placed_indices.pop(position))
+                    for validator in validators:
+                        validator.remove(mujoco_object)
+                    self.remove(site=site, mujoco_object=mujoco_object)
+                    if events is not None:
+                        events.remove(site=site, mujoco_object=mujoco_object)
+                progress.update(-len(blocking_mujoco_objects))
+                continue
 
             # Keep track of the placement in the validators
             for validator in validators:
@@ -182,6 +198,320 @@ class RandomPlacer(AbstractPlacer):
 
             # Add the object to the site
             site.add(mujoco_object=mutable_mujoco_object_blueprint)
+            placed_mujoco_objects.append(mutable_mujoco_object_blueprint)
+            placed_indices.append(index)
+            if events is not None:
+                events.add(
+                    site=site,
+                    mujoco_object=mutable_mujoco_object_blueprint,
+                    tries=tries,
+                )
+            progress.update(1)
+        progress.close()
+
+        return placed_mujoco_objects
+
+    @staticmethod
+    def sample_valid_position(
+        site: AbstractSite,
+        mujoco_object: MujocoObject,
+        validators: list[Validator],
+        distribution_class: type,
+        distr_parameters: dict,
+        rng: np.random.Generator,
+        time_budget: Union[TimeBudget, None] = None,
+        rejected_positions: Union[list, None] = None,
+    ) -> int:
+        """Samples positions for a mujoco object until all validators approve it and sets it.
+        The z coordinate is set to the first size value of the object.
+
+        Parameters:
+            site (AbstractSite): Site class instance where the object is added to
+            mujoco_object (MujocoObject): To-be-placed mujoco object
+            validators (list[Validator]): List of validators used to check object placement
+            distribution_class (type): Distribution class to sample positions from
+            distr_parameters (dict): Parameters of the distribution
+            rng (np.random.Generator): Generator for all random draws of this object type
+            time_budget (Union[TimeBudget, None]): Wall-clock budget, sampling stops once it is used up
+            rejected_positions (Union[list, None]): List the rejected positions are appended to, in
+                                                    the frame of the placed objects
+
+        Returns:
+            (int): Number of sampled positions up to the valid one, 0 if none was found within
+                   MAX_TRIES samples and the time budget
+        """
+        # Save size of object for setting the z coordinate
+        new_z_position = mujoco_object.size[0]
+
+        # Sample a new position
+        mujoco_object.position = RandomPlacer._sample_position(
+            site=site,
+            distribution_class=distribution_class,
+            distr_parameters=distr_parameters,
+            rng=rng,
+            z=new_z_position,
+        )
+
+        count = 0
+        # Ask every validator for approval until all approve or MAX_TRIES is reached
+        while not all(
+            [
+                validator.validate(mujoco_object=mujoco_object, site=site)
+                for validator in validators
+            ]
+        ):
+            if rejected_positions is not None:
+                rejected_positions.append(
+                    RandomPlacer._to_site_frame(
+                        site=site, position=mujoco_object.position
+                    )[:2]
+                )
+            count += 1
+            if count >= RandomPlacer.MAX_TRIES or (
+                time_budget is not None and time_budget.expired()
+            ):
+                return 0
+            # If placement is not possible, sample a new position
+            mujoco_object.position = RandomPlacer._sample_position(
+                site=site,
+                distribution_class=distribution_class,
+                distr_parameters=distr_parameters,
+                rng=rng,
+                z=new_z_position,
+            )
+
+        RandomPlacer._offset_to_site(site=site, mujoco_object=mujoco_object)
+        return count + 1
+
+    @staticmethod
+    def _get_blocking_objects(
+        mujoco_object: MujocoObject,
+        placed_mujoco_objects: list[MujocoObject],
+        rejected_positions: list,
+        validators: list[Validator],
+    ) -> list[MujocoObject]:
+        """Returns the placed objects that block rejected positions of an object, i.e. that lie
+        within the minimal distance of the rules (plus the extents of both objects for the
+        physics based distance rule) of at least one rejected position.
+
+        Parameters:
+            mujoco_object (MujocoObject): Mujoco object that could not be placed
+            placed_mujoco_objects (list[MujocoObject]): Objects that may be removed, in placement order
+            rejected_positions (list): Rejected positions of the object
+            validators (list[Validator]): List of validators used to check object placement
+
+        Returns:
+            (list[MujocoObject]): Blocking objects in placement order
+        """
+        if not placed_mujoco_objects or not rejected_positions:
+            return []
+        rules = [rule for validator in validators for rule in validator.rules]
+        reach = np.full(len(placed_mujoco_objects), Rule.get_min_distance(rules))
+        # The physics based rule measures between the geoms instead of the positions
+        if any(isinstance(rule, MinDistanceMujocoPhysicsRule) for rule in rules):
+            reach += mujoco_object.collision_metadata.planar_radius + np.array(
+                [
+                    placed_mujoco_object.collision_metadata.planar_radius
+                    for placed_mujoco_object in placed_mujoco_objects
+                ]
+            )
+        positions = np.array(
+            [
+                placed_mujoco_object.position[:2]
+                for placed_mujoco_object in placed_mujoco_objects
+            ],
+            dtype=float,
+        )
+        rejected = np.asarray(rejected_positions, dtype=float)
+        is_blocking = np.zeros(len(placed_mujoco_objects), dtype=bool)
+        # Chunks keep the distance matrix small for many placed objects
+        for start in range(0, len(rejected), 1024):
+            distances = np.linalg.norm(
+                positions[:, None, :] - rejected[None, start : start + 1024, :],
+                axis=2,
+            )
+            is_blocking |= np.any(distances < reach[:, None], axis=1)
+        return [
+            placed_mujoco_object
+            for placed_mujoco_object, blocking in zip(
+                placed_mujoco_objects, is_blocking
+            )
+            if blocking
+        ]
+
+    @staticmethod
+    def _sample_position(
+        site: AbstractSite,
+        distribution_class: type,
+        distr_parameters: dict,
+        rng: np.random.Generator,
+        z: float,
+    ) -> tuple[float, float, float]:
+        """Draws a position from the distribution. Distributions of a tile are centered on the
+        tile, so its samples are moved from the origin to the center of the tile.
+
+        Parameters:
+            site (AbstractSite): Site class instance where the object is added to
+            distribution_class (type): Distribution class to sample positions from
+            distr_parameters (dict): Parameters of the distribution
+            rng (np.random.Generator): Generator for all random draws of this object type
+            z (float): Z coordinate of the position
+
+        Returns:
+            (tuple[float, float, float]): Sampled position
+        """
+        x, y = distribution_class(parameters=distr_parameters, rng=rng)()
+        if isinstance(site, Tile):
+            x, y = x + site.center[0], y + site.center[1]
+        return x, y, z
+
+    @staticmethod
+    def _offset_to_site(site: AbstractSite, mujoco_object: MujocoObject) -> None:
+        """Offsets the coordinates of an object placed in an area to the boundaries of the area.
+
+        Parameters:
+            site (AbstractSite): Site class instance where the object is added to
+            mujoco_object (MujocoObject): Mujoco object with coordinates relative to the site
+        """
+        mujoco_object.position = RandomPlacer._to_site_frame(
+            site=site, position=mujoco_object.position
+        )
+
+    @staticmethod
+    def _to_site_frame(
+        site: AbstractSite, position: tuple[float, float, float]
+    ) -> tuple[float, float, float]:
+        """Converts a sampled position to the frame of the placed objects. Positions sampled
+        for an area are offset to the boundaries of the area, all others are kept.
+
+        Parameters:
+            site (AbstractSite): Site class instance where the object is added to
+            position (tuple[float, float, float]): Sampled position
+
+        Returns:
+            (tuple[float, float, float]): Position in the frame of the placed objects
+        """
+        # If Site is area type, offset the coordinates to the boundaries
+        if isinstance(site, Area):
+            reference_boundaries = (
+                (-site.environment.size[0], -site.environment.size[0]),
+                (site.environment.size[1], site.environment.size[1]),
+            )
+            return Utils.offset_coordinates_to_boundaries(
+                position,
+                site.boundary,
+                reference_boundaries=reference_boundaries,
+            )
+        return position
+
+    def _prepare_object(
+        self,
+        index: int,
+        mujoco_object_blueprint: MujocoObject,
+        asset_pool: Union[list, None],
+        mujoco_objects_blueprints: Union[dict, None],
+        colors_for_placement: Union[np.ndarray, None],
+        sizes_for_placement: Union[np.ndarray, None],
+        z_rotation_for_placement: Union[np.ndarray, None],
+        rng: np.random.Generator,
+    ) -> MujocoObject:
+        """Copies the blueprint (or an asset of the pool) and applies the randomized properties.
+
+        Parameters:
+            index (int): Index of the object within its type
+            mujoco_object_blueprint (MujocoObject): To-be-placed mujoco object
+            asset_pool (Union[list, None]): List of xml-names of assets which should be sampled from
+            mujoco_objects_blueprints (Union[dict, None]): Dictionary of all objects as mujoco-objects
+            colors_for_placement (Union[np.ndarray, None]): Randomized colors of all objects
+            sizes_for_placement (Union[np.ndarray, None]): Randomized sizes of all objects
+            z_rotation_for_placement (Union[np.ndarray, None]): Randomized z-rotations of all objects
+            rng (np.random.Generator): Generator for all random draws of this object type
+
+        Returns:
+            mutable_mujoco_object_blueprint (MujocoObject): Object ready to be positioned
+        """
+        # Get new clean blueprint
+        mutable_mujoco_object_blueprint = self._copy(mujoco_object_blueprint)
+
+        # Sample from asset pool if asset_pool is given by user
+        if asset_pool is not None:
+            asset_name = rng.choice(asset_pool).split(".xml")[0]
+            mutable_mujoco_object_blueprint = self._copy(
+                mujoco_objects_blueprints[asset_name]
+            )
+
+        if colors_for_placement is not None:
+            # Apply colors to objects
+            mutable_mujoco_object_blueprint.color = colors_for_placement[index]
+
+        if sizes_for_placement is not None:
+            # Apply sizes to objects
+            mutable_mujoco_object_blueprint.size = sizes_for_placement[index]
+
+        if z_rotation_for_placement is not None:
+            # Apply rotation to z-axis of object
+            rotation = mutable_mujoco_object_blueprint.rotation
+            if rotation is None:
+                rotation = [0, 0, z_rotation_for_placement[index]]
+            else:
+                rotation[2] = z_rotation_for_placement[index]
+            mutable_mujoco_object_blueprint.rotation = rotation
+
+        return mutable_mujoco_object_blueprint
+
+    @staticmethod
+    def raise_placement_error(mujoco_object: MujocoObject, site: AbstractSite) -> None:
+        """Logs and raises the error for an object that could not be placed.
+
+        Parameters:
+            mujoco_object (MujocoObject): Mujoco object that could not be placed
+            site (AbstractSite): Site class instance where the object should be added to
+
+        Raises:
+            RuntimeError: Always
+        """
+        logger = logging.getLogger()
+        logger.error(
+            "Placement of object '{}' in site '{}' has failed '{}' times, please check your config.yaml".format(
+                mujoco_object.name,
+                site.name,
+                RandomPlacer.MAX_TRIES,
+            )
+        )
+        raise RuntimeError(
+            "Placement of object '{}' in site '{}' has failed '{}' times, please check your config.yaml".format(
+                mujoco_object.name,
+                site.name,
+                RandomPlacer.MAX_TRIES,
+            )
+        )
+
+    @staticmethod
+    def raise_time_budget_error(
+        mujoco_object: MujocoObject,
+        site: AbstractSite,
+        placed_mujoco_objects: list[MujocoObject],
+        amount: int,
+    ) -> None:
+        """Logs and raises the error for an object type whose time budget ran out.
+
+        Parameters:
+            mujoco_object (MujocoObject): Mujoco object that could not be placed in time
+            site (AbstractSite): Site class instance where the object should be added to
+            placed_mujoco_objects (list[MujocoObject]): Objects of the type placed so far
+            amount (int): Number of objects of the type that should have been placed
+
+        Raises:
+            TimeBudgetExceeded: Always
+        """
+        message = (
+            f"Time budget for object '{mujoco_object.name}' in site '{site.name}' ran out "
+            f"after placing {len(placed_mujoco_objects)} of {amount} object(s)"
+        )
+        logging.getLogger().warning(message)
+        raise TimeBudgetExceeded(
+            message, placed_mujoco_objects=placed_mujoco_objects, amount=amount
+        )
 
     def remove(self, site: AbstractSite, mujoco_object: MujocoObject) -> None:
         """Removes a mujoco object from a site by calling the sites remove method.
@@ -192,6 +522,30 @@ class RandomPlacer(AbstractPlacer):
         """
         site.remove(mujoco_object=mujoco_object)
 
+    @staticmethod
+    def _get_distribution(
+        distribution_config: Union[list, None], site: AbstractSite
+    ) -> tuple[type, dict]:
+        """Returns the distribution class and its parameters for the given distribution config.
+
+        Parameters:
+            distribution_config (Union[list, None]): List with dictionaries containing user input of distribution name and pars
+            site (AbstractSite): Site class instance where the object is added to
+
+        Returns:
+            distribution_class (type): Distribution class from the distribution collection
+            parameters (dict): Dictionary with parameter names and values
+        """
+        # Get distribution name and parameters - load respective module
+        distr_name, distr_parameters = RandomPlacer._get_distr_params(
+            distribution_config=distribution_config, site=site
+        )
+        module_path = (
+            "pitapy.base.asset_placement.distributions.distribution_collection"
+        )
+        module = importlib.import_module(module_path)
+        return getattr(module, distr_name), distr_parameters
+
     @staticmethod
     def _get_distr_params(distribution_config: list, site: AbstractSite) -> (str, dict):
         """Returns the name and parameters of given distribution in datatypes needed for distribution classes.
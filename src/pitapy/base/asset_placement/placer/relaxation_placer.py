@@ -0,0 +1,391 @@
+import logging
+import shapely
+import numpy as np
+from typing import Union
+from pitapy.utils.time_budget import TimeBudget
+from pitapy.base.world_sites.tile import Tile
+from pitapy.base.asset_placement.validator import Validator
+from pitapy.base.asset_placement.placement_events import PlacementEvents
+from pitapy.base.world_sites.abstract_site import AbstractSite
+from pitapy.base.asset_parsing.mujoco_object import MujocoObject
+from pitapy.base.asset_placement.placer.random_placer import RandomPlacer
+from pitapy.base.asset_placement.rules.abstract_rule import Rule
+from pitapy.base.asset_placement.rules.min_distance_mujoco_physics_rule import (
+    MinDistanceMujocoPhysicsRule,
+)
+from pitapy.utils.object_property_randomization import (
+    ObjectPropertyRandomization,
+)
+
+
+class RelaxationPlacer(RandomPlacer):
+    """Places objects by sampling all positions at once and pushing overlapping objects apart.
+
+    Instead of rejecting and resampling positions one object at a time, all positions of an
+    object type are drawn from the distribution in one batch. Overlapping pairs (found via a
+    spatial index) are then moved apart along the line between their centers for at most
+    MAX_ITERATIONS iterations. Afterwards every object is checked by the validators as usual,
+    objects that still violate a rule fall back to rejection sampling.
+    """
+
+    MAX_ITERATIONS = 200
+
+    def __init__(self):
+        """Constructor of the RelaxationPlacer class."""
+        super().__init__()
+
+    def add(
+        self,
+        site: AbstractSite,
+        mujoco_object_blueprint: MujocoObject,
+        validators: list[Validator],
+        amount: tuple[int, int] = (1, 1),
+        coordinates: None = None,
+        distribution: list = None,
+        z_rotation_range: Union[tuple[int, int], None] = None,
+        color_groups: Union[tuple[int, int], None] = None,
+        size_groups: Union[tuple[int, int], None] = None,
+        size_value_range: Union[tuple[int, int], None] = None,
+        asset_pool: Union[list, None] = None,
+        mujoco_objects_blueprints: Union[dict, None] = None,
+        rng: Union[np.random.Generator, None] = None,
+        colors: Union[list, None] = None,
+        sizes: Union[list, None] = None,
+        time_budget: Union[TimeBudget, None] = None,
+        events: Union[PlacementEvents, None] = None,
+    ) -> list[MujocoObject]:
+        """Adds mujoco objects to a site by relaxing a batch of sampled positions
+        and checking every placement via the validators.
+
+        Parameters:
+            site (AbstractSite): Site class instance where the object is added to
+            mujoco_object_blueprint (MujocoObject): To-be-placed mujoco object
+            validators (list[Validator]): List of validators used to check object placement
+            amount (tuple[int, int]): Range of possible amount of objects to be placed
+            coordinates (None): Required signature of abstract parent class for fixed_placer
+            distribution (Distribution): Distribution for object to sample from for random placement
+            z_rotation_range (Union[tuple[int, int], None]): Range of degrees for z-axis rotation
+            color_groups (Union[tuple[int, int], None]): Range of possible different colors for object
+            size_groups (Union[tuple[int, int], None]): Range of possible different sizes for object
+            size_value_range (Union[tuple[float, float], None]): Range of size values allowed in randomization
+            asset_pool (Union[list, None]): List of xml-names of assets which should be sampled from
+            mujoco_objects_blueprints (Union[dict, None]): Dictionary of all objects as mujoco-objects
+            rng (Union[np.random.Generator, None]): Generator for all random draws of this object type
+            colors (Union[list, None]): Rgba color per object, sampled from color_groups if None
+            sizes (Union[list, None]): Size per object, sampled from size_groups if None
+            time_budget (Union[TimeBudget, None]): Wall-clock budget for placing all objects of the type
+            events (Union[PlacementEvents, None]): Sink of the placement events
+
+        Returns:
+            placed_mujoco_objects (list[MujocoObject]): The placed mujoco objects
+
+        Raises:
+            TimeBudgetExceeded: If the time budget runs out, the objects placed so far stay in the site
+        """
+        rng = np.random.default_rng() if rng is None else rng
+
+        # Sample from amount range
+        amount: int = ObjectPropertyRandomization.sample_from_amount(
+            amount=amount, rng=rng
+        )
+
+        colors_for_placement, sizes_for_placement = self._get_colors_and_sizes(
+            amount=amount,
+            color_groups=color_groups,
+            size_groups=size_groups,
+            size_value_range=size_value_range,
+            colors=colors,
+            sizes=sizes,
+            rng=rng,
+        )
+        z_rotation_for_placement = ObjectPropertyRandomization.get_random_rotation(
+            amount=amount, z_rotation_range=z_rotation_range, rng=rng
+        )
+        distribution_class, distr_parameters = self._get_distribution(
+            distribution_config=distribution, site=site
+        )
+
+        mujoco_objects = [
+            self._prepare_object(
+                index=index,
+                mujoco_object_blueprint=mujoco_object_blueprint,
+                asset_pool=asset_pool,
+                mujoco_objects_blueprints=mujoco_objects_blueprints,
+                colors_for_placement=colors_for_placement,
+                sizes_for_placement=sizes_for_placement,
+                z_rotation_for_placement=z_rotation_for_placement,
+                rng=rng,
+            )
+            for index in range(amount)
+        ]
+        if not mujoco_objects:
+            return []
+
+        # Sample all positions in one batch and push overlapping objects apart
+        positions = distribution_class(parameters=distr_parameters, rng=rng).sample(
+            amount
+        )
+        obstacles = self._get_obstacles(validators)
+        if isinstance(site, Tile):
+            # Relax in the frame of the tile, its distribution is centered on the tile
+            obstacles = shapely.transform(
+                obstacles, lambda coordinates: coordinates - site.center
+            )
+        positions = self.relax(
+            positions=positions,
+            radii=self._get_radii(mujoco_objects, validators),
+            min_distance=self._get_min_distance(validators),
+            obstacles=obstacles,
+            bounds=np.asarray(distr_parameters["site_sizes"], dtype=float),
+            rng=rng,
+        )
+        if isinstance(site, Tile):
+            positions = positions + np.asarray(site.center)
+
+        logger = logging.getLogger()
+        fallbacks = 0
+        for index, (mujoco_object, position) in enumerate(
+            zip(mujoco_objects, positions)
+        ):
+            if time_budget is not None and time_budget.expired():
+                self.raise_time_budget_error(
+                    mujoco_object=mujoco_object,
+                    site=site,
+                    placed_mujoco_objects=mujoco_objects[:index],
+                    amount=amount,
+                )
+            # Set the relaxed position with the z coordinate set to the first size value
+            mujoco_object.position = (
+                float(position[0]),
+                float(position[1]),
+                mujoco_object.size[0],
+            )
+            if all(
+                validator.validate(mujoco_object=mujoco_object, site=site)
+                for validator in validators
+            ):
+                self._offset_to_site(site=site, mujoco_object=mujoco_object)
+                tries = 1
+            else:
+                # Resolve the remaining violations by rejection sampling
+                fallbacks += 1
+                tries = self.sample_valid_position(
+                    site=site,
+                    mujoco_object=mujoco_object,
+                    validators=validators,
+                    distribution_class=distribution_class,
+                    distr_parameters=distr_parameters,
+                    rng=rng,
+                    time_budget=time_budget,
+                )
+                if not tries:
+                    if time_budget is not None and time_budget.expired():
+                        self.raise_time_budget_error(
+                            mujoco_object=mujoco_object,
+                            site=site,
+                            placed_mujoco_objects=mujoco_objects[:index],
+                            amount=amount,
+                        )
+                    self.raise_placement_error(mujoco_object=mujoco_object, site=site)
+                # The relaxed position counts as the first try
+                tries += 1
+
+            # Keep track of the placement in the validators
+            for validator in validators:
+                validator.add(mujoco_object)
+
+            # Add the object to the site
+            site.add(mujoco_object=mujoco_object)
+            if events is not None:
+                events.add(site=site, mujoco_object=mujoco_object, tries=tries)
+
+        if fallbacks:
+            logger.info(
+                f"Relaxation left {fallbacks} of {amount} object(s) '{mujoco_object_blueprint.name}' "
+                f"in site '{site.name}' invalid, they were placed by rejection sampling"
+            )
+        return mujoco_objects
+
+    @staticmethod
+    def relax(
+        positions: np.ndarray,
+        radii: np.ndarray,
+        min_distance: float,
+        obstacles: np.ndarray,
+        bounds: np.ndarray,
+        rng: np.random.Generator,
+        iterations: int = MAX_ITERATIONS,
+    ) -> np.ndarray:
+        """Pushes overlapping positions apart until no pair overlaps or the iterations are used up.
+        Two objects overlap if their centers are closer than the sum of their radii plus the
+        minimal distance. Overlapping objects are both moved by half of the overlap, objects
+        overlapping an obstacle (an already placed object or the border) are moved away from
+        its nearest point by the full overlap. Placed objects are assumed to be as large as the
+        object overlapping them.
+
+        Parameters:
+            positions (np.ndarray): Array of shape (n, 2) with the sampled positions
+            radii (np.ndarray): Array of shape (n,) with the radii of the objects
+            min_distance (float): Minimal distance between objects
+            obstacles (np.ndarray): Array of shape (m,) with the shapely geometries of placed objects
+            bounds (np.ndarray): Half extents of the site, positions are kept inside
+            rng (np.random.Generator): Generator for the direction of coincident positions
+            iterations (int): Maximal number of iterations
+
+        Returns:
+            positions (np.ndarray): Array of shape (n, 2) with the relaxed positions
+        """
+        positions = np.array(positions, dtype=float).reshape(-1, 2)
+        radii = np.asarray(radii, dtype=float)
+        # Keep a small margin, as the boundary does not contain positions on its edge
+        low = -bounds + radii[:, None] + 1e-3
+        high = bounds - radii[:, None] - 1e-3
+        reach = 2 * radii.max() + min_distance
+        obstacle_tree = shapely.STRtree(obstacles) if len(obstacles) else None
+        obstacle_is_point = shapely.get_type_id(obstacles) == 0
+
+        for _ in range(iterations):
+            points = shapely.points(positions)
+            displacements = np.zeros_like(positions)
+            overlaps = False
+
+            # Pairs of sampled positions
+            first, second = shapely.STRtree(points).query(
+                points, predicate="dwithin", distance=reach
+            )
+            pairs = first < second
+            first, second = first[pairs], second[pairs]
+            offsets = positions[first] - positions[second]
+            distances = np.linalg.norm(offsets, axis=1)
+            overlap = radii[first] + radii[second] + min_distance - distances
+            colliding = overlap > 0
+            if colliding.any():
+                overlaps = True
+                first, second = first[colliding], second[colliding]
+                offsets, distances = offsets[colliding], distances[colliding]
+                directions = RelaxationPlacer._get_directions(offsets, distances, rng)
+                push = directions * (overlap[colliding] / 2)[:, None]
+                np.add.at(displacements, first, push)
+                np.add.at(displacements, second, -push)
+
+            # Pairs of sampled positions and placed objects
+            if obstacle_tree is not None:
+                index, obstacle = obstacle_tree.query(
+                    points, predicate="dwithin", distance=reach
+                )
+                nearest = shapely.get_coordinates(
+                    shapely.shortest_line(obstacles[obstacle], points[index])
+                )[::2]
+                offsets = positions[index] - nearest
+                distances = np.linalg.norm(offsets, axis=1)
+                overlap = (
+                    radii[index] * (1 + obstacle_is_point[obstacle])
+                    + min_distance
+                    - distances
+                )
+                colliding = overlap > 0
+                if colliding.any():
+                    overlaps = True
+                    directions = RelaxationPlacer._get_directions(
+                        offsets[colliding], distances[colliding], rng
+                    )
+                    np.add.at(
+                        displacements,
+                        index[colliding],
+                        directions * overlap[colliding][:, None],
+                    )
+
+            if not overlaps:
+                break
+            # Jitter the moved positions, so pushes that cancel out cannot stall the relaxation
+            moved = np.any(displacements != 0, axis=1)
+            displacements[moved] += rng.normal(
+                scale=0.05 * reach, size=(moved.sum(), 2)
+            )
+            positions = np.clip(positions + displacements, low, high)
+
+        return np.round(positions, 4)
+
+    @staticmethod
+    def _get_directions(
+        offsets: np.ndarray, distances: np.ndarray, rng: np.random.Generator
+    ) -> np.ndarray:
+        """Returns the unit vectors of the offsets, coincident positions get a random direction.
+
+        Parameters:
+            offsets (np.ndarray): Array of shape (k, 2) with the offsets between two positions
+            distances (np.ndarray): Array of shape (k,) with the lengths of the offsets
+            rng (np.random.Generator): Generator for the random directions
+
+        Returns:
+            (np.ndarray): Array of shape (k, 2) with unit vectors
+        """
+        coincident = distances < 1e-9
+        if coincident.any():
+            angles = rng.uniform(0, 2 * np.pi, size=coincident.sum())
+            offsets = offsets.copy()
+            offsets[coincident] = np.column_stack([np.cos(angles), np.sin(angles)])
+            distances = np.where(coincident, 1.0, distances)
+        return offsets / distances[:, None]
+
+    @staticmethod
+    def _get_radii(
+        mujoco_objects: list[MujocoObject], validators: list[Validator]
+    ) -> np.ndarray:
+        """Returns the radii of the objects as seen by the rules of the validators. Only the
+        physics based distance rule measures between the geoms, all other rules measure
+        between the object positions.
+
+        Parameters:
+            mujoco_objects (list[MujocoObject]): To-be-placed mujoco objects
+            validators (list[Validator]): List of validators used to check object placement
+
+        Returns:
+            (np.ndarray): Array of shape (n,) with the radii of the objects
+        """
+        if not any(
+            isinstance(rule, MinDistanceMujocoPhysicsRule)
+            for validator in validators
+            for rule in validator.rules
+        ):
+            return np.zeros(len(mujoco_objects))
+        return np.array(
+            [
+                mujoco_object.collision_metadata.planar_radius
+                for mujoco_object in mujoco_objects
+            ]
+        )
+
+    @staticmethod
+    def _get_min_distance(validators: list[Validator]) -> float:
+        """Returns the largest minimal distance required by the rules of the validators.
+
+        Parameters:
+            validators (list[Validator]): List of validators used to check object placement
+
+        Returns:
+            (float): Minimal distance between objects, 0 if no rule requires one
+        """
+        return Rule.get_min_distance(
+            [rule for validator in validators for rule in validator.rules]
+        )
+
+    @staticmethod
+    def _get_obstacles(validators: list[Validator]) -> np.ndarray:
+        """Returns the shapes of all objects already tracked by the validators.
+
+        Parameters:
+            validators (list[Validator]): List of validators used to check object placement
+
+        Returns:
+            (np.ndarray): Array of shape (m,) with the shapely geometries of placed objects
+        """
+        return np.array(
+            [
+                shape
+                for validator in validators
+                for shapes in validator.map_2D.values()
+                for shape in shapes
+            ],
+            dtype=object,
+        )
@@ -28,3 +28,20 @@ class Rule(ABC):
             site (AbstractSite): AbstractSite class instance where the object is added to
         """
         pass
+
+    @staticmethod
+    def get_min_distance(rules: list["Rule"]) -> float:
+        """Returns the largest minimal distance between objects required by the rules.
+        Distance rules without a distance require none.
+
+        Parameters:
+            rules (list[Rule]): List of rules
+
+        Returns:
+            (float): Minimal distance between objects, 0 if no rule requires one
+        """
+        distances = [
+            getattr(rule, "dist", None) or getattr(rule, "distance", None) or 0
+            for rule in rules
+        ]
+        return float(max(distances, default=0))
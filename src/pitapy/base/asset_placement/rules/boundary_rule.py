@@ -7,19 +7,20 @@ from pitapy.base.asset_parsing.mujoco_object import MujocoObject
 class BoundaryRule(Rule):
     """A rule that checks if an object is within the given boundaries."""
 
-    def __init__(self, boundary: tuple):
+    def __init__(self, boundary: tuple, center: tuple = (0.0, 0.0)):
         """Constructor of the Boundary Rule.
 
         Parameters:
             boundary (tuple): A tuple of boundary values in the format (x, y)
+            center (tuple): Center of the boundary in the format (x, y)
         """
         super().__init__()
         self.boundary = Polygon(
             [
-                (-boundary[0], -boundary[1]),
-                (-boundary[0], boundary[1]),
-                (boundary[0], boundary[1]),
-                (boundary[0], -boundary[1]),
+                (center[0] - boundary[0], center[1] - boundary[1]),
+                (center[0] - boundary[0], center[1] + boundary[1]),
+                (center[0] + boundary[0], center[1] + boundary[1]),
+                (center[0] + boundary[0], center[1] - boundary[1]),
             ]
         )
 
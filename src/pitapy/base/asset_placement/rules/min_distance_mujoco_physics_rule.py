@@ -1,23 +1,61 @@
 import copy
+import logging
+import weakref
+import mujoco
 import numpy as np
+from typing import Union
 from dm_control import mjcf
 from shapely.geometry.base import BaseGeometry
 from pitapy.base.asset_placement.rules.abstract_rule import Rule
 from pitapy.base.world_sites.abstract_site import AbstractSite
 from pitapy.base.asset_parsing.mujoco_object import MujocoObject
+from pitapy.base.asset_parsing.collision_metadata import CollisionMetadata
 
 
 class MinDistanceMujocoPhysicsRule(Rule):
-    """Checks if a new object respects the minimum distance to other objects."""
+    """Checks if a new object respects the minimum distance to other objects.
 
-    def __init__(self, distance: float):
+    Only the neighborhood of the new object is compiled for a check: every placed object
+    gets a bounding sphere (computed once from its own compiled model), and only objects
+    whose sphere comes within the distance of the new object's sphere are attached to the
+    check model. The spheres of the placed objects are kept in a grid per site model, which
+    is updated with the objects attached and detached since the last check, so a check only
+    looks at the objects in the cells around the new object. The cost of a check therefore
+    depends on the local density instead of the size of the world.
+
+    Optionally, every object is replaced by a simplified collision proxy in the check model,
+    fitted once per asset to its collision metadata. Assets made of a single primitive geom
+    keep that geom. The exported world keeps the real geoms, only the check becomes coarser
+    (the proxies enclose the real geoms).
+    """
+
+    PROXIES = ["none", "hull", "box", "capsule", "sphere"]
+
+    def __init__(self, distance: float, proxy: Union[str, None] = None):
         """Constructor of the MinDistanceMujocoPhysicsRule class.
 
         Parameters:
             distance (float): Minimal distance from the new object to all existing of specified type
+            proxy (Union[str, None]): Collision proxy of the check model, one of PROXIES, "none" if None
         """
         super().__init__()
         self.distance = distance
+        self.proxy = "none" if proxy is None else proxy
+        if self.proxy not in MinDistanceMujocoPhysicsRule.PROXIES:
+            logging.getLogger().error(
+                f"Unknown collision proxy '{proxy}', expected one of {MinDistanceMujocoPhysicsRule.PROXIES}."
+            )
+            raise ValueError(
+                f"Unknown collision proxy '{proxy}', expected one of {MinDistanceMujocoPhysicsRule.PROXIES}."
+            )
+        # Bounding spheres and detached copies of the placed models, dropped together with them
+        self._spheres = weakref.WeakKeyDictionary()
+        self._copies = weakref.WeakKeyDictionary()
+        # Collision metadata of the checked models and proxies fitted to the metadata
+        self._metadata = weakref.WeakKeyDictionary()
+        self._proxies = weakref.WeakKeyDictionary()
+        # Grids of the bounding spheres of the placed objects per site model
+        self._grids = weakref.WeakKeyDictionary()
 
     def __call__(
         self,
@@ -39,35 +77,62 @@ class MinDistanceMujocoPhysicsRule(Rule):
         Returns:
             (bool): True if mujoco_object is far enough away from each object.
         """
-        mujoco_object_tmp_copy = copy.deepcopy(mujoco_object)
-        joint_list = mujoco_object_tmp_copy.mjcf_obj.worldbody.body[0].find_all(
+        if self.proxy != "none":
+            # Placed objects were checked before, their metadata is known without recomputing it
+            self._metadata[mujoco_object.mjcf_obj] = mujoco_object.collision_metadata
+
+        center, radius = self._get_bounding_sphere(mujoco_object.mjcf_obj)
+        grid = self._grids.get(site.mjcf_model)
+        if grid is None:
+            # Cells fit the first checked object and its distance
+            grid = _SphereGrid(cell_size=max(2 * radius + self.distance, 1e-3))
+            self._grids[site.mjcf_model] = grid
+        self._update_grid(grid, site.mjcf_model)
+        neighbors = grid.query(center, radius + self.distance)
+
+        # Without neighbors there is nothing the object could collide with
+        if not neighbors:
+            return True
+
+        # Infinite planes cannot be enclosed by a proxy, such checks use the real models
+        if self.proxy != "none" and all(
+            np.isfinite(self._get_metadata(model).radius)
+            for model in [mujoco_object.mjcf_obj] + [model for _, model in neighbors]
+        ):
+            return self._check_proxies(mujoco_object.mjcf_obj, neighbors)
+
+        candidate_model = copy.deepcopy(mujoco_object.mjcf_obj)
+        joint_list = candidate_model.worldbody.body[0].find_all(
             "joint", immediate_children_only=True
         )
         if joint_list:
             if joint_list[0].tag == "freejoint" or joint_list[0].type == "free":
                 joint_list[0].remove()
-                mujoco_object_tmp_copy.mjcf_obj.worldbody.body[0].add(
-                    "joint", limited="false"
-                )
-        attachement_frame = site.mjcf_model.attach(mujoco_object_tmp_copy.mjcf_obj)
+                candidate_model.worldbody.body[0].add("joint", limited="false")
+
+        # Build the check model from the new object and its neighbors only
+        check_model = mjcf.RootElement()
+        attachement_frame = check_model.attach(candidate_model)
+        neighbor_copies = [
+            self._attach_copy(check_model, frame, model) for frame, model in neighbors
+        ]
 
         # If the attached mujoco_object is a composite object,
         # we need to set the margin of each geom to the specified distance
         for geom in attachement_frame.all_children()[0].find_all("geom"):
             geom.margin = self.distance
 
-        # Create physics instance and get number of geom collisions
-        physics = mjcf.Physics.from_mjcf_model(site.mjcf_model)
-        num_contacts = physics.data.ncon
+        try:
+            # Create physics instance and get number of geom collisions
+            physics = mjcf.Physics.from_mjcf_model(check_model)
+            num_contacts = physics.data.ncon
 
-        # If there are no collisions, the object can be placed
-        if num_contacts == 0:
-            mujoco_object_tmp_copy.mjcf_obj.detach()
-            return True
+            # If there are no collisions, the object can be placed
+            if num_contacts == 0:
+                return True
 
-        # If there are collisions,
-        # we need to check if the object is colliding only with itself or with other objects
-        else:
+            # If there are collisions,
+            # we need to check if the object is colliding only with itself or with other objects
             all_ids = []
 
             # Get all ids of the geoms in the mujoco_object
@@ -87,14 +152,481 @@ class MinDistanceMujocoPhysicsRule(Rule):
                 & np.isin(physics.data.contact.geom2, all_ids)
             )
 
-            # Filter the pairs based on the mask
-            remaining_contacts1 = physics.data.contact.geom1[mask]
-            remaining_contacts2 = physics.data.contact.geom2[mask]
+            # The object can be placed if none of the remaining contacts is with another object
+            return len(physics.data.contact.geom1[mask]) == 0
+        finally:
+            # Release the cached copies of the neighbors for the next check
+            for neighbor_copy in neighbor_copies:
+                neighbor_copy.detach()
 
-            if len(remaining_contacts1) == 0:
-                mujoco_object_tmp_copy.mjcf_obj.detach()
-                return True
+    def _update_grid(self, grid: "_SphereGrid", mjcf_model: mjcf.RootElement) -> None:
+        """Adds the objects attached to a model since the last update to its grid and removes
+        the detached ones. Only the new objects get their bounding sphere computed.
 
+        Parameters:
+            grid (_SphereGrid): Grid of the bounding spheres of the objects of the model
+            mjcf_model (mjcf.RootElement): Mjcf model of the site
+        """
+        children = set(mjcf_model.worldbody.all_children())
+        for frame in grid.seen - children:
+            grid.remove(frame)
+        for frame in children - grid.seen:
+            grid.seen.add(frame)
+            if frame.tag != "body":
+                continue
+            # The children of an attachment frame belong to the attached model
+            for child in frame.all_children():
+                if child.root is not mjcf_model:
+                    center, radius = self._get_bounding_sphere(child.root)
+                    grid.add(frame, child.root, self._to_world(frame, center), radius)
+                    break
+
+    def _get_bounding_sphere(
+        self, mjcf_model: mjcf.RootElement
+    ) -> tuple[np.ndarray, float]:
+        """Returns a sphere enclosing all geoms (and their margins) of a model in its own frame.
+        The sphere is computed once per rotation of the model and moved along with its position.
+        With proxies, the sphere enclosing the proxy is used, which needs no compilation.
+
+        Parameters:
+            mjcf_model (mjcf.RootElement): Mjcf model of an object
+
+        Returns:
+            (tuple[np.ndarray, float]): Center and radius of the sphere
+        """
+        body = mjcf_model.worldbody.body[0]
+        if self.proxy != "none":
+            metadata = self._get_metadata(mjcf_model)
+            if np.isfinite(metadata.radius):
+                _, proxy_center, proxy_radius = self._fit_proxy(metadata)
+                return self._to_world(body, proxy_center), proxy_radius
+        position = np.zeros(3) if body.pos is None else np.asarray(body.pos, float)
+        rotation_key = (
+            None if body.euler is None else tuple(body.euler),
+            None if body.quat is None else tuple(body.quat),
+        )
+        cached = self._spheres.get(mjcf_model)
+        if cached is None or cached[0] != rotation_key:
+            model_copy = copy.deepcopy(mjcf_model)
+            physics = mjcf.Physics.from_mjcf_model(model_copy)
+            physics.forward()
+            geom_position = physics.data.geom_xpos
+            # Planes have no bounding radius, they are infinite
+            geom_radius = np.where(
+                physics.model.geom_type == mujoco.mjtGeom.mjGEOM_PLANE,
+                np.inf,
+                physics.model.geom_rbound,
+            )
+            geom_radius = geom_radius + physics.model.geom_margin
+            if len(geom_position) == 0:
+                center, sphere_radius = position, 0.0
             else:
-                mujoco_object_tmp_copy.mjcf_obj.detach()
-                return False
+                center = (
+                    np.min(geom_position - geom_radius[:, None], axis=0)
+                    + np.max(geom_position + geom_radius[:, None], axis=0)
+                ) / 2
+                center = np.where(np.isfinite(center), center, position)
+                sphere_radius = float(
+                    np.max(np.linalg.norm(geom_position - center, axis=1) + geom_radius)
+                )
+            cached = (rotation_key, center - position, sphere_radius)
+            self._spheres[mjcf_model] = cached
+        return position + cached[1], cached[2]
+
+    @staticmethod
+    def _to_world(frame: mjcf.Element, point: np.ndarray) -> np.ndarray:
+        """Transforms a point from the frame of an attached model to world coordinates.
+
+        Parameters:
+            frame (mjcf.Element): Attachment frame of the model
+            point (np.ndarray): Point in the frame of the attached model
+
+        Returns:
+            (np.ndarray): Point in world coordinates
+        """
+        world_point = np.zeros(3)
+        mujoco.mju_rotVecQuat(
+            world_point,
+            np.asarray(point, float),
+            MinDistanceMujocoPhysicsRule._get_quaternion(frame),
+        )
+        if frame.pos is not None:
+            world_point += np.asarray(frame.pos, float)
+        return world_point
+
+    @staticmethod
+    def _get_quaternion(element: mjcf.Element) -> np.ndarray:
+        """Returns the orientation of a body as quaternion.
+
+        Parameters:
+            element (mjcf.Element): Body or attachment frame
+
+        Returns:
+            (np.ndarray): Quaternion of the orientation
+        """
+        quaternion = np.array([1.0, 0.0, 0.0, 0.0])
+        if element.quat is not None:
+            quaternion = np.asarray(element.quat, float)
+        elif element.euler is not None:
+            mujoco.mju_euler2Quat(
+                quaternion, np.deg2rad(np.asarray(element.euler, float)), "xyz"
+            )
+        return quaternion
+
+    def _attach_copy(
+        self,
+        check_model: mjcf.RootElement,
+        frame: mjcf.Element,
+        mjcf_model: mjcf.RootElement,
+    ) -> mjcf.RootElement:
+        """Attaches a cached copy of a placed model to the check model, with the pose and
+        joints of its attachment frame.
+
+        Parameters:
+            check_model (mjcf.RootElement): Model of the check
+            frame (mjcf.Element): Attachment frame of the placed model
+            mjcf_model (mjcf.RootElement): Placed model
+
+        Returns:
+            (mjcf.RootElement): Attached copy, to be detached after the check
+        """
+        body = mjcf_model.worldbody.body[0]
+        pose_key = tuple(
+            None if value is None else tuple(value)
+            for value in (body.pos, body.euler, body.quat)
+        )
+        cached = self._copies.get(mjcf_model)
+        if cached is None or cached[0] != pose_key:
+            cached = (pose_key, copy.deepcopy(mjcf_model))
+            self._copies[mjcf_model] = cached
+        model_copy = cached[1]
+
+        copy_frame = check_model.attach(model_copy)
+        for attribute in ["pos", "euler", "quat"]:
+            if getattr(frame, attribute) is not None:
+                setattr(copy_frame, attribute, getattr(frame, attribute))
+        # Joints of the frame (e.g. moved free joints) decide whether the object is static
+        for joint in frame.find_all("joint", immediate_children_only=True):
+            copy_frame.add(
+                "joint",
+                **{
+                    key: value
+                    for key, value in joint.get_attributes().items()
+                    if key not in ["name", "dclass"]
+                },
+            )
+        return model_copy
+
+    def _check_proxies(
+        self,
+        mjcf_model: mjcf.RootElement,
+        neighbors: list[tuple[mjcf.Element, mjcf.RootElement]],
+    ) -> bool:
+        """Checks the proxy of the new object against the proxies of its neighbors. The check
+        model is written as xml directly, since it only consists of one geom per object.
+
+        Parameters:
+            mjcf_model (mjcf.RootElement): Model of the new object
+            neighbors (list[tuple[mjcf.Element, mjcf.RootElement]]): Attachment frame and model per neighbor
+
+        Returns:
+            (bool): True if the proxy of the new object has no contact with another proxy
+        """
+        meshes = {}
+        bodies = [self._get_proxy_xml(None, mjcf_model, "candidate", meshes)]
+        for index, (frame, model) in enumerate(neighbors):
+            bodies.append(
+                self._get_proxy_xml(frame, model, f"neighbor_{index}", meshes)
+            )
+        assets = "".join(
+            f'<mesh name="{name}" vertex="{self._format(vertex)}"/>'
+            for name, vertex in meshes.values()
+        )
+        model = mujoco.MjModel.from_xml_string(
+            f"<mujoco><asset>{assets}</asset><worldbody>{''.join(bodies)}</worldbody></mujoco>"
+        )
+        data = mujoco.MjData(model)
+        mujoco.mj_forward(model, data)
+
+        candidate_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_GEOM, "candidate")
+        return not np.any(
+            (data.contact.geom1 == candidate_id) | (data.contact.geom2 == candidate_id)
+        )
+
+    def _get_proxy_xml(
+        self,
+        frame: Union[mjcf.Element, None],
+        mjcf_model: mjcf.RootElement,
+        name: str,
+        meshes: dict,
+    ) -> str:
+        """Writes the body of a proxy with the pose of the model's body (and attachment frame).
+        The proxy is movable if any part of the model is, so it collides like the model itself.
+
+        Parameters:
+            frame (Union[mjcf.Element, None]): Attachment frame of a placed model, None for the new object
+            mjcf_model (mjcf.RootElement): Model of an object
+            name (str): Name of the proxy geom
+            meshes (dict): Mesh assets of the check model, extended by the mesh of the proxy
+
+        Returns:
+            (str): Xml of the proxy body
+        """
+        metadata = self._get_metadata(mjcf_model)
+        geom = dict(self._fit_proxy(metadata)[0])
+        if geom["type"] == "mesh":
+            if metadata not in meshes:
+                meshes[metadata] = (f"proxy_{len(meshes)}", geom["vertex"])
+            geom["mesh"] = meshes[metadata][0]
+            del geom["vertex"]
+        if frame is None:
+            # The new object keeps its distance through the margin of its geom
+            geom["margin"] = self.distance
+        geom_xml = "".join(
+            f' {key}="{self._format(value)}"' for key, value in geom.items()
+        )
+
+        body = mjcf_model.worldbody.body[0]
+        movable = bool(mjcf_model.find_all("joint"))
+        body_xml = (
+            f'<body pos="{self._format(body.pos if body.pos is not None else np.zeros(3))}" '
+            f'quat="{self._format(self._get_quaternion(body))}">'
+            + ("<freejoint/>" if movable and frame is None else "")
+            + ('<joint type="hinge"/>' if movable and frame is not None else "")
+            + f'<geom name="{name}"{geom_xml}/></body>'
+        )
+        if frame is None:
+            return body_xml
+        return (
+            f'<body pos="{self._format(frame.pos if frame.pos is not None else np.zeros(3))}" '
+            f'quat="{self._format(self._get_quaternion(frame))}">'
+            + (
+                "<freejoint/>"
+                if frame.find_all("joint", immediate_children_only=True)
+                else ""
+            )
+            + body_xml
+            + "</body>"
+        )
+
+    @staticmethod
+    def _format(value) -> str:
+        """Formats an attribute value for the xml of the check model.
+
+        Parameters:
+            value: String, number or array
+
+        Returns:
+            (str): Value as written in xml
+        """
+        if isinstance(value, str):
+            return value
+        return " ".join(f"{float(number):.9g}" for number in np.ravel(value))
+
+    def _get_metadata(self, mjcf_model: mjcf.RootElement) -> CollisionMetadata:
+        """Returns the collision metadata of a model.
+
+        Parameters:
+            mjcf_model (mjcf.RootElement): Model of an object
+
+        Returns:
+            (CollisionMetadata): Collision metadata of the model
+        """
+        metadata = self._metadata.get(mjcf_model)
+        if metadata is None:
+            # Objects that were not checked by this rule (e.g. borders or fixed objects)
+            metadata = CollisionMetadata.from_mjcf(
+                mjcf_model, mjcf_model.worldbody.body[0].name
+            )
+            self._metadata[mjcf_model] = metadata
+        return metadata
+
+    def _fit_proxy(self, metadata: CollisionMetadata) -> tuple[dict, np.ndarray, float]:
+        """Fits the proxy geom to the collision metadata of an asset, once per asset.
+
+        Parameters:
+            metadata (CollisionMetadata): Collision metadata of the asset
+
+        Returns:
+            (tuple[dict, np.ndarray, float]): Attributes of the proxy geom, center and radius of
+                                              a sphere enclosing it, all in the frame of the body
+        """
+        if metadata not in self._proxies:
+            lower, upper = metadata.aabb
+            center = (lower + upper) / 2
+            half_size = np.maximum((upper - lower) / 2, 1e-6)
+            proxy = self.proxy
+            # A flat or empty footprint has no volume, its bounding box is used instead
+            if proxy == "hull" and (
+                metadata.hull is None
+                or metadata.hull.area < 1e-9
+                or upper[2] - lower[2] < 1e-6
+            ):
+                proxy = "box"
+
+            if metadata.primitive is not None:
+                # A single primitive geom is as cheap as a proxy and exact
+                geom = dict(metadata.primitive)
+                center = geom["pos"]
+                radius = float(
+                    {
+                        "sphere": geom["size"][0],
+                        "capsule": np.sum(geom["size"]),
+                        "cylinder": np.linalg.norm(geom["size"]),
+                    }.get(geom["type"], np.linalg.norm(geom["size"]))
+                )
+            elif proxy == "sphere":
+                geom = {
+                    "type": "sphere",
+                    "pos": metadata.center,
+                    "size": [metadata.radius],
+                }
+                center, radius = metadata.center, metadata.radius
+            elif proxy == "box":
+                geom = {"type": "box", "pos": center, "size": half_size}
+                radius = float(np.linalg.norm(half_size))
+            elif proxy == "capsule":
+                # Capsule along the longest side of the bounding box
+                axis = int(np.argmax(half_size))
+                if axis == 2:
+                    footprint = np.asarray(metadata.hull.exterior.coords)
+                    capsule_radius = float(
+                        np.max(np.linalg.norm(footprint - center[:2], axis=1))
+                    )
+                else:
+                    capsule_radius = float(np.linalg.norm(np.delete(half_size, axis)))
+                quaternion = np.array([1.0, 0.0, 0.0, 0.0])
+                mujoco.mju_quatZ2Vec(quaternion, np.eye(3)[axis])
+                geom = {
+                    "type": "capsule",
+                    "pos": center,
+                    "quat": quaternion,
+                    "size": [max(capsule_radius, 1e-6), half_size[axis]],
+                }
+                radius = capsule_radius + half_size[axis]
+            else:
+                # Prism of the footprint between the lowest and highest point
+                footprint = np.asarray(metadata.hull.exterior.coords)[:-1]
+                vertices = np.concatenate(
+                    [
+                        np.column_stack([footprint, np.full(len(footprint), z)])
+                        for z in [lower[2], upper[2]]
+                    ]
+                )
+                geom = {"type": "mesh", "vertex": vertices.ravel()}
+                radius = float(np.max(np.linalg.norm(vertices - center, axis=1)))
+            self._proxies[metadata] = (geom, np.asarray(center, float), radius)
+        return self._proxies[metadata]
+
+
+class _SphereGrid:
+    """Uniform grid over the xy-plane of the bounding spheres of the objects of a site.
+
+    Every sphere is stored in all cells its square covers. Spheres covering too many cells
+    (borders, planes) are kept apart and returned by every query.
+    """
+
+    # Spheres with a larger radius (in cells) are not stored in the cells
+    MAX_CELL_RADIUS = 8
+
+    def __init__(self, cell_size: float):
+        """Constructor of the _SphereGrid class.
+
+        Parameters:
+            cell_size (float): Edge length of a cell
+        """
+        self.cell_size = cell_size
+        # Children of the worldbody that were already looked at, attached objects or not
+        self.seen: set = set()
+        self._cells: dict[tuple[int, int], set] = {}
+        # Attachment frame mapped to its model, sphere, cells and order of attachment
+        self._entries: dict = {}
+        self._large: set = set()
+        self._count = 0
+
+    def add(
+        self,
+        frame: mjcf.Element,
+        model: mjcf.RootElement,
+        center: np.ndarray,
+        radius: float,
+    ) -> None:
+        """Adds the bounding sphere of an attached object.
+
+        Parameters:
+            frame (mjcf.Element): Attachment frame of the object
+            model (mjcf.RootElement): Attached model of the object
+            center (np.ndarray): Center of the sphere in world coordinates
+            radius (float): Radius of the sphere
+        """
+        cells = []
+        if np.isfinite(radius) and radius <= self.MAX_CELL_RADIUS * self.cell_size:
+            cells = self._get_cells(center, radius)
+            for cell in cells:
+                self._cells.setdefault(cell, set()).add(frame)
+        else:
+            self._large.add(frame)
+        self._entries[frame] = (model, center, radius, cells, self._count)
+        self._count += 1
+
+    def remove(self, frame: mjcf.Element) -> None:
+        """Removes a detached object, or a child of the worldbody that is no object.
+
+        Parameters:
+            frame (mjcf.Element): Attachment frame of the object
+        """
+        self.seen.discard(frame)
+        entry = self._entries.pop(frame, None)
+        if entry is None:
+            return
+        self._large.discard(frame)
+        for cell in entry[3]:
+            self._cells[cell].discard(frame)
+            if not self._cells[cell]:
+                del self._cells[cell]
+
+    def query(
+        self, center: np.ndarray, reach: float
+    ) -> list[tuple[mjcf.Element, mjcf.RootElement]]:
+        """Returns the objects whose sphere comes closer than reach to a point.
+
+        Parameters:
+            center (np.ndarray): Point in world coordinates
+            reach (float): Distance to the spheres
+
+        Returns:
+            (list[tuple[mjcf.Element, mjcf.RootElement]]): Attachment frame and model per object, in the order they were attached
+        """
+        candidates = set(self._large)
+        if np.isfinite(reach):
+            for cell in self._get_cells(center, reach):
+                candidates.update(self._cells.get(cell, ()))
+        else:
+            candidates.update(self._entries)
+        entries = sorted(
+            (self._entries[frame] + (frame,) for frame in candidates),
+            key=lambda entry: entry[4],
+        )
+        return [
+            (frame, model)
+            for model, neighbor_center, neighbor_radius, _, _, frame in entries
+            if np.linalg.norm(neighbor_center - center) < reach + neighbor_radius
+        ]
+
+    def _get_cells(self, center: np.ndarray, radius: float) -> list[tuple[int, int]]:
+        """Returns the cells covered by the square around a circle.
+
+        Parameters:
+            center (np.ndarray): Center of the circle
+            radius (float): Radius of the circle
+
+        Returns:
+            (list[tuple[int, int]]): Indices of the cells
+        """
+        low = np.floor((np.asarray(center[:2]) - radius) / self.cell_size).astype(int)
+        high = np.floor((np.asarray(center[:2]) + radius) / self.cell_size).astype(int)
+        return [
+            (x, y)
+            for x in range(low[0], high[0] + 1)
+            for y in range(low[1], high[1] + 1)
+        ]
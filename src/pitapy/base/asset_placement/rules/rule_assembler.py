@@ -37,7 +37,9 @@ class RuleAssembler:
         """
         # More conditions as fitting can be added here as more rules are added
         if rule_name == "MinAllDistance":
-            return MinDistanceMujocoPhysicsRule(distance=userrule.get("distance"))
+            return MinDistanceMujocoPhysicsRule(
+                distance=userrule.get("distance"), proxy=userrule.get("proxy")
+            )
         elif rule_name == "Height":
             return HeightRule(ground_level=userrule.get("ground_level"))
         elif rule_name == "Boundary":
@@ -85,3 +85,16 @@ class Validator:
 
         else:
             self.map_2D[mujoco_object.name] = [shape_object]
+
+    def remove(self, mujoco_object: MujocoObject) -> None:
+        """Removes object from 2d representation.
+
+        Parameters:
+            mujoco_object (MujocoObject): The object that will be removed from the 2d representation
+        """
+        shape_object = geometry.Point(mujoco_object.position[:2])
+        shape_list = self.map_2D.get(mujoco_object.name, [])
+        for index, shape in enumerate(shape_list):
+            if shape.equals(shape_object):
+                del shape_list[index]
+                return
@@ -1,5 +1,6 @@
 import logging
 import numpy as np
+from typing import Union
 from dm_control import mjcf
 
 from pitapy.base.world_sites.abstract_site import AbstractSite
@@ -15,6 +16,7 @@ class Environment(AbstractSite):
         name: str = "Environment",
         pretty_mode: bool = False,
         headlight: dict = None,
+        rng: Union[np.random.Generator, None] = None,
     ):
         """Constructor of the Environment class.
 
@@ -23,8 +25,9 @@ class Environment(AbstractSite):
             name (str): Name of the environment
             pretty_style (bool): If true, the environment will be created with a pretty style
             headlight (dict): Dictionary containing parameters for the mujoco headlight
+            rng (Union[np.random.Generator, None]): Generator used to sample the size from its range
         """
-        self._size = self.calculate_size(size)
+        self._size = self.calculate_size(size, rng=rng)
         self._name = name
         self._mjcf_model = mjcf.RootElement()
 
@@ -152,16 +155,20 @@ class Environment(AbstractSite):
         mujoco_object.mjcf_obj.detach()
         del self._mujoco_objects[mujoco_object.xml_id]
 
-    def calculate_size(self, size_range: tuple) -> list:
+    def calculate_size(
+        self, size_range: tuple, rng: Union[np.random.Generator, None] = None
+    ) -> list:
         """Calculates the size of the environment with a given size_range (can be many different types).
 
         Parameters:
             size_range (tuple): Tuple defining the size range of the environment (length, width, height)
+            rng (Union[np.random.Generator, None]): Generator used to sample the size from its range
 
         Returns:
             size (list): Tuple defining the size of the entire environment
         """
         logger = logging.getLogger()
+        rng = np.random.default_rng() if rng is None else rng
 
         if size_range[0] is None:
             logger.error(
@@ -173,11 +180,7 @@ class Environment(AbstractSite):
 
         if isinstance(size_range[0][0], (float, int)):
             size = (
-                list(
-                    np.random.uniform(
-                        low=size_range[0][0], high=size_range[0][1], size=1
-                    )
-                )
+                list(rng.uniform(low=size_range[0][0], high=size_range[0][1], size=1))
                 * 2
             )
 
@@ -204,14 +207,14 @@ class Environment(AbstractSite):
             else:
                 size = []
                 size.extend(
-                    np.random.uniform(
+                    rng.uniform(
                         low=size_range_dict["length_range"][0],
                         high=size_range_dict["length_range"][1],
                         size=1,
                     )
                 )
                 size.extend(
-                    np.random.uniform(
+                    rng.uniform(
                         low=size_range_dict["width_range"][0],
                         high=size_range_dict["width_range"][1],
                         size=1,
@@ -0,0 +1,164 @@
+from dm_control import mjcf
+from pitapy.base.world_sites.environment import Environment
+from pitapy.base.world_sites.abstract_site import AbstractSite
+from pitapy.base.asset_parsing.mujoco_object import MujocoObject
+
+
+class Tile(AbstractSite):
+    """Represents a tile of an environment that is generated tile by tile. Unlike an area,
+    a tile has a mjcf model of its own, so it can be exported and dropped on its own.
+
+    Objects of neighboring tiles that are close enough to interact with the objects of the
+    tile are added as halo. They take part in all rule checks but are removed before the
+    tile is exported.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        boundary: tuple[tuple[float, float], tuple[float, float]],
+        environment: Environment,
+    ):
+        """Constructor of the Tile class.
+
+        Parameters:
+            name (str): Name of the tile, prefixes the names of all its objects
+            boundary (tuple[tuple[float, float], tuple[float, float]]): Lower left and upper right corner of the tile
+            environment (Environment): Environment class instance the tile is part of
+        """
+        self._name = name
+        self._boundary = boundary
+        self._size = (
+            (boundary[1][0] - boundary[0][0]) / 2,
+            (boundary[1][1] - boundary[0][1]) / 2,
+            0.1,
+        )
+        self._mjcf_model = mjcf.RootElement(model=name)
+        self._mujoco_objects = {}
+        self._halo: list[MujocoObject] = []
+        self.environment = environment
+
+    def add(self, mujoco_object: MujocoObject):
+        """Add object to the tile _mjcf_model and its mujoco-object dictionary.
+        Also sets the name of the object to the one given by mujoco.
+
+        Parameters:
+            mujoco_object (MujocoObject): Mujoco object to add
+        """
+        # Names of all tiles end up in one world, the name of the tile keeps them unique
+        mujoco_object.mjcf_obj.model = f"{self._name}_{mujoco_object.mjcf_obj.model}"
+
+        # The attach() method returns the attachment frame
+        # i.e., a body with the attached mujoco object
+        attachment_frame = self._mjcf_model.attach(mujoco_object.mjcf_obj)
+        # By calling all_children() on the attachment frame, we can access their unique identifier
+        mujoco_object.xml_id = attachment_frame.all_children()[0].full_identifier
+
+        # Check for free joints (<joint type="free"/> or <freejoint/> but always as a direct child)
+        # If present, remove it and add it again one level above
+        joint_list = attachment_frame.all_children()[0].find_all(
+            "joint", immediate_children_only=True
+        )
+        if joint_list:
+            if joint_list[0].tag == "freejoint" or joint_list[0].type == "free":
+                joint_attribute_dict = joint_list[0].get_attributes()
+                joint_attribute_dict.pop("type", None)  # pop type key if present
+                attachment_frame.add("joint", type="free", **joint_attribute_dict)
+                joint_list[0].remove()
+
+                # Fix rotation bug, i.e., move euler value into the parent body (attachment_frame) and reset it in the mujoco_object
+                # For the environment dynamics to work properly (adding the agent's rotation to qvel would otherwise not be possible)
+                attachment_frame.euler = mujoco_object.rotation
+                mujoco_object.rotation = (0.0, 0.0, 0.0)
+
+        self._mujoco_objects[mujoco_object.xml_id] = mujoco_object
+
+    def remove(self, mujoco_object: MujocoObject):
+        """Removes object from the tile _mjcf_model and its mujoco-object dictionary.
+
+        Parameters:
+            mujoco_object (MujocoObject): Mujoco object to remove
+        """
+        mujoco_object.mjcf_obj.detach()
+        del self._mujoco_objects[mujoco_object.xml_id]
+
+    def add_halo(self, mujoco_object: MujocoObject):
+        """Adds an object of a neighboring tile, which is checked against but not exported.
+
+        Parameters:
+            mujoco_object (MujocoObject): Mujoco object of a neighboring tile
+        """
+        self.add(mujoco_object=mujoco_object)
+        self._halo.append(mujoco_object)
+
+    def clear_halo(self):
+        """Removes all objects of neighboring tiles, leaving the objects of the tile itself."""
+        for mujoco_object in self._halo:
+            self.remove(mujoco_object=mujoco_object)
+        self._halo = []
+
+    @property
+    def name(self) -> str:
+        """Get name.
+
+        Returns:
+            name (str): Name of the tile
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        """Set name.
+
+        Parameters:
+            name (str): Name of the tile
+        """
+        self._name = name
+
+    @property
+    def size(self) -> tuple[float, float, float]:
+        """Get size.
+
+        Returns:
+            size (tuple[float, float, float]): Half extents of the tile
+        """
+        return self._size
+
+    @property
+    def center(self) -> tuple[float, float]:
+        """Get center.
+
+        Returns:
+            center (tuple[float, float]): Center of the tile, distributions are sampled around it
+        """
+        return (
+            (self._boundary[0][0] + self._boundary[1][0]) / 2,
+            (self._boundary[0][1] + self._boundary[1][1]) / 2,
+        )
+
+    @property
+    def mjcf_model(self) -> mjcf.RootElement:
+        """Get mjcf model.
+
+        Returns:
+            mjcf_model (mjcf.RootElement): Mjcf model of the tile
+        """
+        return self._mjcf_model
+
+    @property
+    def mujoco_objects(self) -> dict:
+        """Get mujoco objects.
+
+        Returns:
+            mujoco_objects (dict): Dictionary of the mujoco objects of the tile, including the halo
+        """
+        return self._mujoco_objects
+
+    @property
+    def boundary(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """Get tile boundary.
+
+        Returns:
+            boundary (tuple[tuple[float, float], tuple[float, float]]): Lower left and upper right corner
+        """
+        return self._boundary
@@ -1,21 +1,33 @@
+import json
 import logging
 import os
 import sys
-import random
 import typer
 import warnings
-import numpy as np
 from typing import Union
+import mujoco
+from dm_control import mjcf
 from importlib_resources import files
 
 # Add parent folder of builder.py to python path
 # sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pitapy.base.assembler import Assembler
+from pitapy.base.asset_placement.placer.object_placer import ObjectPlacer
+from pitapy.base.asset_placement.placement_events import PlacementEvents
+from pitapy.portfolio import Portfolio
+from pitapy.server import GenerationServer
+from pitapy.sweep import Sweep
+from pitapy.tiled_world import TiledWorld
 from pitapy.utils.json_exporter import JSONExporter
 from pitapy.utils.xml_exporter import XMLExporter
+from pitapy.utils.placement_exporter import PlacementExporter
 from pitapy.utils.config_reader import ConfigReader
 from pitapy.utils.logger import Logger
+from pitapy.utils.result_cache import ResultCache
+from pitapy.utils.world_state import WorldState
+from pitapy.utils.general_utils import Utils
+from pitapy.utils.generation_worker import GenerationWorker
 
 
 class PITA:
@@ -28,6 +40,14 @@ class PITA:
         xml_dir: Union[str, None] = None,
         export_dir: Union[str, None] = None,
         plot: Union[bool, None] = None,
+        cache_dir: Union[str, None] = None,
+        cache_size: int = 1 << 30,
+        incremental: bool = False,
+        time_budget: Union[float, None] = None,
+        portfolio: int = 1,
+        split_xml: bool = False,
+        columnar: bool = False,
+        events: Union[str, None] = None,
     ):
         """Run pitapy to create xml-file containing objects specified in config file.
         Objects are given as xml by the user.
@@ -38,9 +58,16 @@ class PITA:
             xml_dir (Union[str, None]): Folder where all xml files are located
             export_dir (Union[str, None]): Directory to export to
             plot (Union[bool, None]): True for plotting, False if not
+            cache_dir (Union[str, None]): Directory of the result cache, worlds are not cached if None
+            cache_size (int): Maximal size of the result cache in bytes
+            incremental (bool): Reuse the sites of the last run into export_dir whose config did not change
+            time_budget (Union[float, None]): Seconds for placing the world, overrides the time_budget of the config
+            portfolio (int): Number of seeds derived from random_seed that race in parallel, the first world wins
+            split_xml (bool): Export one xml file per area and one for the environment objects, included by output.xml
+            columnar (bool): Also export the placements as columnar binary file (see PlacementExporter)
+            events (Union[str, None]): Path of a jsonl file the placement events are streamed to, "-" for stdout
         """
         if config_path is None:
-            print("files: ", files("pitapy.examples.config_files"))
             config_path = files("pitapy.examples.config_files").joinpath(
                 "complex-config.yml"
             )
@@ -70,51 +97,231 @@ class PITA:
         )
         config = ConfigReader.execute(config_path=config_path)
 
-        # Set random seed
-        if (
-            random_seed is not None
-            and "random_seed" in config["Environment"]
-            and config["Environment"]["random_seed"] is not None
-        ):
-            logger.info(
-                "Two seeds were specified (call argument to PITA.run() and in level config file). Using seed from the call."
-            )
-            logger.info(f"Setting random seed to {random_seed}")
-            np.random.seed(random_seed)
-            random.seed(random_seed)
-        elif random_seed is not None:
-            np.random.seed(random_seed)
-            random.seed(random_seed)
-        elif (
-            "random_seed" in config["Environment"]
-            and config["Environment"]["random_seed"] is not None
-        ):
-            random_seed = config["Environment"]["random_seed"]
-            logger.info(f"Setting random seed to {random_seed}")
-            np.random.seed(random_seed)
-            random.seed(random_seed)
-
-        # Assemble world
-        environment, areas = Assembler(
-            config_file=config, xml_dir=xml_dir, plot=plot
-        ).assemble_world()
+        random_seed = Utils.resolve_random_seed(random_seed=random_seed, config=config)
 
         # Add output file name to export path
-        export_dir = os.path.join(export_dir, "output")
+        export_path = os.path.join(export_dir, "output")
+
+        if portfolio > 1:
+            self._run_portfolio(
+                config=config,
+                random_seed=random_seed,
+                xml_dir=xml_dir,
+                export_path=export_path,
+                time_budget=time_budget,
+                attempts=portfolio,
+            )
+            if (
+                plot
+                or incremental
+                or split_xml
+                or columnar
+                or events is not None
+                or cache_dir is not None
+            ):
+                logger.warning(
+                    "Portfolio runs are neither plotted, cached, split, columnar, streamed "
+                    "nor incremental."
+                )
+            logger.info("Done.")
+            return
+
+        # Worlds without seed are not reproducible and therefore never cached
+        cache, cache_key = None, None
+        # A cached world is copied without placing it, so it streams no events
+        if (split_xml or columnar or events is not None) and cache_dir is not None:
+            logger.warning("Split, columnar and streamed exports are not cached.")
+        elif cache_dir is not None and random_seed is not None and not plot:
+            cache = ResultCache(cache_dir=cache_dir, max_size=cache_size)
+            cache_key = ResultCache.get_key(
+                config=config,
+                random_seed=random_seed,
+                xml_dir=xml_dir,
+                cache_dir=cache_dir,
+            )
+            if cache.get(key=cache_key, export_path=export_path):
+                logger.info(f"Loaded world '{cache_key}' from cache.")
+                logger.info("Done.")
+                return
+
+        # Restore the unchanged sites of the last run, this requires a reproducible seed
+        site_hashes, previous_placements = None, None
+        if incremental and random_seed is None:
+            logger.warning("Incremental runs need a seed, generating the whole world.")
+        elif incremental:
+            site_hashes = WorldState.get_site_hashes(
+                config=config, random_seed=random_seed, xml_dir=xml_dir
+            )
+            previous_placements = WorldState.get_reusable_placements(
+                export_path=export_path, site_hashes=site_hashes
+            )
+
+        # Assemble world, all random draws are taken from streams derived from the seed
+        assembler = Assembler(config_file=config, xml_dir=xml_dir, plot=plot)
+        placement_events = None if events is None else PlacementEvents(path=events)
+        try:
+            environment, areas = assembler.assemble_world(
+                random_seed=random_seed,
+                previous_placements=previous_placements,
+                time_budget=time_budget,
+                events=placement_events,
+            )
+        finally:
+            if placement_events is not None:
+                placement_events.close()
+        # Partial worlds depend on timing, they are neither cached nor reused
+        is_partial = bool(assembler.incomplete_placements)
+
         # Export to xml and json
-        XMLExporter.to_xml(
-            xml_string=environment.mjcf_model.to_xml_string(),
-            export_path=export_dir,
-        )
+        if split_xml:
+            XMLExporter.to_split_xml(
+                xml_string=environment.mjcf_model.to_xml_string(),
+                export_path=export_path,
+                environment=environment,
+                areas=areas,
+            )
+        else:
+            XMLExporter.to_xml(
+                xml_string=environment.mjcf_model.to_xml_string(),
+                export_path=export_path,
+            )
         JSONExporter.export(
-            export_path=export_dir,
+            export_path=export_path,
             config=config,
             environment=environment,
             areas=areas,
+            incomplete_placements=assembler.incomplete_placements,
         )
+        if columnar:
+            placements, tables = PlacementExporter.to_columns(
+                environment=environment, areas=areas
+            )
+            PlacementExporter.export(
+                export_path=export_path, placements=placements, tables=tables
+            )
+        if is_partial:
+            logger.warning(
+                f"Time budget ran out, exported a partial world missing objects of "
+                f"{len(assembler.incomplete_placements)} object type(s)."
+            )
+        elif site_hashes is not None:
+            WorldState.export(
+                export_path=export_path,
+                site_hashes=site_hashes,
+                placements=ObjectPlacer.get_state(assembler.placements),
+            )
+        if cache is not None and not is_partial:
+            cache.put(key=cache_key, export_path=export_path)
         logger.info("Done.")
 
+    @staticmethod
+    def _run_portfolio(
+        config: dict,
+        random_seed: Union[int, None],
+        xml_dir: str,
+        export_path: str,
+        time_budget: Union[float, None],
+        attempts: int,
+    ) -> None:
+        """Races several seeds on worker processes and exports the world of the first success.
+        The winning seed is logged and recorded in the json under "portfolio".
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            random_seed (Union[int, None]): Root seed the seeds of the attempts are derived from
+            xml_dir (str): Folder where all xml files are located
+            export_path (str): Path of the files to be exported, without file extension
+            time_budget (Union[float, None]): Seconds for placing the world of each attempt
+            attempts (int): Number of attempts
+        """
+        if time_budget is not None:
+            config = {
+                **config,
+                "Environment": {**config["Environment"], "time_budget": time_budget},
+            }
+        world = Portfolio(
+            config=config, attempts=attempts, xml_dir=str(xml_dir)
+        ).generate(random_seed=random_seed)
+        logging.getLogger().info(
+            f"Portfolio won with seed '{world['random_seed']}', "
+            f"run again with this seed to reproduce the world."
+        )
+        with open(export_path + ".xml", "w") as file:
+            file.write(world["xml"])
+        with open(export_path + ".json", "w") as file:
+            json.dump(world["placements"], file, indent=4)
+
+    def generate(
+        self,
+        config: Union[str, dict, None] = None,
+        random_seed: Union[int, None] = None,
+        xml_dir: Union[str, None] = None,
+        overrides: Union[dict, None] = None,
+    ) -> tuple[mjcf.RootElement, dict]:
+        """Generate a world in memory without touching the disk: no log file, xml or json is written.
+        Parsed configs and blueprints are cached, so repeated calls only pay for the placement.
+
+        Parameters:
+            config (Union[str, dict, None]): Path to the yaml file or the config itself
+            random_seed (Union[int, None]): Seed for reproducibility
+            xml_dir (Union[str, None]): Folder where all xml files are located
+            overrides (Union[dict, None]): Dotted config paths mapped to new values
+
+        Returns:
+            (tuple[mjcf.RootElement, dict]): Mjcf model of the world and the placements as exported to json
+        """
+        if config is None:
+            config = files("pitapy.examples.config_files").joinpath(
+                "complex-config.yml"
+            )
+            warnings.warn(
+                "config not specified; running with default config in examples"
+            )
+        config = GenerationWorker.load_config(config=config, overrides=overrides)
+        random_seed = Utils.resolve_random_seed(random_seed=random_seed, config=config)
+        environment, areas = GenerationWorker.assemble(
+            config=config, random_seed=random_seed, xml_dir=xml_dir
+        )
+        assembler = GenerationWorker.get_assembler(
+            config=config, xml_dir=GenerationWorker.get_xml_dir(xml_dir)
+        )
+        placements = JSONExporter.to_dict(
+            config=config,
+            environment=environment,
+            areas=areas,
+            incomplete_placements=assembler.incomplete_placements,
+        )
+        return environment.mjcf_model, placements
+
+    def generate_model(
+        self,
+        config: Union[str, dict, None] = None,
+        random_seed: Union[int, None] = None,
+        xml_dir: Union[str, None] = None,
+        overrides: Union[dict, None] = None,
+    ) -> tuple[mujoco.MjModel, dict]:
+        """Generate a world in memory and compile it to a mujoco model.
+
+        Parameters:
+            config (Union[str, dict, None]): Path to the yaml file or the config itself
+            random_seed (Union[int, None]): Seed for reproducibility
+            xml_dir (Union[str, None]): Folder where all xml files are located
+            overrides (Union[dict, None]): Dotted config paths mapped to new values
+
+        Returns:
+            (tuple[mujoco.MjModel, dict]): Compiled model of the world and the placements as exported to json
+        """
+        mjcf_model, placements = self.generate(
+            config=config, random_seed=random_seed, xml_dir=xml_dir, overrides=overrides
+        )
+        physics = mjcf.Physics.from_mjcf_model(mjcf_model)
+        return physics.model.ptr, placements
+
+
+app = typer.Typer()
 
+
+@app.command("run")
 def main(
     random_seed: int = typer.Option(default=None, help="Pass seed."),
     config_path: str = typer.Option(
@@ -128,6 +335,32 @@ def main(
         default="export", help="Specify path to output directory."
     ),
     plot: bool = typer.Option(default=False, help="Set to True to enable plots."),
+    cache_dir: str = typer.Option(
+        default=None, help="Specify path to a cache of generated worlds."
+    ),
+    cache_size: int = typer.Option(
+        default=1 << 30, help="Maximal size of the cache in bytes."
+    ),
+    incremental: bool = typer.Option(
+        default=False,
+        help="Only regenerate sites whose config changed since the last run.",
+    ),
+    time_budget: float = typer.Option(
+        default=None, help="Seconds for placing the world, overrides the config."
+    ),
+    portfolio: int = typer.Option(
+        default=1, help="Number of derived seeds racing in parallel."
+    ),
+    split_xml: bool = typer.Option(
+        default=False, help="Export one include file per area and for the environment."
+    ),
+    columnar: bool = typer.Option(
+        default=False, help="Also export the placements as columnar .npy file."
+    ),
+    events: str = typer.Option(
+        default=None,
+        help="Stream placement events as json lines to a file, '-' for stdout.",
+    ),
 ):
     PITA().run(
         random_seed=random_seed,
@@ -135,8 +368,114 @@ def main(
         xml_dir=xml_dir,
         export_dir=export_dir,
         plot=plot,
+        cache_dir=cache_dir,
+        cache_size=cache_size,
+        incremental=incremental,
+        time_budget=time_budget,
+        portfolio=portfolio,
+        split_xml=split_xml,
+        columnar=columnar,
+        events=events,
     )
 
 
+@app.command("serve")
+def serve(
+    host: str = typer.Option(default="127.0.0.1", help="Host to listen on."),
+    port: int = typer.Option(default=8765, help="Port to listen on."),
+    socket_path: str = typer.Option(
+        default=None, help="Listen on this unix socket instead of host and port."
+    ),
+    workers: int = typer.Option(default=1, help="Number of worker processes."),
+    queue_size: int = typer.Option(
+        default=16, help="Number of requests that may wait for a worker."
+    ),
+    config_path: str = typer.Option(
+        default=None, help="Config to load into every worker on start."
+    ),
+    xml_dir: str = typer.Option(
+        default=None, help="Default path to xml files for requests without one."
+    ),
+):
+    logging.basicConfig(level=logging.INFO)
+    GenerationServer(
+        host=host,
+        port=port,
+        socket_path=socket_path,
+        workers=workers,
+        queue_size=queue_size,
+        config_path=config_path,
+        xml_dir=xml_dir,
+    ).serve_forever()
+
+
+@app.command("sweep")
+def sweep(
+    sweep_path: str = typer.Option(
+        ..., help="Specify path to the sweep yml with grid, variants and seeds."
+    ),
+    config_path: str = typer.Option(
+        default="complex-config.yml", help="Specify path to the base config yml."
+    ),
+    xml_dir: str = typer.Option(
+        default="examples/xml_objects", help="Specify path to xml files."
+    ),
+    export_dir: str = typer.Option(
+        default="export", help="Specify path to output directory."
+    ),
+    workers: int = typer.Option(default=1, help="Number of worker processes."),
+    resume: bool = typer.Option(
+        default=True, help="Skip worlds finished by a previous run of the sweep."
+    ),
+    columnar: bool = typer.Option(
+        default=False, help="Also export the placements as columnar .npy files."
+    ),
+    dataset: bool = typer.Option(
+        default=False, help="Append all worlds to one dataset instead of directories."
+    ),
+    compression: str = typer.Option(
+        default=None, help="Compress xml and json outputs with 'gzip' or 'zstd'."
+    ),
+):
+    Logger.initialize_logger(export_dir=export_dir)
+    Sweep.from_file(
+        sweep_path=sweep_path,
+        config_path=config_path,
+        workers=workers,
+        xml_dir=xml_dir,
+        columnar=columnar,
+        dataset=dataset,
+        compression=compression,
+    ).run(export_dir=export_dir, resume=resume)
+
+
+@app.command("tiled")
+def tiled(
+    tiles: int = typer.Option(
+        ..., help="Number of tiles the environment is split into."
+    ),
+    halo: float = typer.Option(
+        default=None, help="Distance up to which objects of other tiles are checked."
+    ),
+    random_seed: int = typer.Option(default=None, help="Pass seed."),
+    config_path: str = typer.Option(
+        default="tiled-config.yml", help="Specify path to config yml without areas."
+    ),
+    xml_dir: str = typer.Option(
+        default="examples/xml_objects", help="Specify path to xml files."
+    ),
+    export_dir: str = typer.Option(
+        default="export", help="Specify path to output directory."
+    ),
+    columnar: bool = typer.Option(
+        default=False, help="Also export the placements of every tile as .npy file."
+    ),
+):
+    Logger.initialize_logger(export_dir=export_dir)
+    TiledWorld(
+        config=config_path, tiles=tiles, halo=halo, xml_dir=xml_dir, columnar=columnar
+    ).generate(export_dir=export_dir, random_seed=random_seed)
+
+
 if __name__ == "__main__":
-    typer.run(main)
+    app()
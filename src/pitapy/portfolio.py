@@ -0,0 +1,160 @@
+import logging
+import multiprocessing
+import numpy as np
+from typing import Any, Union
+
+from pitapy.utils.general_utils import Utils
+from pitapy.utils.generation_worker import GenerationWorker
+
+
+class Portfolio:
+    """Races several placement attempts with derived seeds and keeps the first world that succeeds.
+
+    Near its capacity, the placement time of a config varies strongly between seeds and some
+    seeds fail altogether. A portfolio starts one attempt per derived seed on a pool of worker
+    processes, takes the first world that is placed within all rules and terminates the
+    remaining attempts. Partial worlds, whose time budget ran out, count as failed attempts.
+    The winning seed is recorded, generating the config with it again reproduces the world.
+
+    Example:
+        world = Portfolio(config="config.yml", attempts=4).generate(random_seed=7)
+        print(world["random_seed"])
+    """
+
+    def __init__(
+        self,
+        config: Union[str, dict],
+        attempts: int = 4,
+        workers: Union[int, None] = None,
+        overrides: Union[dict[str, Any], None] = None,
+        xml_dir: Union[str, None] = None,
+    ):
+        """Constructor of the Portfolio class.
+
+        Parameters:
+            config (Union[str, dict]): Path to the yaml config or the config itself
+            attempts (int): Number of attempts, each with its own seed
+            workers (Union[int, None]): Number of worker processes, one per attempt if None
+            overrides (Union[dict[str, Any], None]): Dotted config paths mapped to new values
+            xml_dir (Union[str, None]): Folder where all xml files are located
+        """
+        workers = attempts if workers is None else workers
+        if attempts < 1 or workers < 1:
+            logging.getLogger().error(
+                f"Invalid portfolio with attempts={attempts} and workers={workers}."
+            )
+            raise ValueError("attempts and workers must be at least 1.")
+        self.config = config
+        self.attempts = attempts
+        self.workers = min(workers, attempts)
+        self.overrides = overrides
+        self.xml_dir = xml_dir
+
+    @staticmethod
+    def derive_seeds(random_seed: Union[int, None], attempts: int) -> list[int]:
+        """Returns the seeds of the attempts. The first attempt uses the given seed itself, so a
+        portfolio of one attempt generates the same world as a single run.
+
+        Parameters:
+            random_seed (Union[int, None]): Root seed, fresh entropy is drawn from the OS if None
+            attempts (int): Number of attempts
+
+        Returns:
+            (list[int]): One seed per attempt
+        """
+        seed_sequence = np.random.SeedSequence(random_seed)
+        seeds = [
+            int(child.generate_state(1)[0]) for child in seed_sequence.spawn(attempts)
+        ]
+        if random_seed is not None:
+            seeds[0] = int(random_seed)
+        return seeds
+
+    def generate(self, random_seed: Union[int, None] = None) -> dict:
+        """Generates the world of the attempt that succeeds first.
+
+        Parameters:
+            random_seed (Union[int, None]): Root seed of the attempts, falls back to the seed of the config
+
+        Returns:
+            (dict): Winning "random_seed", cleaned "xml" string and "placements" as exported to json,
+                    the placements record the portfolio under "portfolio"
+
+        Raises:
+            RuntimeError: If all attempts fail
+        """
+        logger = logging.getLogger()
+        config = GenerationWorker.load_config(
+            config=self.config, overrides=self.overrides
+        )
+        random_seed = Utils.resolve_random_seed(random_seed=random_seed, config=config)
+        seeds = Portfolio.derive_seeds(random_seed, self.attempts)
+        logger.info(
+            f"Racing {self.attempts} attempt(s) with {self.workers} worker(s), seeds {seeds}"
+        )
+
+        errors = []
+        pool = multiprocessing.get_context("spawn").Pool(
+            processes=self.workers,
+            initializer=GenerationWorker.warm_up,
+            initargs=(
+                self.config if isinstance(self.config, str) else None,
+                self.xml_dir,
+            ),
+        )
+        try:
+            for world in pool.imap_unordered(
+                Portfolio._attempt,
+                [(config, seed, self.xml_dir) for seed in seeds],
+            ):
+                if "error" in world:
+                    logger.warning(
+                        f"Attempt with seed '{world['random_seed']}' failed: {world['error']}"
+                    )
+                    errors.append(world["error"])
+                    continue
+                # A partial world (on_time_budget: partial) is not placed within all rules
+                if "incomplete" in world["placements"]:
+                    error = (
+                        f"Time budget ran out, missing objects of "
+                        f"{len(world['placements']['incomplete'])} object type(s)"
+                    )
+                    logger.warning(
+                        f"Attempt with seed '{world['random_seed']}' failed: {error}"
+                    )
+                    errors.append(error)
+                    continue
+                logger.info(f"Attempt with seed '{world['random_seed']}' won")
+                world["placements"]["portfolio"] = {
+                    "random_seed": world["random_seed"],
+                    "root_seed": random_seed,
+                    "attempts": self.attempts,
+                }
+                return world
+        finally:
+            # Stops the attempts that are still running
+            pool.terminate()
+            pool.join()
+
+        logger.error(f"All {self.attempts} attempt(s) failed.")
+        raise RuntimeError(
+            f"All {self.attempts} attempt(s) failed, last error: {errors[-1]}"
+        )
+
+    @staticmethod
+    def _attempt(job: tuple[dict, int, Union[str, None]]) -> dict:
+        """Generates the world of one attempt in a worker process.
+
+        Parameters:
+            job (tuple[dict, int, Union[str, None]]): Config (with overrides applied), seed and xml directory
+
+        Returns:
+            (dict): World as returned by GenerationWorker.generate, or its "random_seed" and "error"
+        """
+        config, random_seed, xml_dir = job
+        try:
+            return GenerationWorker.generate(
+                config=config, random_seed=random_seed, xml_dir=xml_dir
+            )
+        except RuntimeError as e:
+            return {"random_seed": random_seed, "error": str(e)}
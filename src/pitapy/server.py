@@ -0,0 +1,236 @@
+import os
+import json
+import logging
+import threading
+import socketserver
+import multiprocessing
+import multiprocessing.synchronize
+from typing import Union
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pitapy.utils.generation_worker import GenerationWorker
+
+
+class _ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    """HTTP server listening on a Unix domain socket."""
+
+    daemon_threads = True
+
+
+class _GenerationRequestHandler(BaseHTTPRequestHandler):
+    """Handles the http requests of the generation server.
+
+    POST /generate with a json body
+        {"config_path": str or "config": dict, "random_seed": int, "overrides": dict, "xml_dir": str}
+    responds with {"random_seed": int, "xml": str, "placements": dict}.
+    GET /health responds with the number of pending requests.
+    """
+
+    server_version = "PITA"
+
+    def do_GET(self) -> None:
+        """Handles health checks."""
+        if self.path != "/health":
+            self._send_json(404, {"error": f"Unknown path '{self.path}'."})
+            return
+        self._send_json(
+            200, {"status": "ok", "pending": self.server.generation_server.pending}
+        )
+
+    def do_POST(self) -> None:
+        """Handles generation requests."""
+        if self.path != "/generate":
+            self._send_json(404, {"error": f"Unknown path '{self.path}'."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid request: {e}"})
+            return
+
+        status, response = self.server.generation_server.handle(request)
+        self._send_json(status, response)
+
+    def _send_json(self, status: int, body: dict) -> None:
+        """Sends a json response.
+
+        Parameters:
+            status (int): Http status code
+            body (dict): Response body
+        """
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        """Routes request logs to the logger (the client address is empty for unix sockets)."""
+        logging.getLogger().info(format % args)
+
+
+class GenerationServer:
+    """Long-lived server that generates worlds on request. Parsed configs, blueprints and
+    user rules stay warm in a bounded pool of worker processes, so a request only pays for
+    the placement itself.
+    """
+
+    # Barrier the workers of the pool start at, set in every worker process
+    _start_barrier = None
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        socket_path: Union[str, None] = None,
+        workers: int = 1,
+        queue_size: int = 16,
+        config_path: Union[str, None] = None,
+        xml_dir: Union[str, None] = None,
+    ):
+        """Constructor of the GenerationServer class.
+
+        Parameters:
+            host (str): Host to listen on, ignored if socket_path is given
+            port (int): Port to listen on, ignored if socket_path is given
+            socket_path (Union[str, None]): Path of a Unix domain socket to listen on instead of tcp
+            workers (int): Number of worker processes
+            queue_size (int): Number of requests that may wait for a worker, further requests are rejected
+            config_path (Union[str, None]): Config to load into every worker on start
+            xml_dir (Union[str, None]): Default folder of the xml files, if a request does not give one
+        """
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.xml_dir = xml_dir
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        context = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=GenerationServer._init_worker,
+            initargs=(context.Barrier(workers), config_path, xml_dir),
+        )
+
+    @property
+    def pending(self) -> int:
+        """Get number of pending requests.
+
+        Returns:
+            pending (int): Number of requests being generated or waiting for a worker
+        """
+        return self._pending
+
+    def handle(self, request: dict) -> tuple[int, dict]:
+        """Generates the world of a request on the worker pool.
+
+        Parameters:
+            request (dict): Decoded json body of the request
+
+        Returns:
+            (tuple[int, dict]): Http status code and response body
+        """
+        logger = logging.getLogger()
+        config = request.get("config", request.get("config_path"))
+        if config is None:
+            return 400, {"error": "Either 'config' or 'config_path' is required."}
+
+        if not self._slots.acquire(blocking=False):
+            return 503, {"error": "Request queue is full."}
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(
+                GenerationWorker.generate,
+                config=config,
+                random_seed=request.get("random_seed"),
+                overrides=request.get("overrides"),
+                xml_dir=request.get("xml_dir", self.xml_dir),
+            )
+            return 200, future.result()
+        except (ValueError, KeyError) as e:
+            logger.error(f"Invalid generation request: {e}")
+            return 400, {"error": str(e)}
+        except Exception as e:
+            logger.error(f"Generation failed: {e}")
+            return 500, {"error": str(e)}
+        finally:
+            with self._pending_lock:
+                self._pending -= 1
+            self._slots.release()
+
+    def start_workers(self) -> set[int]:
+        """Starts all worker processes and waits until they are warmed up. The pool starts its
+        workers lazily, so without this the first requests pay for the cold start.
+
+        Returns:
+            (set[int]): Process ids of the workers
+        """
+        logging.getLogger().info(f"Starting {self.workers} worker(s)..")
+        futures = [
+            self._executor.submit(GenerationServer._wait_for_workers)
+            for _ in range(self.workers)
+        ]
+        return {future.result() for future in futures}
+
+    @staticmethod
+    def _init_worker(
+        barrier: multiprocessing.synchronize.Barrier,
+        config_path: Union[str, None],
+        xml_dir: Union[str, None],
+    ) -> None:
+        """Warms up a worker process and keeps the barrier the workers start at.
+
+        Parameters:
+            barrier (multiprocessing.synchronize.Barrier): Barrier with one party per worker
+            config_path (Union[str, None]): Config to load into the worker, nothing is loaded if None
+            xml_dir (Union[str, None]): Folder where all xml files are located
+        """
+        GenerationServer._start_barrier = barrier
+        GenerationWorker.warm_up(config_path, xml_dir)
+
+    @staticmethod
+    def _wait_for_workers() -> int:
+        """Blocks until every worker of the pool runs this job, so each worker takes one.
+
+        Returns:
+            (int): Process id of the worker
+        """
+        GenerationServer._start_barrier.wait()
+        return os.getpid()
+
+    def serve_forever(self) -> None:
+        """Starts the workers, then listens and handles requests until interrupted."""
+        logger = logging.getLogger()
+        self.start_workers()
+        if self.socket_path is not None:
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            server = _ThreadingUnixHTTPServer(
+                self.socket_path, _GenerationRequestHandler
+            )
+            logger.info(f"Serving PITA on unix socket '{self.socket_path}'")
+        else:
+            server = ThreadingHTTPServer(
+                (self.host, self.port), _GenerationRequestHandler
+            )
+            logger.info(f"Serving PITA on http://{self.host}:{self.port}")
+        server.generation_server = self
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down..")
+        finally:
+            server.server_close()
+            self._executor.shutdown(cancel_futures=True)
+            if self.socket_path is not None and os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
@@ -0,0 +1,380 @@
+import os
+import json
+import logging
+import itertools
+import multiprocessing
+from tqdm import tqdm
+from typing import Any, Iterable, Union
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from pitapy.utils.general_utils import Utils
+from pitapy.utils.config_reader import ConfigReader
+from pitapy.utils.build_manifest import BuildManifest
+from pitapy.utils.result_cache import ResultCache
+from pitapy.utils.generation_worker import GenerationWorker
+from pitapy.utils.placement_exporter import PlacementExporter
+from pitapy.utils.world_dataset import WorldDataset
+from pitapy.utils.export_writer import ExportWriter
+
+
+class Sweep:
+    """Generates a dataset of worlds for every combination of config overrides and seeds.
+
+    The overrides map dotted config paths to new values (see ConfigReader.apply_overrides).
+    A grid maps every path to a list of values and is expanded to all combinations,
+    variants are explicit override dictionaries. If both are given, every variant is
+    combined with every grid point. All variants and seeds are generated on one pool of
+    worker processes, so the base config is parsed and the blueprints are loaded once per
+    worker for the whole sweep.
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        grid: Union[dict[str, list], None] = None,
+        variants: Union[list[dict[str, Any]], None] = None,
+        seeds: Iterable[int] = (0,),
+        workers: int = 1,
+        xml_dir: Union[str, None] = None,
+        columnar: bool = False,
+        dataset: bool = False,
+        compression: Union[str, None] = None,
+    ):
+        """Constructor of the Sweep class.
+
+        Parameters:
+            config_path (str): Path to the base yaml config
+            grid (Union[dict[str, list], None]): Dotted config paths mapped to lists of values
+            variants (Union[list[dict[str, Any]], None]): List of override dictionaries
+            seeds (Iterable[int]): Seeds generated for every variant
+            workers (int): Number of worker processes
+            xml_dir (Union[str, None]): Folder where all xml files are located
+            columnar (bool): Also export the placements of every world as columnar binary file
+            dataset (bool): Append all worlds to one WorldDataset instead of a directory per world
+            compression (Union[str, None]): Compress the xml and json of every world with "gzip" or "zstd"
+        """
+        self.config_path = str(config_path)
+        self.overrides = Sweep.expand(grid=grid, variants=variants)
+        self.seeds = [int(seed) for seed in seeds]
+        self.workers = workers
+        self.xml_dir = xml_dir
+        self.columnar = columnar
+        self.dataset = dataset
+        self.compression = compression
+
+    @staticmethod
+    def from_file(
+        sweep_path: str,
+        config_path: str,
+        workers: int = 1,
+        xml_dir: Union[str, None] = None,
+        columnar: bool = False,
+        dataset: bool = False,
+        compression: Union[str, None] = None,
+    ) -> "Sweep":
+        """Creates a sweep from a yaml file with the keys "grid", "variants" and "seeds".
+
+        Parameters:
+            sweep_path (str): Path to the yaml file of the sweep
+            config_path (str): Path to the base yaml config
+            workers (int): Number of worker processes
+            xml_dir (Union[str, None]): Folder where all xml files are located
+            columnar (bool): Also export the placements of every world as columnar binary file
+            dataset (bool): Append all worlds to one WorldDataset instead of a directory per world
+            compression (Union[str, None]): Compress the xml and json of every world with "gzip" or "zstd"
+
+        Returns:
+            (Sweep): Sweep over the given overrides and seeds
+        """
+        sweep_config = ConfigReader.execute(config_path=sweep_path) or {}
+        return Sweep(
+            config_path=config_path,
+            grid=sweep_config.get("grid"),
+            variants=sweep_config.get("variants"),
+            seeds=sweep_config.get("seeds", [0]),
+            workers=workers,
+            xml_dir=xml_dir,
+            columnar=columnar,
+            dataset=dataset,
+            compression=compression,
+        )
+
+    @staticmethod
+    def expand(
+        grid: Union[dict[str, list], None] = None,
+        variants: Union[list[dict[str, Any]], None] = None,
+    ) -> list[dict[str, Any]]:
+        """Expands a grid and a list of variants to all override combinations.
+
+        Parameters:
+            grid (Union[dict[str, list], None]): Dotted config paths mapped to lists of values
+            variants (Union[list[dict[str, Any]], None]): List of override dictionaries
+
+        Returns:
+            overrides (list[dict[str, Any]]): One override dictionary per sweep point
+        """
+        logger = logging.getLogger()
+        grid = grid or {}
+        for path, values in grid.items():
+            if not isinstance(values, list) or not values:
+                logger.error(f"Grid values of '{path}' are not a non-empty list.")
+                raise ValueError(f"Grid values of '{path}' must be a non-empty list.")
+
+        grid_points = [
+            dict(zip(grid.keys(), values))
+            for values in itertools.product(*grid.values())
+        ]
+        return [
+            {**variant, **grid_point}
+            for variant in (variants or [{}])
+            for grid_point in grid_points
+        ]
+
+    def run(self, export_dir: str, resume: bool = True) -> None:
+        """Generates all variants and seeds and exports every world to
+        '<export_dir>/variant_<index>/seed_<seed>/output.xml' and '.json'. The overrides of
+        every variant are written to '<export_dir>/sweep.json'.
+
+        Finished worlds are recorded in '<export_dir>/manifest.jsonl' by their export path
+        with the hashes of their config and the asset files and their seed. When resuming,
+        worlds whose export path holds outputs of the same config, assets and seed with the
+        recorded hashes are skipped, all others are generated again.
+
+        With dataset, all worlds are appended to the WorldDataset '<export_dir>/dataset'
+        instead, which also records them by the hashes of their config and the asset files and
+        their seed.
+
+        Only a few worlds per worker are submitted at a time and every world is dropped once
+        it is handed to the ExportWriter thread, so the memory of a sweep does not grow with
+        its number of worlds. The writer exports while the next worlds are collected from the
+        workers. With compression, the xml and json get the extension '.gz' or '.zst'.
+
+        A world that fails (e.g. since its objects could not be placed) is logged and does not
+        stop the sweep. All other worlds are exported and recorded, the failed ones are
+        reported by a RuntimeError at the end and generated again when resuming.
+
+        Parameters:
+            export_dir (str): Directory to export to
+            resume (bool): Skip the worlds finished by a previous run into the same directory
+        """
+        logger = logging.getLogger()
+        if self.compression is not None:
+            # Fails on an unknown compression or a missing package before any world is generated
+            ExportWriter.compress(b"", self.compression)
+            if self.dataset:
+                logger.warning("Worlds of a dataset are not compressed.")
+        os.makedirs(export_dir, exist_ok=True)
+        BuildManifest.write_atomic(
+            os.path.join(export_dir, "sweep.json"),
+            json.dumps(
+                {
+                    "config_path": self.config_path,
+                    "seeds": self.seeds,
+                    "variants": self.overrides,
+                },
+                indent=4,
+                default=str,
+            ),
+        )
+        # A dataset records its worlds itself, a directory per world needs the manifest
+        dataset, manifest = None, None
+        if self.dataset:
+            dataset = WorldDataset(
+                os.path.join(export_dir, "dataset"), mode="a" if resume else "w"
+            )
+        else:
+            manifest_path = os.path.join(export_dir, "manifest.jsonl")
+            if not resume and os.path.isfile(manifest_path):
+                os.remove(manifest_path)
+            manifest = BuildManifest(manifest_path)
+
+        # Changed asset files invalidate all recorded worlds
+        asset_hash = ResultCache.hash_assets(GenerationWorker.get_xml_dir(self.xml_dir))
+        jobs = []
+        for variant_index, overrides in enumerate(self.overrides):
+            config_hash = Utils.hash_config(
+                GenerationWorker.load_config(
+                    config=self.config_path, overrides=overrides
+                )
+            )
+            for random_seed in self.seeds:
+                if dataset is not None:
+                    is_complete = dataset.contains(
+                        config_hash, random_seed, asset_hash=asset_hash
+                    )
+                else:
+                    is_complete = manifest.is_complete(
+                        export_path=self.get_export_path(
+                            export_dir, variant_index, random_seed
+                        ),
+                        config_hash=config_hash,
+                        asset_hash=asset_hash,
+                        random_seed=random_seed,
+                    )
+                if not is_complete:
+                    jobs.append((variant_index, overrides, config_hash, random_seed))
+        logger.info(
+            f"Sweeping {len(self.overrides)} variant(s) x {len(self.seeds)} seed(s) "
+            f"with {self.workers} worker(s), {len(jobs)} world(s) left to generate"
+        )
+        if not jobs:
+            return
+
+        with ExportWriter() as writer, ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=GenerationWorker.warm_up,
+            initargs=(self.config_path, self.xml_dir),
+        ) as executor:
+            # Few jobs are submitted ahead, so finished worlds do not pile up in memory
+            max_pending = 2 * self.workers
+            remaining_jobs = iter(jobs)
+            pending = {}
+            failures = []
+            with tqdm(total=len(jobs)) as progress:
+                while True:
+                    while len(pending) < max_pending:
+                        job = next(remaining_jobs, None)
+                        if job is None:
+                            break
+                        variant_index, overrides, config_hash, random_seed = job
+                        future = executor.submit(
+                            GenerationWorker.generate,
+                            config=self.config_path,
+                            random_seed=random_seed,
+                            overrides=overrides,
+                            xml_dir=self.xml_dir,
+                            columnar=self.columnar or self.dataset,
+                        )
+                        pending[future] = (variant_index, config_hash, random_seed)
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        variant_index, config_hash, random_seed = pending.pop(future)
+                        progress.update()
+                        # A failed world must not discard the worlds still running on the pool
+                        try:
+                            world = future.result()
+                        except Exception as e:
+                            logger.error(
+                                f"World of variant {variant_index} with seed {random_seed} failed: {e}"
+                            )
+                            failures.append((variant_index, random_seed))
+                            continue
+                        writer.submit(
+                            self._write_world,
+                            world=world,
+                            export_path=self.get_export_path(
+                                export_dir, variant_index, random_seed
+                            ),
+                            config_hash=config_hash,
+                            asset_hash=asset_hash,
+                            random_seed=random_seed,
+                            manifest=manifest,
+                            dataset=dataset,
+                        )
+        if failures:
+            failed = ", ".join(
+                f"variant {variant_index} seed {random_seed}"
+                for variant_index, random_seed in sorted(failures)
+            )
+            logger.error(
+                f"{len(failures)} of {len(jobs)} world(s) failed ({failed}), "
+                f"run the sweep again to retry them."
+            )
+            raise RuntimeError(
+                f"{len(failures)} of {len(jobs)} world(s) of the sweep failed ({failed})."
+            )
+        logger.info("Done.")
+
+    def _write_world(
+        self,
+        world: dict,
+        export_path: str,
+        config_hash: str,
+        asset_hash: str,
+        random_seed: int,
+        manifest: Union[BuildManifest, None],
+        dataset: Union[WorldDataset, None],
+    ) -> None:
+        """Writes a generated world and records it, runs on the writer thread.
+
+        Parameters:
+            world (dict): World as returned by GenerationWorker.generate
+            export_path (str): Path of the files to be exported, without file extension
+            config_hash (str): Hash of the config (with overrides applied)
+            asset_hash (str): Hash of the asset files
+            random_seed (int): Seed of the world
+            manifest (Union[BuildManifest, None]): Manifest the exported files are recorded in
+            dataset (Union[WorldDataset, None]): Dataset the world is appended to instead
+        """
+        if dataset is not None:
+            placements, tables = world["columns"]
+            dataset.append(
+                placements=placements,
+                tables=tables,
+                xml=world["xml"],
+                random_seed=random_seed,
+                config_hash=config_hash,
+                asset_hash=asset_hash,
+            )
+            return
+        file_paths = Sweep._export(
+            world, export_path=export_path, compression=self.compression
+        )
+        manifest.record(
+            export_path=export_path,
+            config_hash=config_hash,
+            asset_hash=asset_hash,
+            random_seed=random_seed,
+            file_paths=file_paths,
+        )
+
+    @staticmethod
+    def get_export_path(export_dir: str, variant_index: int, random_seed: int) -> str:
+        """Returns the export path (without file extension) of a sweep point.
+
+        Parameters:
+            export_dir (str): Directory of the sweep
+            variant_index (int): Index of the variant in the expanded overrides
+            random_seed (int): Seed of the world
+
+        Returns:
+            (str): Export path of the world
+        """
+        return os.path.join(
+            export_dir, f"variant_{variant_index:04d}", f"seed_{random_seed}", "output"
+        )
+
+    @staticmethod
+    def _export(
+        world: dict, export_path: str, compression: Union[str, None] = None
+    ) -> list[str]:
+        """Writes a generated world to xml and json, and its columnar placements if it has them.
+        All files are replaced atomically. The columnar placements are never compressed, so
+        they can still be memory-mapped.
+
+        Parameters:
+            world (dict): World as returned by GenerationWorker.generate
+            export_path (str): Path of the files to be exported, without file extension
+            compression (Union[str, None]): "gzip", "zstd" or None
+
+        Returns:
+            (list[str]): Paths of the written files
+        """
+        os.makedirs(os.path.dirname(export_path), exist_ok=True)
+        file_paths = [
+            ExportWriter.write(export_path + ".xml", world["xml"], compression),
+            ExportWriter.write(
+                export_path + ".json",
+                json.dumps(world["placements"], indent=4),
+                compression,
+            ),
+        ]
+        if "columns" in world:
+            placements, tables = world["columns"]
+            file_paths += PlacementExporter.export(
+                export_path=export_path, placements=placements, tables=tables
+            )
+        return file_paths
@@ -0,0 +1,579 @@
+import gc
+import os
+import copy
+import json
+import logging
+import numpy as np
+from typing import Any, Union
+
+from pitapy.base.world_sites.tile import Tile
+from pitapy.base.world_sites.environment import Environment
+from pitapy.base.asset_placement.validator import Validator
+from pitapy.base.asset_placement.layout_manager import LayoutManager
+from pitapy.base.asset_placement.rules.abstract_rule import Rule
+from pitapy.base.asset_placement.rules.boundary_rule import BoundaryRule
+from pitapy.base.asset_placement.placer.border_placer import BorderPlacer
+from pitapy.base.asset_placement.placer.abstract_placer import AbstractPlacer
+from pitapy.base.asset_placement.placer.object_placer import ObjectPlacer
+from pitapy.utils.general_utils import Utils
+from pitapy.utils.json_exporter import JSONExporter
+from pitapy.utils.xml_exporter import XMLExporter
+from pitapy.utils.export_writer import ExportWriter
+from pitapy.utils.placement_exporter import PlacementExporter
+from pitapy.utils.time_budget import TimeBudget
+from pitapy.utils.random_streams import RandomStreams
+from pitapy.utils.generation_worker import GenerationWorker
+from pitapy.utils.object_property_randomization import ObjectPropertyRandomization
+
+
+class TiledWorld:
+    """Generates a very large environment tile by tile with bounded memory.
+
+    The environment is split into tiles of equal area by the LayoutManager. Each tile is placed
+    with a mjcf model and validator of its own, exported and dropped before the next tile is
+    placed. The objects of an environment type are spread evenly over the tiles, distributions
+    are sampled around the center of each tile and fixed coordinates stay relative to the whole
+    environment. Objects of finished tiles within the halo distance of a tile are added to it
+    as halo, so rules hold across the edges between tiles. Only the states (blueprint and pose)
+    of objects that may still become halo of an unfinished tile are kept.
+
+    The export consists of a root "output.xml" with the borders, the base plane and the assets
+    of all tiles, which includes one xml file per tile, one json file per tile with its objects
+    and an "output.json" that lists the tiles. With columnar set, the placements of every tile
+    are also exported as columnar binary file (see PlacementExporter).
+
+    Example:
+        index = TiledWorld(config="config.yml", tiles=64).generate(export_dir="export", random_seed=7)
+        model = mujoco.MjModel.from_xml_path("export/output.xml")
+    """
+
+    # Tiles are written into this folder of the export directory
+    TILE_DIR = "tiles"
+
+    def __init__(
+        self,
+        config: Union[str, dict],
+        tiles: int,
+        halo: Union[float, None] = None,
+        overrides: Union[dict[str, Any], None] = None,
+        xml_dir: Union[str, None] = None,
+        columnar: bool = False,
+    ):
+        """Constructor of the TiledWorld class.
+
+        Parameters:
+            config (Union[str, dict]): Path to the yaml config or the config itself
+            tiles (int): Number of tiles the environment is split into
+            halo (Union[float, None]): Distance up to which objects of other tiles are checked against,
+                                       derived from the largest object and minimal distance if None
+            overrides (Union[dict[str, Any], None]): Dotted config paths mapped to new values
+            xml_dir (Union[str, None]): Folder where all xml files are located
+            columnar (bool): Also export the placements of every tile as columnar binary file
+        """
+        if tiles < 1 or (halo is not None and halo < 0):
+            logging.getLogger().error(
+                f"Invalid tiling with tiles={tiles} and halo={halo}."
+            )
+            raise ValueError("tiles must be at least 1 and halo not negative.")
+        self.config = config
+        self.tiles = tiles
+        self.halo = halo
+        self.overrides = overrides
+        self.xml_dir = xml_dir
+        self.columnar = columnar
+
+    def generate(self, export_dir: str, random_seed: Union[int, None] = None) -> dict:
+        """Generates the world tile by tile and exports every tile as soon as it is placed.
+
+        Parameters:
+            export_dir (str): Directory to export to
+            random_seed (Union[int, None]): Seed for reproducibility, falls back to the seed of the config
+
+        Returns:
+            (dict): Content of "output.json", the environment and its objects with the list of tiles
+
+        Raises:
+            ValueError: If the config has areas, which cannot be tiled
+        """
+        logger = logging.getLogger()
+        config = GenerationWorker.load_config(
+            config=self.config, overrides=self.overrides
+        )
+        if config.get("Areas") is not None:
+            logger.error(
+                "Tiled worlds only place objects of the environment, not areas."
+            )
+            raise ValueError(
+                "Tiled worlds only place objects of the environment, remove the areas from the config."
+            )
+        random_seed = Utils.resolve_random_seed(random_seed=random_seed, config=config)
+        assembler = GenerationWorker.get_assembler(
+            config=config, xml_dir=GenerationWorker.get_xml_dir(self.xml_dir)
+        )
+        blueprints = assembler.load_blueprints()
+        random_streams = RandomStreams(config, random_seed=random_seed)
+        world_budget = TimeBudget(config["Environment"].get("time_budget"))
+
+        environment, _ = assembler.create_environment_and_areas(
+            plot=False, rng=random_streams.world
+        )
+        boundaries = TiledWorld.get_tile_boundaries(environment, self.tiles)
+        # Every tile draws from streams of its own, seeded from the world stream
+        tile_seeds = random_streams.world.integers(2**63, size=len(boundaries))
+        tile_objects, tile_properties = TiledWorld._split_objects(
+            config, environment, boundaries, random_streams
+        )
+        rules = assembler.rule_assembler.assemble_site_rules_pairs(environment.size)[
+            "Environment"
+        ]
+        halo = (
+            self._get_halo(config, blueprints, rules)
+            if self.halo is None
+            else self.halo
+        )
+        borders = self._place_border(config, environment, blueprints)
+        logger.info(f"Generating {len(boundaries)} tile(s) with a halo of {halo:.2f}")
+
+        os.makedirs(os.path.join(export_dir, TiledWorld.TILE_DIR), exist_ok=True)
+        tiles, assets, incomplete_placements = [], {}, []
+        # States of placed objects that may still become halo of an unfinished tile
+        halo_states: list[dict] = []
+        # Tile files are written while the next tile is placed
+        with ExportWriter(max_pending=2) as writer:
+            for index, boundary in enumerate(boundaries):
+                tile = Tile(
+                    name=f"tile_{index:04d}", boundary=boundary, environment=environment
+                )
+                logger.info(
+                    f"Placing objects of '{tile.name}' ({index + 1}/{len(boundaries)}).."
+                )
+                # The boundary is closed, so fixed coordinates on the edge between two tiles are valid
+                validator = Validator(
+                    rules
+                    + [
+                        BoundaryRule(
+                            boundary=(tile.size[0] + 1e-9, tile.size[1] + 1e-9),
+                            center=tile.center,
+                        )
+                    ]
+                )
+                self._add_halo(
+                    tile, validator, environment, blueprints, borders, halo_states, halo
+                )
+
+                tile_config = TiledWorld._get_tile_config(config, tile_objects[index])
+                object_placer = ObjectPlacer(
+                    tile_config,
+                    blueprints,
+                    RandomStreams(tile_config, random_seed=int(tile_seeds[index])),
+                    world_budget,
+                    object_properties=tile_properties[index],
+                )
+                object_placer.place_objects(
+                    environment=tile, areas=[], validators=[validator]
+                )
+                incomplete_placements += object_placer.incomplete_placements
+                tile.clear_halo()
+
+                tiles.append(
+                    self._export_tile(tile, export_dir, assets, writer, self.columnar)
+                )
+                halo_states = TiledWorld._prune_halo_states(
+                    halo_states
+                    + [
+                        object_state
+                        for placement in ObjectPlacer.get_state(
+                            object_placer.placements
+                        )
+                        for object_state in placement["mujoco_objects"]
+                    ],
+                    boundaries[index + 1 :],
+                    halo,
+                )
+                # Mjcf models reference each other in cycles, collect them before the next tile
+                del tile, validator, object_placer
+                gc.collect()
+
+        assembler.add_base_plane(environment)
+        with open(os.path.join(export_dir, "output.xml"), "w") as file:
+            file.write(
+                XMLExporter.to_root_xml(
+                    xml_string=environment.mjcf_model.to_xml_string(),
+                    assets=list(assets.values()),
+                    include_files=[tile["xml"] for tile in tiles],
+                )
+            )
+        index = JSONExporter.to_dict(
+            config=config,
+            environment=environment,
+            areas=[],
+            incomplete_placements=incomplete_placements,
+        )
+        index["tiles"] = tiles
+        with open(os.path.join(export_dir, "output.json"), "w") as file:
+            json.dump(index, file, indent=4)
+        if incomplete_placements:
+            logger.warning(
+                f"Time budget ran out, exported a partial world missing objects of "
+                f"{len(incomplete_placements)} object type(s) in tiles."
+            )
+        return index
+
+    @staticmethod
+    def get_tile_boundaries(
+        environment: Environment, tiles: int
+    ) -> list[tuple[tuple[float, float], tuple[float, float]]]:
+        """Splits the environment into tiles of equal area.
+
+        Parameters:
+            environment (Environment): Environment class instance
+            tiles (int): Number of tiles
+
+        Returns:
+            (list[tuple[tuple[float, float], tuple[float, float]]]): Lower left and upper right corner per tile
+        """
+        layout_manager = LayoutManager(
+            environment.size[0] * 2, environment.size[1] * 2, tiles, plot=False
+        )
+        # Convert from zero based coordinates to mujoco coordinates
+        return [
+            (
+                (start[0] - environment.size[0], start[1] - environment.size[1]),
+                (end[0] - environment.size[0], end[1] - environment.size[1]),
+            )
+            for start, end in layout_manager.generate_layout_boundaries()
+        ]
+
+    @staticmethod
+    def _split_objects(
+        config: dict,
+        environment: Environment,
+        boundaries: list[tuple[tuple[float, float], tuple[float, float]]],
+        random_streams: RandomStreams,
+    ) -> tuple[list[dict], list[dict]]:
+        """Spreads the objects of the environment over the tiles. The amount of a random object
+        type is sampled once for the whole environment and split evenly, fixed objects belong to
+        the tile containing their coordinates. Colors and sizes are sampled from their groups for
+        the whole environment as well and handed to the tiles object by object, so a group may
+        span several tiles. Tiles without objects of a type do not get its settings.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            environment (Environment): Environment class instance
+            boundaries (list[tuple[tuple[float, float], tuple[float, float]]]): Boundaries of the tiles
+            random_streams (RandomStreams): Random number generators of the whole environment
+
+        Returns:
+            (tuple[list[dict], list[dict]]): Object settings of the environment per tile and the
+                                             colors and sizes of its objects per tile
+        """
+        corners = np.array(boundaries, dtype=float).reshape(-1, 4)
+        tile_objects = [{} for _ in boundaries]
+        tile_properties = [{} for _ in boundaries]
+        for object_name, object_settings in config["Environment"]["Objects"].items():
+            config_dict = {k: v for dict_ in object_settings for k, v in dict_.items()}
+            rng = random_streams.get("Environment", object_name)
+            amount = config_dict["amount"]
+            coordinates = None
+            if "coordinates" in config_dict:
+                # Coordinates are given in percent of the environment
+                coordinates = np.array(config_dict["coordinates"][:amount], dtype=float)
+                positions = (
+                    -np.array(environment.size[:2])
+                    + coordinates[:, :2] / 100 * 2 * np.array(environment.size[:2])
+                ).reshape(-1, 2)
+                inside = (
+                    (positions[:, None, 0] >= corners[:, 0])
+                    & (positions[:, None, 0] < corners[:, 2])
+                    & (positions[:, None, 1] >= corners[:, 1])
+                    & (positions[:, None, 1] < corners[:, 3])
+                )
+                # Coordinates outside of all tiles go to the nearest one, which rejects them
+                centers = (corners[:, :2] + corners[:, 2:]) / 2
+                nearest = np.argmin(
+                    np.linalg.norm(positions[:, None] - centers, axis=2), axis=1
+                )
+                owners = np.where(
+                    inside.any(axis=1), np.argmax(inside, axis=1), nearest
+                )
+            else:
+                if not isinstance(amount, (list, tuple)):
+                    amount = (amount, amount)
+                total = ObjectPropertyRandomization.sample_from_amount(
+                    amount=amount, rng=rng
+                )
+                owners = np.repeat(
+                    np.arange(len(boundaries)),
+                    [
+                        total // len(boundaries) + (index < total % len(boundaries))
+                        for index in range(len(boundaries))
+                    ],
+                )
+
+            AbstractPlacer._check_user_input(
+                color_groups=config_dict.get("color_groups"),
+                size_groups=config_dict.get("size_groups"),
+                amount=len(owners),
+            )
+            colors = ObjectPropertyRandomization.get_random_colors(
+                amount=len(owners),
+                color_groups=config_dict.get("color_groups"),
+                rng=rng,
+            )
+            sizes = ObjectPropertyRandomization.get_random_sizes(
+                amount=len(owners),
+                size_groups=config_dict.get("size_groups"),
+                size_value_range=config_dict.get("size_value_range"),
+                rng=rng,
+            )
+            for index in range(len(boundaries)):
+                is_owned = owners == index
+                share = int(np.sum(is_owned))
+                if share == 0:
+                    continue
+                settings = {
+                    "amount": share if coordinates is not None else [share, share]
+                }
+                if coordinates is not None:
+                    settings["coordinates"] = coordinates[is_owned].tolist()
+                tile_objects[index][object_name] = [
+                    {key: settings[key]} if key in settings else {key: value}
+                    for dict_ in object_settings
+                    for key, value in dict_.items()
+                ]
+                tile_properties[index][("Environment", object_name)] = {
+                    key: values[is_owned].tolist()
+                    for key, values in (("colors", colors), ("sizes", sizes))
+                    if values is not None
+                }
+        return tile_objects, tile_properties
+
+    @staticmethod
+    def _get_tile_config(config: dict, objects: dict) -> dict:
+        """Returns the config of a tile: the environment with the objects of the tile and
+        without borders, which are placed once for the whole environment.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            objects (dict): Object settings of the tile
+
+        Returns:
+            (dict): Config of the tile
+        """
+        return {
+            **config,
+            "Environment": {
+                **config["Environment"],
+                "Borders": [{"place": False}],
+                "Objects": objects,
+            },
+        }
+
+    @staticmethod
+    def _get_halo(config: dict, blueprints: dict, rules: list) -> float:
+        """Returns the distance up to which objects of two tiles can violate a rule: the
+        extent of the two largest objects plus the minimal distance between them.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            blueprints (dict): Dictionary of Mujoco objects blueprints
+            rules (list): Rules of the environment
+
+        Returns:
+            (float): Halo distance
+        """
+        extents = [0.0]
+        for object_name, object_settings in config["Environment"]["Objects"].items():
+            config_dict = {k: v for dict_ in object_settings for k, v in dict_.items()}
+            blueprint_names = [object_name] + [
+                asset.split(".xml")[0] for asset in config_dict.get("asset_pool") or []
+            ]
+            extents += [
+                blueprints[blueprint_name].collision_metadata.planar_radius
+                for blueprint_name in blueprint_names
+            ]
+            if config_dict.get("size_value_range") is not None:
+                extents.append(float(max(config_dict["size_value_range"])))
+        # Infinite planes do not move with their position, they cannot be checked across tiles
+        extent = max(extent for extent in extents if np.isfinite(extent))
+        return 2 * extent + Rule.get_min_distance(rules)
+
+    @staticmethod
+    def _place_border(config: dict, environment: Environment, blueprints: dict) -> list:
+        """Places the borders around the whole environment.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            environment (Environment): Environment class instance
+            blueprints (dict): Dictionary of Mujoco objects blueprints
+
+        Returns:
+            (list[MujocoObject]): The placed borders, empty if the environment has none
+        """
+        border_config_dict = {
+            k: v for dict_ in config["Environment"]["Borders"] for k, v in dict_.items()
+        }
+        BorderPlacer().add(
+            environment=environment,
+            mujoco_object_blueprint=blueprints["Border"],
+            amount=4,
+            has_border=border_config_dict["place"],
+        )
+        return list(environment.mujoco_objects.values())
+
+    @staticmethod
+    def _add_halo(
+        tile: Tile,
+        validator: Validator,
+        environment: Environment,
+        blueprints: dict,
+        borders: list,
+        halo_states: list[dict],
+        halo: float,
+    ) -> None:
+        """Adds the borders and the objects of finished tiles close to a tile as its halo.
+
+        Parameters:
+            tile (Tile): Tile class instance
+            validator (Validator): Validator of the tile
+            environment (Environment): Environment class instance
+            blueprints (dict): Dictionary of Mujoco objects blueprints
+            borders (list[MujocoObject]): Borders of the environment
+            halo_states (list[dict]): States of the objects of finished tiles
+            halo (float): Halo distance
+        """
+        if borders:
+            validator.map_2D[borders[0].name] = [
+                ObjectPlacer.get_border_shape(environment)
+            ]
+            (x_min, y_min), (x_max, y_max) = tile.boundary
+            if (
+                min(x_min + environment.size[0], environment.size[0] - x_max) < halo
+                or min(y_min + environment.size[1], environment.size[1] - y_max) < halo
+            ):
+                for border in borders:
+                    tile.add_halo(copy.deepcopy(border))
+
+        states = TiledWorld._prune_halo_states(halo_states, [tile.boundary], halo)
+        for object_state in states:
+            mujoco_object = ObjectPlacer.restore_object(blueprints, object_state)
+            validator.add(mujoco_object)
+            tile.add_halo(mujoco_object)
+        if states:
+            logging.getLogger().info(
+                f"Added {len(states)} object(s) of finished tiles as halo of '{tile.name}'"
+            )
+
+    @staticmethod
+    def _prune_halo_states(
+        halo_states: list[dict],
+        boundaries: list[tuple[tuple[float, float], tuple[float, float]]],
+        halo: float,
+    ) -> list[dict]:
+        """Returns the states of the objects within the halo distance of any of the tiles.
+
+        Parameters:
+            halo_states (list[dict]): States of placed objects
+            boundaries (list[tuple[tuple[float, float], tuple[float, float]]]): Boundaries of the tiles
+            halo (float): Halo distance
+
+        Returns:
+            (list[dict]): States of the objects that are halo of at least one of the tiles
+        """
+        if not halo_states or not boundaries:
+            return []
+        positions = np.array(
+            [object_state["position"][:2] for object_state in halo_states]
+        )
+        corners = np.array(boundaries, dtype=float).reshape(-1, 4)
+        # Distance of every position to the rectangle of every tile
+        offsets = np.maximum(
+            np.maximum(corners[:, :2] - positions[:, None], 0),
+            positions[:, None] - corners[:, 2:],
+        )
+        is_halo = (np.linalg.norm(offsets, axis=2) <= halo).any(axis=1)
+        return [
+            object_state for object_state, keep in zip(halo_states, is_halo) if keep
+        ]
+
+    @staticmethod
+    def _export_tile(
+        tile: Tile,
+        export_dir: str,
+        assets: dict,
+        writer: ExportWriter,
+        columnar: bool = False,
+    ) -> dict:
+        """Writes the xml and json file of a tile, and its columnar placements if requested.
+        The assets of the tile are moved to the root xml, which includes the xml files of all
+        tiles.
+
+        Parameters:
+            tile (Tile): Tile class instance without halo
+            export_dir (str): Directory to export to
+            assets (dict): Assets of all exported tiles by tag and name, extended by the assets of the tile
+            writer (ExportWriter): Writer the files are handed to
+            columnar (bool): Also export the placements of the tile as columnar binary file
+
+        Returns:
+            (dict): Entry of the tile in the list of tiles
+        """
+        xml_file = os.path.join(TiledWorld.TILE_DIR, f"{tile.name}.xml")
+        json_file = os.path.join(TiledWorld.TILE_DIR, f"{tile.name}.json")
+        xml_string, tile_assets = XMLExporter.split_assets(
+            xml_string=tile.mjcf_model.to_xml_string()
+        )
+        for element in tile_assets:
+            assets.setdefault((element.tag, element.get("name")), element)
+        writer.submit(
+            TiledWorld._write_tile,
+            xml_path=os.path.join(export_dir, xml_file),
+            xml_string=xml_string,
+            json_path=os.path.join(export_dir, json_file),
+            values={
+                "name": tile.name,
+                "boundary": tile.boundary,
+                "objects": {
+                    mujoco_object.xml_id: JSONExporter.get_object_values(
+                        mujoco_object=mujoco_object, name=mujoco_object.xml_id
+                    )
+                    for mujoco_object in tile.mujoco_objects.values()
+                },
+            },
+        )
+        entry = {
+            "name": tile.name,
+            "boundary": tile.boundary,
+            "xml": xml_file,
+            "json": json_file,
+            "objects": len(tile.mujoco_objects),
+        }
+        if columnar:
+            placements, tables = PlacementExporter.to_columns(tile, [])
+            writer.submit(
+                PlacementExporter.export,
+                export_path=os.path.join(export_dir, TiledWorld.TILE_DIR, tile.name),
+                placements=placements,
+                tables=tables,
+            )
+            entry["placements"] = os.path.join(
+                TiledWorld.TILE_DIR, f"{tile.name}_placements.npy"
+            )
+        return entry
+
+    @staticmethod
+    def _write_tile(
+        xml_path: str, xml_string: str, json_path: str, values: dict
+    ) -> None:
+        """Writes the xml and json file of a tile, runs on the writer thread.
+
+        Parameters:
+            xml_path (str): Path of the xml file
+            xml_string (str): Xml of the tile without assets
+            json_path (str): Path of the json file
+            values (dict): Name, boundary and objects of the tile
+        """
+        with open(xml_path, "w") as file:
+            file.write(xml_string)
+        with open(json_path, "w") as file:
+            json.dump(values, file, indent=4)
@@ -0,0 +1,161 @@
+import os
+import json
+import hashlib
+import logging
+
+
+class BuildManifest:
+    """Keeps track of the finished worlds of a dataset build, so an interrupted build can be resumed.
+
+    Every finished world is appended as one json line with its export path, config hash,
+    asset hash, seed and the sha256 hashes of its output files. The last record of an export
+    path is the one that counts, so a different world exported to the same path replaces it.
+    A line is written with a single write call and synced to disk, so a crash can at most
+    leave a truncated last line, which is ignored on loading.
+    """
+
+    def __init__(self, path: str):
+        """Constructor of the BuildManifest class. Loads the records of a previous build, if any.
+
+        Parameters:
+            path (str): Path of the manifest file
+        """
+        self.path = path
+        # Records by export path
+        self._records: dict[str, dict] = {}
+        # A crash may leave the last line without line break
+        self._needs_newline = False
+        if os.path.isfile(path):
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def is_complete(
+        self, export_path: str, config_hash: str, asset_hash: str, random_seed: int
+    ) -> bool:
+        """Returns whether the world at the export path was finished with the given config,
+        assets and seed, and its output files are unchanged.
+
+        Parameters:
+            export_path (str): Path of the exported files, without file extension
+            config_hash (str): Hash of the config (with overrides applied)
+            asset_hash (str): Hash of the asset files (see ResultCache.hash_assets)
+            random_seed (int): Seed of the world
+
+        Returns:
+            (bool): True if the world is recorded and all its files exist with the recorded hash
+        """
+        record = self._records.get(export_path)
+        if record is None:
+            return False
+        if (
+            record["config_hash"] != config_hash
+            or record.get("asset_hash") != asset_hash
+            or record["random_seed"] != random_seed
+        ):
+            logging.getLogger().info(
+                f"Output '{export_path}' was built from another config, assets or seed, "
+                f"regenerating it"
+            )
+            return False
+        for file_path, file_hash in record["files"].items():
+            if (
+                not os.path.isfile(file_path)
+                or BuildManifest.hash_file(file_path) != file_hash
+            ):
+                logging.getLogger().info(
+                    f"Output '{file_path}' is missing or corrupt, regenerating it"
+                )
+                return False
+        return True
+
+    def record(
+        self,
+        export_path: str,
+        config_hash: str,
+        asset_hash: str,
+        random_seed: int,
+        file_paths: list[str],
+    ) -> None:
+        """Records a finished world with the hashes of its output files.
+
+        Parameters:
+            export_path (str): Path of the exported files, without file extension
+            config_hash (str): Hash of the config (with overrides applied)
+            asset_hash (str): Hash of the asset files (see ResultCache.hash_assets)
+            random_seed (int): Seed of the world
+            file_paths (list[str]): Paths of the written output files
+        """
+        record = {
+            "export_path": export_path,
+            "config_hash": config_hash,
+            "asset_hash": asset_hash,
+            "random_seed": random_seed,
+            "files": {
+                file_path: BuildManifest.hash_file(file_path)
+                for file_path in file_paths
+            },
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a") as file:
+            file.write(
+                ("\n" if self._needs_newline else "") + json.dumps(record) + "\n"
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        self._needs_newline = False
+        self._records[export_path] = record
+
+    @staticmethod
+    def write_atomic(path: str, content: str) -> None:
+        """Writes a file via a temporary file and a rename, so it is never left half written.
+
+        Parameters:
+            path (str): Path of the file
+            content (str): Content of the file
+        """
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """Returns the sha256 hash of a file.
+
+        Parameters:
+            path (str): Path of the file
+
+        Returns:
+            (str): Hex digest of the file content
+        """
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _load(self) -> None:
+        """Loads the records of the manifest file, skipping a truncated last line."""
+        with open(self.path, "r") as file:
+            lines = file.read().split("\n")
+        # The content after the last line break is empty unless the last line is truncated
+        self._needs_newline = lines[-1] != ""
+        for line in lines:
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logging.getLogger().warning(
+                    f"Skipping incomplete record in manifest '{self.path}'"
+                )
+                continue
+            # Records of older manifests lack the export path and are built again
+            if "export_path" in record:
+                self._records[record["export_path"]] = record
@@ -1,6 +1,8 @@
 import os
+import copy
 import yaml
 import logging
+from typing import Any
 
 
 class ConfigReader:
@@ -29,3 +31,65 @@ class ConfigReader:
         config = yaml.load(stream, Loader=yaml.SafeLoader)
 
         return config
+
+    @staticmethod
+    def apply_overrides(config: dict, overrides: dict[str, Any]) -> dict:
+        """Returns a copy of the config with values replaced at the given dotted paths,
+        e.g. {"Environment.Objects.Tree1.amount": [5, 10]}. Object parameters, which are given
+        as a list of single-key dictionaries in the config, are addressed by their key.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            overrides (dict[str, Any]): Dictionary mapping dotted paths to new values
+
+        Returns:
+            config (dict): Copy of the configuration with overridden values
+        """
+        logger = logging.getLogger()
+        config = copy.deepcopy(config)
+
+        for path, value in overrides.items():
+            *parents, key = path.split(".")
+            node = config
+            for segment in parents:
+                node = ConfigReader._get_child(node, segment, path)
+
+            if isinstance(node, dict):
+                node[key] = value
+            elif isinstance(node, list) and key.isdigit():
+                node[int(key)] = value
+            elif isinstance(node, list):
+                entries = [entry for entry in node if key in entry]
+                if entries:
+                    entries[0][key] = value
+                else:
+                    node.append({key: value})
+            else:
+                logger.error(f"Could not apply override '{path}'.")
+                raise ValueError(f"Could not apply override '{path}'.")
+
+        return config
+
+    @staticmethod
+    def _get_child(node: Any, segment: str, path: str) -> Any:
+        """Returns the child of a config node addressed by one segment of a dotted path.
+
+        Parameters:
+            node (Any): Dictionary, list or list of single-key dictionaries
+            segment (str): Key, index or parameter name of the child
+            path (str): Complete dotted path, used for error messages
+
+        Returns:
+            (Any): Child of the node
+        """
+        logger = logging.getLogger()
+        if isinstance(node, dict) and segment in node:
+            return node[segment]
+        if isinstance(node, list) and segment.isdigit() and int(segment) < len(node):
+            return node[int(segment)]
+        if isinstance(node, list):
+            for entry in node:
+                if isinstance(entry, dict) and segment in entry:
+                    return entry[segment]
+        logger.error(f"Could not find '{segment}' of override '{path}' in config.")
+        raise ValueError(f"Could not find '{segment}' of override '{path}' in config.")
@@ -0,0 +1,132 @@
+import os
+import gzip
+import queue
+import logging
+import threading
+from typing import Any, Callable, Union
+from pitapy.utils.build_manifest import BuildManifest
+
+
+class ExportWriter:
+    """Runs exports on a background thread, so the next world is handled while the last one
+    is serialized, compressed and written.
+
+    Exports wait in a bounded queue; once it is full, submitting blocks until the writer has
+    caught up, which caps the number of worlds held in memory. An error of an export is
+    raised again by the next call to submit or close.
+    """
+
+    # File extensions of the supported compressions
+    EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+    def __init__(self, max_pending: int = 8):
+        """Constructor of the ExportWriter class. Starts the writer thread.
+
+        Parameters:
+            max_pending (int): Number of exports that may wait for the writer
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: Union[BaseException, None] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def submit(self, function: Callable, *args: Any, **kwargs: Any) -> None:
+        """Queues an export, blocks while the queue is full.
+
+        Parameters:
+            function (Callable): Export function, called on the writer thread
+            *args (Any): Positional arguments of the function
+            **kwargs (Any): Keyword arguments of the function
+        """
+        self._raise_error()
+        self._queue.put((function, args, kwargs))
+
+    def close(self) -> None:
+        """Waits until all queued exports are written and stops the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def _run(self) -> None:
+        """Writes the queued exports in order until close is called."""
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            # Exports after a failed one are skipped, the error is raised on the main thread
+            if self._error is not None:
+                continue
+            function, args, kwargs = task
+            try:
+                function(*args, **kwargs)
+            except BaseException as e:
+                self._error = e
+
+    def _raise_error(self) -> None:
+        """Raises the error of a failed export on the calling thread."""
+        if self._error is not None:
+            logging.getLogger().error(f"Export failed: {self._error}")
+            raise RuntimeError(f"Export failed: {self._error}") from self._error
+
+    @staticmethod
+    def write(path: str, content: str, compression: Union[str, None] = None) -> str:
+        """Writes a file atomically, compressed if requested. Compressed files get the
+        extension of their compression appended.
+
+        Parameters:
+            path (str): Path of the file
+            content (str): Content of the file
+            compression (Union[str, None]): "gzip", "zstd" or None
+
+        Returns:
+            (str): Path of the written file
+        """
+        if compression is None:
+            BuildManifest.write_atomic(path, content)
+            return path
+        data = ExportWriter.compress(content.encode("utf-8"), compression)
+        path = path + ExportWriter.EXTENSIONS[compression]
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+        return path
+
+    @staticmethod
+    def compress(data: bytes, compression: str) -> bytes:
+        """Compresses bytes. Zstd needs the optional 'zstandard' package.
+
+        Parameters:
+            data (bytes): Data to compress
+            compression (str): "gzip" or "zstd"
+
+        Returns:
+            (bytes): Compressed data
+        """
+        if compression == "gzip":
+            # A fixed modification time keeps the output reproducible
+            return gzip.compress(data, mtime=0)
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                logging.getLogger().error(
+                    "Zstd compression needs the 'zstandard' package, install it or use gzip."
+                )
+                raise ValueError(
+                    "Zstd compression needs the 'zstandard' package, install it or use gzip."
+                )
+            return zstandard.ZstdCompressor().compress(data)
+        logging.getLogger().error(
+            f"Unknown compression '{compression}', use 'gzip' or 'zstd'."
+        )
+        raise ValueError(f"Unknown compression '{compression}', use 'gzip' or 'zstd'.")
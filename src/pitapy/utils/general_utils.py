@@ -1,3 +1,9 @@
+import json
+import logging
+import hashlib
+from typing import Union
+
+
 class Utils:
     """Collection of utility functions."""
 
@@ -22,6 +28,44 @@ class Utils:
 
         return tuple(default_values)
 
+    @staticmethod
+    def resolve_random_seed(
+        random_seed: Union[int, None], config: dict
+    ) -> Union[int, None]:
+        """Returns the seed to use for a run; a given seed takes precedence over the seed in the config.
+
+        Parameters:
+            random_seed (Union[int, None]): Seed passed by the caller
+            config (dict): Dictionary of user defined configurations
+
+        Returns:
+            random_seed (Union[int, None]): Seed to use, None if neither is specified
+        """
+        logger = logging.getLogger()
+        config_seed = config["Environment"].get("random_seed")
+        if random_seed is not None and config_seed is not None:
+            logger.info(
+                "Two seeds were specified (call argument to PITA.run() and in level config file). Using seed from the call."
+            )
+        elif random_seed is None:
+            random_seed = config_seed
+        if random_seed is not None:
+            logger.info(f"Setting random seed to {random_seed}")
+        return random_seed
+
+    @staticmethod
+    def hash_config(config: dict) -> str:
+        """Returns a hash of the config that does not depend on the order of dictionary keys.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+
+        Returns:
+            (str): Hex digest of the normalized config
+        """
+        normalized = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
     @staticmethod
     def offset_coordinates_to_boundaries(
         position: tuple[float, float, float],
@@ -0,0 +1,198 @@
+import os
+import logging
+from typing import Any, Union
+from importlib_resources import files
+
+from pitapy.base.assembler import Assembler
+from pitapy.base.world_sites.area import Area
+from pitapy.base.world_sites.environment import Environment
+from pitapy.utils.general_utils import Utils
+from pitapy.utils.xml_exporter import XMLExporter
+from pitapy.utils.json_exporter import JSONExporter
+from pitapy.utils.placement_exporter import PlacementExporter
+from pitapy.utils.config_reader import ConfigReader
+
+
+class GenerationWorker:
+    """Generates worlds in a (worker) process while keeping parsed configs and assemblers warm.
+
+    All state is kept on the class, so every process of a worker pool holds its own cache.
+    The mujoco object blueprints are cached by the MujocoLoader across all configs.
+    """
+
+    # Number of assemblers (one per distinct config) kept per process
+    MAX_CACHED_ASSEMBLERS = 32
+
+    _configs: dict[tuple[str, float], dict] = {}
+    _assemblers: dict[str, Assembler] = {}
+
+    @staticmethod
+    def warm_up(config_path: Union[str, None], xml_dir: Union[str, None]) -> None:
+        """Parses a config and loads its blueprints, used as initializer of worker processes.
+        Errors are only logged, since an initializer that raises breaks the whole pool.
+        Requests with the same config then fail on their own with the same error.
+
+        Parameters:
+            config_path (Union[str, None]): Path to the yaml config, nothing is loaded if None
+            xml_dir (Union[str, None]): Folder where all xml files are located
+        """
+        if config_path is None:
+            return
+        try:
+            config = GenerationWorker.get_config(config_path=config_path)
+            assembler = GenerationWorker.get_assembler(
+                config=config, xml_dir=GenerationWorker.get_xml_dir(xml_dir)
+            )
+            assembler.load_blueprints()
+        except Exception as e:
+            logging.getLogger().error(
+                f"Could not warm up worker with config '{config_path}': {e}"
+            )
+
+    @staticmethod
+    def get_config(config_path: str) -> dict:
+        """Returns the parsed config, parsing the yaml file only if it is new or changed on disk.
+
+        Parameters:
+            config_path (str): Path to the yaml config
+
+        Returns:
+            config (dict): Dictionary of user defined configurations
+        """
+        if not os.path.isfile(config_path):
+            # Let the config reader raise its usual error
+            return ConfigReader.execute(config_path=config_path)
+        key = (os.path.abspath(config_path), os.path.getmtime(config_path))
+        if key not in GenerationWorker._configs:
+            GenerationWorker._configs[key] = ConfigReader.execute(
+                config_path=config_path
+            )
+        return GenerationWorker._configs[key]
+
+    @staticmethod
+    def get_assembler(config: dict, xml_dir: str) -> Assembler:
+        """Returns a cached assembler for the config and xml directory.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            xml_dir (str): Folder where all xml files are located
+
+        Returns:
+            (Assembler): Assembler with parsed user rules
+        """
+        key = Utils.hash_config({"config": config, "xml_dir": str(xml_dir)})
+        if key not in GenerationWorker._assemblers:
+            if (
+                len(GenerationWorker._assemblers)
+                >= GenerationWorker.MAX_CACHED_ASSEMBLERS
+            ):
+                # Evict the oldest entry (dicts keep insertion order)
+                del GenerationWorker._assemblers[
+                    next(iter(GenerationWorker._assemblers))
+                ]
+            GenerationWorker._assemblers[key] = Assembler(
+                config_file=config, xml_dir=xml_dir, plot=False
+            )
+        return GenerationWorker._assemblers[key]
+
+    @staticmethod
+    def load_config(
+        config: Union[str, dict], overrides: Union[dict[str, Any], None] = None
+    ) -> dict:
+        """Returns the (cached) config with the overrides applied.
+
+        Parameters:
+            config (Union[str, dict]): Path to the yaml config or the config itself
+            overrides (Union[dict[str, Any], None]): Dotted config paths mapped to new values
+
+        Returns:
+            config (dict): Dictionary of user defined configurations
+        """
+        if not isinstance(config, dict):
+            config = GenerationWorker.get_config(config_path=str(config))
+        if overrides:
+            config = ConfigReader.apply_overrides(config, overrides)
+        return config
+
+    @staticmethod
+    def assemble(
+        config: dict, random_seed: Union[int, None], xml_dir: Union[str, None] = None
+    ) -> tuple[Environment, list[Area]]:
+        """Assembles a world in memory with the cached assembler of the config.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            random_seed (Union[int, None]): Root seed of the random streams
+            xml_dir (Union[str, None]): Folder where all xml files are located
+
+        Returns:
+            (tuple[Environment, list[Area]]): Environment and areas with objects
+        """
+        assembler = GenerationWorker.get_assembler(
+            config=config, xml_dir=GenerationWorker.get_xml_dir(xml_dir)
+        )
+        return assembler.assemble_world(random_seed=random_seed)
+
+    @staticmethod
+    def generate(
+        config: Union[str, dict],
+        random_seed: Union[int, None] = None,
+        overrides: Union[dict[str, Any], None] = None,
+        xml_dir: Union[str, None] = None,
+        columnar: bool = False,
+    ) -> dict:
+        """Generates a world and returns it in a picklable form.
+
+        Parameters:
+            config (Union[str, dict]): Path to the yaml config or the config itself
+            random_seed (Union[int, None]): Seed for reproducibility, falls back to the seed of the config
+            overrides (Union[dict[str, Any], None]): Dotted config paths mapped to new values
+            xml_dir (Union[str, None]): Folder where all xml files are located
+            columnar (bool): Also return the placements and string tables as "columns" (see PlacementExporter)
+
+        Returns:
+            (dict): Used "random_seed", cleaned "xml" string and "placements" as exported to json
+        """
+        config = GenerationWorker.load_config(config=config, overrides=overrides)
+        random_seed = Utils.resolve_random_seed(random_seed=random_seed, config=config)
+        environment, areas = GenerationWorker.assemble(
+            config=config, random_seed=random_seed, xml_dir=xml_dir
+        )
+        assembler = GenerationWorker.get_assembler(
+            config=config, xml_dir=GenerationWorker.get_xml_dir(xml_dir)
+        )
+
+        world = {
+            "random_seed": random_seed,
+            "xml": XMLExporter.clean_xml(
+                xml_string=environment.mjcf_model.to_xml_string()
+            ),
+            "placements": JSONExporter.to_dict(
+                config=config,
+                environment=environment,
+                areas=areas,
+                incomplete_placements=assembler.incomplete_placements,
+            ),
+        }
+        if columnar:
+            world["columns"] = PlacementExporter.to_columns(
+                environment=environment, areas=areas
+            )
+        return world
+
+    @staticmethod
+    def get_xml_dir(xml_dir: Union[str, None]) -> str:
+        """Returns the given xml directory or the directory of the packaged examples.
+
+        Parameters:
+            xml_dir (Union[str, None]): Folder where all xml files are located
+
+        Returns:
+            (str): Folder where all xml files are located
+        """
+        if xml_dir is None:
+            logging.getLogger().info(
+                "xml directory not specified; using default directory in examples"
+            )
+            return str(files("pitapy.examples").joinpath("xml_objects"))
+        return xml_dir
@@ -1,6 +1,8 @@
 import json
+from typing import Union
 from pitapy.base.world_sites.area import Area
 from pitapy.base.world_sites.environment import Environment
+from pitapy.base.asset_parsing.mujoco_object import MujocoObject
 
 
 class JSONExporter:
@@ -8,7 +10,11 @@ class JSONExporter:
 
     @staticmethod
     def export(
-        export_path: str, config: dict, environment: Environment, areas: list[Area]
+        export_path: str,
+        config: dict,
+        environment: Environment,
+        areas: list[Area],
+        incomplete_placements: Union[list[dict], None] = None,
     ) -> None:
         """Export all object information from the given Environment and Area instances
         to a JSON file.
@@ -18,6 +24,38 @@ class JSONExporter:
             config (dict): Config file containing user defined parameters
             environment (Environment): Environment class instance
             areas (list): List of Area class instances
+            incomplete_placements (Union[list[dict], None]): Object types left incomplete by their time budget
+        """
+        all_objects = JSONExporter.to_dict(
+            config=config,
+            environment=environment,
+            areas=areas,
+            incomplete_placements=incomplete_placements,
+        )
+
+        # Export to JSON file
+        with open(export_path + ".json", "w") as file:
+            json.dump(all_objects, file, indent=4)
+
+    @staticmethod
+    def to_dict(
+        config: dict,
+        environment: Environment,
+        areas: list[Area],
+        incomplete_placements: Union[list[dict], None] = None,
+    ) -> dict:
+        """Collects all object information from the given Environment and Area instances.
+        A partial world, whose time budget ran out, lists its incomplete object types
+        under "incomplete".
+
+        Parameters:
+            config (dict): Config file containing user defined parameters
+            environment (Environment): Environment class instance
+            areas (list): List of Area class instances
+            incomplete_placements (Union[list[dict], None]): Object types left incomplete by their time budget
+
+        Returns:
+            all_objects (dict): Configurations and objects of the environment and all areas
         """
         # Dictionary to store all objects
         all_objects = {"environment": {}, "areas": {}}
@@ -33,27 +71,11 @@ class JSONExporter:
 
         # Loop over Environment and its objects
         for mujoco_object in environment._mujoco_objects.values():
-            values = {}
-            values["name"] = mujoco_object.name
-            values["class"] = mujoco_object.obj_class
-            values["tags"] = mujoco_object.tags
-
-            if mujoco_object.position is None:
-                values["position"] = None
-            else:
-                values["position"] = mujoco_object.position.tolist()
-
-            if mujoco_object.color is None:
-                values["color"] = None
-            else:
-                values["color"] = mujoco_object.color.tolist()
-
-            if mujoco_object.size is None:
-                values["size"] = None
-            else:
-                values["size"] = mujoco_object.size.tolist()
-
-            all_objects["environment"]["objects"][mujoco_object.name] = values
+            all_objects["environment"]["objects"][
+                mujoco_object.name
+            ] = JSONExporter.get_object_values(
+                mujoco_object=mujoco_object, name=mujoco_object.name
+            )
 
         # Loop over all Areas and their objects
         for area in areas:
@@ -69,30 +91,46 @@ class JSONExporter:
             all_objects["areas"][area.name]["configuration"] = values
 
             for mujoco_object in area._mujoco_objects.values():
-                values = {}
-                values["name"] = mujoco_object.xml_id
-                values["class"] = mujoco_object.obj_class
-                values["tags"] = mujoco_object.tags
-
-                if mujoco_object.position is None:
-                    values["position"] = None
-                else:
-                    values["position"] = mujoco_object.position.tolist()
-
-                if mujoco_object.color is None:
-                    values["color"] = None
-                else:
-                    values["color"] = mujoco_object.color.tolist()
-
-                if mujoco_object.size is None:
-                    values["size"] = None
-                else:
-                    values["size"] = mujoco_object.size.tolist()
-
                 all_objects["areas"][area.name]["objects"][
                     mujoco_object.xml_id
-                ] = values
+                ] = JSONExporter.get_object_values(
+                    mujoco_object=mujoco_object, name=mujoco_object.xml_id
+                )
 
-        # Export to JSON file
-        with open(export_path + ".json", "w") as file:
-            json.dump(all_objects, file, indent=4)
+        if incomplete_placements:
+            all_objects["incomplete"] = incomplete_placements
+
+        return all_objects
+
+    @staticmethod
+    def get_object_values(mujoco_object: MujocoObject, name: str) -> dict:
+        """Collects the information of a single object.
+
+        Parameters:
+            mujoco_object (MujocoObject): Placed mujoco object
+            name (str): Name under which the object is exported
+
+        Returns:
+            values (dict): Name, class, tags, position, color and size of the object
+        """
+        values = {}
+        values["name"] = name
+        values["class"] = mujoco_object.obj_class
+        values["tags"] = mujoco_object.tags
+
+        if mujoco_object.position is None:
+            values["position"] = None
+        else:
+            values["position"] = mujoco_object.position.tolist()
+
+        if mujoco_object.color is None:
+            values["color"] = None
+        else:
+            values["color"] = mujoco_object.color.tolist()
+
+        if mujoco_object.size is None:
+            values["size"] = None
+        else:
+            values["size"] = mujoco_object.size.tolist()
+
+        return values
@@ -1,121 +1,121 @@
-import random
 import webcolors
 import numpy as np
 from typing import Union
-from random import sample
 from PIL import ImageColor
 
 
+def _build_rgba_table() -> np.ndarray:
+    """Builds the table of all CSS3 colors as rgba values normalized between 0 and 1.
+
+    Returns:
+        rgba_table (np.ndarray): Array of shape (number of CSS3 colors, 4)
+    """
+    return (
+        np.array(
+            [
+                ImageColor.getcolor(webcolors.name_to_hex(color_name), "RGBA")
+                for color_name in webcolors.CSS3_NAMES_TO_HEX.keys()
+            ],
+            dtype=float,
+        )
+        / 255
+    )
+
+
+# Converting color names is expensive, so all CSS3 colors are converted once on import
+CSS3_RGBA_TABLE = _build_rgba_table()
+
+
 class ObjectPropertyRandomization:
     """Generates random colors, sizes and z-rotation depending on user input."""
 
     @staticmethod
-    def sample_from_amount(amount: tuple[int, int]) -> int:
+    def sample_from_amount(
+        amount: tuple[int, int], rng: Union[np.random.Generator, None] = None
+    ) -> int:
         """Sample the amount of objects to be placed if amount is a tuple of different values.
 
         Parameters:
-           amount (tuple[int, int]): Range of objects for randomization
+            amount (tuple[int, int]): Range of objects for randomization
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
 
         Returns:
             amount_int (int): Sample drawn from amount range
         """
+        rng = np.random.default_rng() if rng is None else rng
         amount_int = (
             amount[0]
             if (amount[0] == amount[1])
-            else np.random.randint(
-                int(amount[0]), int(amount[1]) + 1
+            else int(
+                rng.integers(int(amount[0]), int(amount[1]) + 1)
             )  # Randint function is exclusive on high val
         )
         return amount_int
 
     @staticmethod
     def get_random_colors(
-        amount: int, color_groups: Union[tuple[int, int], None]
-    ) -> Union[list[list[float]], None]:
-        """Returns a list of random rgba colors (with alpha=1).
+        amount: int,
+        color_groups: Union[tuple[int, int], None],
+        rng: Union[np.random.Generator, None] = None,
+    ) -> Union[np.ndarray, None]:
+        """Returns an array of random rgba colors (with alpha=1).
 
         Parameters:
             amount (int): Number of objects
             color_groups (Union[tuple[int, int], None]): Range of members per distinctly colored group
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
 
         Returns:
-            colors_for_placement (Union[list[list[float]], None]): List of randomized rgba colors
+            colors_for_placement (Union[np.ndarray, None]): Array of shape (amount, 4) with randomized rgba colors
                                                 (with duplicate entries for each group member, if color_groups > 1)
         """
         if color_groups is None:
             return None
-
-        # Get list of available color names
-        color_names = list(webcolors.CSS3_NAMES_TO_HEX.keys())
+        rng = np.random.default_rng() if rng is None else rng
 
         # Get random int in range of colors
-        colors_randint = (
-            color_groups[0]
-            if (color_groups[0] == color_groups[1])
-            else np.random.randint(
-                int(color_groups[0]), int(color_groups[1]) + 1
-            )  # higher is excluding
+        colors_randint = ObjectPropertyRandomization._sample_group_size(
+            groups=color_groups, rng=rng
         )
 
-        # Get number of different colors needed by amount / color_groups
-        colors_needed = int(
-            amount / colors_randint
-        )  # Int type cast automatically rounds down
-
-        # Get random rgba for number of colors needed
-        colors_rgba = list()
-
-        # Shuffle color names
-        random.shuffle(color_names)
+        # Get number of different colors needed by amount / color_groups, capped by the available colors
+        colors_needed = min(int(amount / colors_randint), len(CSS3_RGBA_TABLE))
 
-        # Loop over the first 'colors_needed' colors and convert them to rgba
-        # and normalize between 0 and 1
-        for color in color_names[:colors_needed]:
-            color_rgba = ObjectPropertyRandomization.get_rgba_from_color_name(color)
-            color_rgba_normalized = [(float(val) / 255) for val in color_rgba]
-            colors_rgba.append(color_rgba_normalized)
+        # Draw distinct colors from the table
+        colors_rgba = CSS3_RGBA_TABLE[
+            rng.choice(len(CSS3_RGBA_TABLE), size=colors_needed, replace=False)
+        ]
 
-        # Generate list of colors depending on amount an
-        colors_for_placement = list()
-        for color in colors_rgba:
-            for _ in range(colors_randint):
-                colors_for_placement.append(color)
-
-        # Fill colors_for_placement list if amount of objects is greater than colors in the list.
-        # This happens if amount % color_groups != 0
-        while amount > len(colors_for_placement):
-            sampled_color = sample(colors_rgba, 1)[0]
-            colors_for_placement.append(sampled_color)
-
-        return colors_for_placement
+        return ObjectPropertyRandomization._expand_groups(
+            values=colors_rgba, group_size=colors_randint, amount=amount, rng=rng
+        )
 
     @staticmethod
     def get_random_sizes(
         amount: int,
         size_groups: Union[tuple[float, float], None],
         size_value_range: Union[tuple[float, float], None],
-    ) -> Union[list[list[float]], None]:
-        """Returns a list of random sizes.
+        rng: Union[np.random.Generator, None] = None,
+    ) -> Union[np.ndarray, None]:
+        """Returns an array of random sizes.
 
         Parameters:
             amount (int): Number of objects
             size_groups (Union[tuple[float, float], None]): Range of members per distinctly sized group
             size_value_range (Union[tuple[float, float], None]): Defines the value size of the randomization process
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
 
         Returns:
-            sizes_for_placement (Union[list(float, float, float), None]): List of randomized sizes
+            sizes_for_placement (Union[np.ndarray, None]): Array of shape (amount, 3) with randomized sizes
                     (with duplicate entries for each group member, if size_groups > 1)
         """
         if size_groups is None:
             return None
+        rng = np.random.default_rng() if rng is None else rng
 
         # Get random int in range of sizes
-        sizes_randint = (
-            size_groups[0]
-            if (size_groups[0] == size_groups[1])
-            else np.random.randint(
-                int(size_groups[0]), int(size_groups[1]) + 1
-            )  # Higher is excluding
+        sizes_randint = ObjectPropertyRandomization._sample_group_size(
+            groups=size_groups, rng=rng
         )
 
         # Get number of different sizes needed by amount / size_groups
@@ -123,36 +123,24 @@ class ObjectPropertyRandomization:
             amount / sizes_randint
         )  # Int type cast automatically rounds down
 
-        # Get random sizes for number of sizes needed
-        sizes = list()
-        sizes_used = list()
-        for _ in range(sizes_needed):
-            random_size = ObjectPropertyRandomization.get_size_array(
-                size_value_range=size_value_range
-            )
-            while random_size in sizes_used:
-                random_size = ObjectPropertyRandomization.get_size_array(
-                    size_value_range=size_value_range
+        # Draw all sizes at once, then redraw the (rare) duplicates
+        sizes = rng.uniform(
+            size_value_range[0], size_value_range[1], size=(sizes_needed, 3)
+        )
+        sizes_used = set()
+        for index in range(sizes_needed):
+            while sizes[index].tobytes() in sizes_used:
+                sizes[index] = ObjectPropertyRandomization.get_size_array(
+                    size_value_range=size_value_range, rng=rng
                 )
-            sizes_used.append(random_size)
-            sizes.append(random_size)
+            sizes_used.add(sizes[index].tobytes())
 
-        # Generate list of colors depending on amount an
-        sizes_for_placement = list()
-        for size in sizes:
-            for _ in range(sizes_randint):
-                sizes_for_placement.append(size)
-
-        # Fill colors_for_placement list if amount of objects is greater than colors in the list.
-        # This happens if amount % color_groups != 0
-        while amount > len(sizes_for_placement):
-            sampled_color = sample(sizes, 1)[0]
-            sizes_for_placement.append(sampled_color)
+        sizes_for_placement = ObjectPropertyRandomization._expand_groups(
+            values=sizes, group_size=sizes_randint, amount=amount, rng=rng
+        )
 
         # Apply shuffling so that color and size is not synchronized
-        random.shuffle(sizes_for_placement)
-
-        return sizes_for_placement
+        return rng.permutation(sizes_for_placement, axis=0)
 
     @staticmethod
     def get_rgba_from_color_name(
@@ -176,47 +164,89 @@ class ObjectPropertyRandomization:
             raise ValueError(f"Invalid color name {color_name}.")
 
     @staticmethod
-    def get_size_array(size_value_range: tuple[float, float]) -> list[float]:
+    def get_size_array(
+        size_value_range: tuple[float, float],
+        rng: Union[np.random.Generator, None] = None,
+    ) -> list[float]:
         """Generates 3D random size in given range.
 
         Parameters:
             size_value_range (tuple[float, float]): Range of possible size values
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
 
         Returns:
             random_size (list[float]): Randomized size values in given range for 3D
         """
-        x_rand_size_float = float(
-            np.random.uniform(size_value_range[0], size_value_range[1])
-        )  # Higher is excluding
-        y_rand_size_float = float(
-            np.random.uniform(size_value_range[0], size_value_range[1])
-        )  # Higher is excluding
-        z_rand_size_float = float(
-            np.random.uniform(size_value_range[0], size_value_range[1])
-        )  # Higher is excluding
-        random_size = [x_rand_size_float, y_rand_size_float, z_rand_size_float]
+        rng = np.random.default_rng() if rng is None else rng
+        random_size = rng.uniform(
+            size_value_range[0], size_value_range[1], size=3
+        ).tolist()  # Higher is excluding
         return random_size
 
     @staticmethod
     def get_random_rotation(
-        amount: int, z_rotation_range: Union[tuple[int, int], None]
-    ) -> Union[list[float], None]:
+        amount: int,
+        z_rotation_range: Union[tuple[int, int], None],
+        rng: Union[np.random.Generator, None] = None,
+    ) -> Union[np.ndarray, None]:
         """Generate random number in z_rotation_range.
 
         Parameters:
             amount (int): Number of objects
             z_rotation_range (Union[tuple[int, int], None]): Range of degrees for randomization of z-axis
+            rng (Union[np.random.Generator, None]): Generator to draw samples from
 
         Returns:
-            z_rotations_for_placement (Union[list[float], None]): Random numbers in given range for z-axis rotation
+            z_rotations_for_placement (Union[np.ndarray, None]): Random numbers in given range for z-axis rotation
         """
         if z_rotation_range is None:
             return None
+        rng = np.random.default_rng() if rng is None else rng
 
-        z_rotations_for_placement = list()
-        for _ in range(amount):
-            z_rotation = np.random.uniform(
-                z_rotation_range[0], z_rotation_range[1]
-            )  # Higher is excluding
-            z_rotations_for_placement.append(z_rotation)
+        z_rotations_for_placement = rng.uniform(
+            z_rotation_range[0], z_rotation_range[1], size=amount
+        )  # Higher is excluding
         return z_rotations_for_placement
+
+    @staticmethod
+    def _sample_group_size(groups: tuple[int, int], rng: np.random.Generator) -> int:
+        """Samples the number of members per group from a group range.
+
+        Parameters:
+            groups (tuple[int, int]): Range of members per group
+            rng (np.random.Generator): Generator to draw samples from
+
+        Returns:
+            (int): Number of members per group
+        """
+        return (
+            int(groups[0])
+            if (groups[0] == groups[1])
+            else int(
+                rng.integers(int(groups[0]), int(groups[1]) + 1)
+            )  # Higher is excluding
+        )
+
+    @staticmethod
+    def _expand_groups(
+        values: np.ndarray, group_size: int, amount: int, rng: np.random.Generator
+    ) -> np.ndarray:
+        """Repeats every value for all members of its group and fills up the remaining objects
+        with randomly chosen values. This happens if amount % group_size != 0.
+
+        Parameters:
+            values (np.ndarray): Distinct values, one row per group
+            group_size (int): Number of members per group
+            amount (int): Number of objects
+            rng (np.random.Generator): Generator to draw samples from
+
+        Returns:
+            (np.ndarray): Array with one row per object
+        """
+        values_for_placement = np.repeat(values, group_size, axis=0)[:amount]
+        missing = amount - len(values_for_placement)
+        if missing > 0:
+            values_for_placement = np.concatenate(
+                [values_for_placement, values[rng.integers(len(values), size=missing)]]
+            )
+        return values_for_placement
@@ -0,0 +1,136 @@
+import os
+import json
+import logging
+import numpy as np
+from dm_control import mjcf
+from pitapy.base.world_sites.area import Area
+from pitapy.base.world_sites.environment import Environment
+
+
+class PlacementExporter:
+    """Exports the placements of all objects as a columnar binary file next to the json.
+
+    The placements are a structured numpy array with one row per object, saved as .npy so
+    it can be memory-mapped. Names, classes and sites are stored as string tables in a small
+    json file, the array references them by index. Missing values are NaN.
+    """
+
+    DTYPE = np.dtype(
+        [
+            ("object_id", np.int32),
+            ("class_id", np.int32),
+            ("site_id", np.int32),
+            ("position", np.float64, (3,)),
+            ("rotation", np.float64, (3,)),
+            ("rgba", np.float32, (4,)),
+            ("size", np.float64, (3,)),
+        ]
+    )
+
+    @staticmethod
+    def to_columns(
+        environment: Environment, areas: list[Area]
+    ) -> tuple[np.ndarray, dict[str, list[str]]]:
+        """Collects the placements of all objects of the given Environment and Area instances.
+        Objects are named by their xml id, which is unique within the world.
+
+        Parameters:
+            environment (Environment): Environment class instance
+            areas (list): List of Area class instances
+
+        Returns:
+            (tuple[np.ndarray, dict[str, list[str]]]): Placements and the string tables "names", "classes" and "sites"
+        """
+        objects = [
+            (mujoco_object.xml_id, "environment", mujoco_object)
+            for mujoco_object in environment.mujoco_objects.values()
+        ]
+        for area in areas:
+            objects += [
+                (mujoco_object.xml_id, area.name, mujoco_object)
+                for mujoco_object in area.mujoco_objects.values()
+            ]
+
+        tables = {
+            "names": [name for name, _, _ in objects],
+            "classes": [],
+            "sites": ["environment"] + [area.name for area in areas],
+        }
+        class_ids = {}
+        placements = np.zeros(len(objects), dtype=PlacementExporter.DTYPE)
+        for column in ("position", "rotation", "rgba", "size"):
+            placements[column] = np.nan
+        for index, (_, site_name, mujoco_object) in enumerate(objects):
+            if mujoco_object.obj_class not in class_ids:
+                class_ids[mujoco_object.obj_class] = len(tables["classes"])
+                tables["classes"].append(mujoco_object.obj_class)
+
+            # Sites move the rotation of objects with a free joint to the attachment frame
+            rotation = mjcf.get_attachment_frame(mujoco_object.mjcf_obj).euler
+            if rotation is None:
+                rotation = mujoco_object.rotation
+
+            placements["object_id"][index] = index
+            placements["class_id"][index] = class_ids[mujoco_object.obj_class]
+            placements["site_id"][index] = tables["sites"].index(site_name)
+            for column, values in (
+                ("position", mujoco_object.position),
+                ("rotation", rotation),
+                ("rgba", mujoco_object.color),
+                ("size", mujoco_object.size),
+            ):
+                # Sizes have one to three values depending on the geom type
+                if values is not None:
+                    placements[column][index, : len(values)] = values
+        return placements, tables
+
+    @staticmethod
+    def export(
+        export_path: str, placements: np.ndarray, tables: dict[str, list[str]]
+    ) -> list[str]:
+        """Writes the placements to '<export_path>_placements.npy' and the string tables to
+        '<export_path>_placements.json'. Both files are replaced atomically.
+
+        Parameters:
+            export_path (str): Path of the files to be exported, without file extension
+            placements (np.ndarray): Placements as returned by to_columns
+            tables (dict[str, list[str]]): String tables as returned by to_columns
+
+        Returns:
+            (list[str]): Paths of the written files
+        """
+        array_path = export_path + "_placements.npy"
+        tables_path = export_path + "_placements.json"
+        with open(array_path + ".tmp", "wb") as file:
+            np.save(file, placements, allow_pickle=False)
+        os.replace(array_path + ".tmp", array_path)
+        with open(tables_path + ".tmp", "w") as file:
+            json.dump(tables, file)
+        os.replace(tables_path + ".tmp", tables_path)
+        return [array_path, tables_path]
+
+    @staticmethod
+    def load(path: str) -> dict[str, np.ndarray]:
+        """Loads exported placements. The array is memory-mapped and every column is a view
+        into it, so nothing is copied or parsed until it is accessed.
+
+        Parameters:
+            path (str): Path of the .npy file or the export path it was written to
+
+        Returns:
+            (dict[str, np.ndarray]): Columns of the placements and the string tables "names", "classes" and "sites"
+        """
+        if not path.endswith(".npy"):
+            path = path + "_placements.npy"
+        tables_path = path[: -len(".npy")] + ".json"
+        if not os.path.isfile(path) or not os.path.isfile(tables_path):
+            logging.getLogger().error(f"Could not find placements in path '{path}'.")
+            raise ValueError(f"Could not find placements in path '{path}'.")
+
+        placements = np.load(path, mmap_mode="r", allow_pickle=False)
+        with open(tables_path) as file:
+            tables = json.load(file)
+        columns = {name: placements[name] for name in placements.dtype.names}
+        for name, table in tables.items():
+            columns[name] = np.array(table, dtype=str)
+        return columns
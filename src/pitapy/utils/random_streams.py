@@ -0,0 +1,74 @@
+import numpy as np
+from typing import Union
+
+
+class RandomStreams:
+    """Derives independent random number generators for the world, every site and every
+    object type from a single seed.
+
+    The streams form a tree spawned via numpy's SeedSequence: the root sequence spawns one
+    child for world-level draws (e.g. the environment size) and one child per site (environment
+    and areas in config order). Each site sequence in turn spawns one child per object type of
+    that site. Since no stream is shared, the result of a site or object type does not depend
+    on the order in which the other ones are generated.
+    """
+
+    def __init__(self, config: dict, random_seed: Union[int, None] = None):
+        """Constructor of the RandomStreams class.
+
+        Parameters:
+            config (dict): Configuration dictionary
+            random_seed (Union[int, None]): Root seed, fresh entropy is drawn from the OS if None
+        """
+        self._seed_sequence = np.random.SeedSequence(random_seed)
+
+        site_configs = {"Environment": config["Environment"]}
+        if config.get("Areas") is not None:
+            site_configs.update(config["Areas"])
+
+        world_sequence, *site_sequences = self._seed_sequence.spawn(
+            len(site_configs) + 1
+        )
+        self._world = np.random.default_rng(world_sequence)
+
+        self._streams: dict[tuple[str, str], np.random.Generator] = {}
+        for (site_name, site_config), site_sequence in zip(
+            site_configs.items(), site_sequences
+        ):
+            object_names = list((site_config.get("Objects") or {}).keys())
+            for object_name, object_sequence in zip(
+                object_names, site_sequence.spawn(len(object_names))
+            ):
+                self._streams[(site_name, object_name)] = np.random.default_rng(
+                    object_sequence
+                )
+
+    @property
+    def entropy(self) -> int:
+        """Get root entropy.
+
+        Returns:
+            entropy (int): Entropy of the root seed sequence, can be used as seed to reproduce a run
+        """
+        return self._seed_sequence.entropy
+
+    @property
+    def world(self) -> np.random.Generator:
+        """Get world stream.
+
+        Returns:
+            world (np.random.Generator): Generator for world-level draws (environment size)
+        """
+        return self._world
+
+    def get(self, site_name: str, object_name: str) -> np.random.Generator:
+        """Returns the stream of an object type in a site.
+
+        Parameters:
+            site_name (str): Name of the site (e.g. "Environment" or "Area1")
+            object_name (str): Name of the object type as given in the config
+
+        Returns:
+            (np.random.Generator): Generator used for all draws of this object type
+        """
+        return self._streams[(site_name, object_name)]
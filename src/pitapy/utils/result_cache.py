@@ -0,0 +1,200 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+from typing import Union
+from importlib import metadata
+
+from pitapy.utils.general_utils import Utils
+
+
+class ResultCache:
+    """Content-addressed cache of exported worlds with size-capped LRU eviction.
+
+    A world is keyed by the hash of its normalized config, its seed, the hashes of all asset
+    files in the xml directory and the installed pitapy version. Every entry is a directory
+    named by its key, holding the xml and json outputs. The modification time of an entry
+    marks its last use, the least recently used entries are evicted once the cache exceeds
+    its size.
+    """
+
+    # Name of the file in the cache directory that keeps the digests of the asset files
+    ASSET_HASHES_FILE = "asset_hashes.json"
+
+    # Digests of asset files by path, with the size and modification time they were computed for
+    _file_hashes: dict[str, tuple[int, int, str]] = {}
+
+    def __init__(self, cache_dir: str, max_size: int = 1 << 30):
+        """Constructor of the ResultCache class.
+
+        Parameters:
+            cache_dir (str): Directory of the cache
+            max_size (int): Maximal size of the cache in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def get_key(
+        config: dict,
+        random_seed: int,
+        xml_dir: str,
+        cache_dir: Union[str, None] = None,
+    ) -> str:
+        """Returns the cache key of a world.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            random_seed (int): Seed of the world
+            xml_dir (str): Folder where all xml files are located
+            cache_dir (Union[str, None]): Directory the digests of the asset files are kept in
+
+        Returns:
+            (str): Hex digest identifying the world
+        """
+        try:
+            version = metadata.version("pitapy")
+        except metadata.PackageNotFoundError:
+            version = "unknown"
+        return Utils.hash_config(
+            {
+                "config": Utils.hash_config(config),
+                "random_seed": random_seed,
+                "assets": ResultCache.hash_assets(xml_dir, cache_dir=cache_dir),
+                "version": version,
+            }
+        )
+
+    @staticmethod
+    def hash_assets(xml_dir: str, cache_dir: Union[str, None] = None) -> str:
+        """Returns a hash over the relative paths and contents of all files in the xml directory.
+        Files are only read again if their size or modification time changed. With a cache
+        directory, the digests of the files are kept in it, so new processes do not read
+        unchanged files either.
+
+        Parameters:
+            xml_dir (str): Folder where all xml files are located
+            cache_dir (Union[str, None]): Directory the digests of the asset files are kept in
+
+        Returns:
+            (str): Hex digest of the asset files
+        """
+        hashes_path = (
+            None
+            if cache_dir is None
+            else os.path.join(cache_dir, ResultCache.ASSET_HASHES_FILE)
+        )
+        if hashes_path is not None and os.path.isfile(hashes_path):
+            try:
+                with open(hashes_path) as file:
+                    for file_path, entry in json.load(file).items():
+                        ResultCache._file_hashes.setdefault(file_path, tuple(entry))
+            except (OSError, ValueError):
+                logging.getLogger().warning(
+                    f"Ignoring unreadable asset hashes in '{hashes_path}'."
+                )
+
+        file_paths = sorted(
+            os.path.join(root, file_name)
+            for root, _, file_names in os.walk(str(xml_dir))
+            for file_name in file_names
+        )
+        is_changed = False
+        sha256 = hashlib.sha256()
+        for file_path in file_paths:
+            stat = os.stat(file_path)
+            key = os.path.abspath(file_path)
+            entry = ResultCache._file_hashes.get(key)
+            if entry is None or entry[:2] != (stat.st_size, stat.st_mtime_ns):
+                with open(file_path, "rb") as file:
+                    entry = (
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        hashlib.sha256(file.read()).hexdigest(),
+                    )
+                ResultCache._file_hashes[key] = entry
+                is_changed = True
+            sha256.update(os.path.relpath(file_path, str(xml_dir)).encode())
+            sha256.update(bytes.fromhex(entry[2]))
+
+        if hashes_path is not None and is_changed:
+            # Written via a temporary file per process, so concurrent runs never see half a file
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{hashes_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as file:
+                json.dump(ResultCache._file_hashes, file)
+            os.replace(tmp_path, hashes_path)
+        return sha256.hexdigest()
+
+    def get(self, key: str, export_path: str) -> bool:
+        """Copies the cached outputs of a world to the export path, if present.
+
+        Parameters:
+            key (str): Cache key of the world
+            export_path (str): Path of the files to be exported, without file extension
+
+        Returns:
+            (bool): True on a cache hit
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        if not os.path.isdir(entry_dir):
+            return False
+        try:
+            for extension in (".xml", ".json"):
+                shutil.copyfile(
+                    os.path.join(entry_dir, "output" + extension),
+                    export_path + extension,
+                )
+            # Mark the entry as recently used
+            os.utime(entry_dir)
+        except FileNotFoundError:
+            # Another process evicted the entry in the meantime
+            return False
+        return True
+
+    def put(self, key: str, export_path: str) -> None:
+        """Stores the exported outputs of a world and evicts old entries if needed.
+
+        Parameters:
+            key (str): Cache key of the world
+            export_path (str): Path of the exported files, without file extension
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        if os.path.isdir(entry_dir):
+            return
+        # Fill a temporary directory first, so other processes never see half an entry
+        tmp_dir = f"{entry_dir}.{os.getpid()}.tmp"
+        os.makedirs(tmp_dir, exist_ok=True)
+        for extension in (".xml", ".json"):
+            shutil.copyfile(
+                export_path + extension, os.path.join(tmp_dir, "output" + extension)
+            )
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Another process stored the same world in the meantime
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until the cache fits its size."""
+        entries = []
+        for entry_name in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir, entry_name)
+            if not os.path.isdir(entry_dir) or entry_name.endswith(".tmp"):
+                continue
+            size = sum(
+                os.path.getsize(os.path.join(entry_dir, file_name))
+                for file_name in os.listdir(entry_dir)
+            )
+            entries.append((os.path.getmtime(entry_dir), size, entry_dir))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            logging.getLogger().info(f"Evicting cached world '{entry_dir}'")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
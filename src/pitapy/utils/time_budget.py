@@ -0,0 +1,74 @@
+import time
+import logging
+from typing import Union
+
+
+class TimeBudgetExceeded(RuntimeError):
+    """Raised by a placer when its time budget runs out before all objects are placed."""
+
+    def __init__(self, message: str, placed_mujoco_objects: list, amount: int):
+        """Constructor of the TimeBudgetExceeded class.
+
+        Parameters:
+            message (str): Error message
+            placed_mujoco_objects (list): Objects of the type that were placed before the budget ran out
+            amount (int): Number of objects of the type that should have been placed
+        """
+        super().__init__(message)
+        self.placed_mujoco_objects = placed_mujoco_objects
+        self.amount = amount
+
+
+class TimeBudget:
+    """Wall-clock budget with a deadline, optionally nested in the deadline of a parent budget."""
+
+    def __init__(
+        self,
+        seconds: Union[float, None] = None,
+        parent: Union["TimeBudget", None] = None,
+    ):
+        """Constructor of the TimeBudget class. The clock starts on construction.
+
+        Parameters:
+            seconds (Union[float, None]): Length of the budget in seconds, unlimited if None
+            parent (Union[TimeBudget, None]): Budget whose deadline is never exceeded
+        """
+        if seconds is not None and seconds <= 0:
+            logging.getLogger().error(f"Time budget must be positive, got '{seconds}'.")
+            raise ValueError(f"Time budget must be positive, got '{seconds}'.")
+        self.deadline = None if seconds is None else time.monotonic() + seconds
+        if parent is not None and parent.deadline is not None:
+            self.deadline = (
+                parent.deadline
+                if self.deadline is None
+                else min(self.deadline, parent.deadline)
+            )
+
+    def expired(self) -> bool:
+        """Returns whether the deadline has passed.
+
+        Returns:
+            (bool): True if the budget is used up, always False for unlimited budgets
+        """
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> Union[float, None]:
+        """Returns the seconds left until the deadline.
+
+        Returns:
+            (Union[float, None]): Seconds left (at least 0), None for unlimited budgets
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def sub(self, seconds: Union[float, None] = None) -> "TimeBudget":
+        """Starts a budget that ends after the given seconds, but not after this budget.
+
+        Parameters:
+            seconds (Union[float, None]): Length of the budget in seconds, unlimited if None
+
+        Returns:
+            (TimeBudget): Nested budget
+        """
+        return TimeBudget(seconds=seconds, parent=self)
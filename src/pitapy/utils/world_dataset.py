@@ -0,0 +1,302 @@
+import os
+import json
+import logging
+import numpy as np
+from pitapy.utils.placement_exporter import PlacementExporter
+
+
+class WorldDataset:
+    """Stores many worlds in a single directory of a few files instead of a directory per world.
+
+    The placements of all worlds are appended to 'placements.bin' as rows of the structured
+    array of the PlacementExporter, the xml and the string tables of every world to 'blobs.bin'.
+    'index.bin' holds one fixed-size record per world with the offsets into both files, so
+    world i is found in O(1) and read through memory maps. The dtype of the placements is kept
+    in 'header.npy'.
+
+    A world is committed by its index record, which is written after its data. Data left
+    behind by a crash without index record is cut off when the dataset is opened again.
+    """
+
+    INDEX_DTYPE = np.dtype(
+        [
+            ("placements_start", np.int64),
+            ("placements_count", np.int64),
+            ("blob_start", np.int64),
+            ("xml_length", np.int64),
+            ("tables_length", np.int64),
+            ("random_seed", np.int64),
+            ("config_hash", "S64"),
+            ("asset_hash", "S64"),
+        ]
+    )
+
+    def __init__(self, path: str, mode: str = "r"):
+        """Constructor of the WorldDataset class.
+
+        Parameters:
+            path (str): Directory of the dataset
+            mode (str): "r" to read, "a" to append to a new or existing dataset, "w" to start a new one
+        """
+        if mode not in ("r", "a", "w"):
+            logging.getLogger().error(
+                f"Mode '{mode}' of the dataset is invalid, use 'r', 'a' or 'w'."
+            )
+            raise ValueError(
+                f"Mode '{mode}' of the dataset is invalid, use 'r', 'a' or 'w'."
+            )
+        self.path = path
+        self.mode = mode
+        self._placements_path = os.path.join(path, "placements.bin")
+        self._blobs_path = os.path.join(path, "blobs.bin")
+        self._index_path = os.path.join(path, "index.bin")
+        self._header_path = os.path.join(path, "header.npy")
+        # Memory maps by file path, with the file size they were created for
+        self._maps: dict[str, tuple[int, np.ndarray]] = {}
+        # Config hash, seed and asset hash of the first worlds of the index, read by contains
+        self._keys: set[tuple[bytes, int, bytes]] = set()
+        self._keys_length = 0
+
+        if mode == "r" and not os.path.isfile(self._header_path):
+            logging.getLogger().error(f"Could not find dataset in path '{path}'.")
+            raise ValueError(f"Could not find dataset in path '{path}'.")
+        if mode == "w" or not os.path.isfile(self._header_path):
+            os.makedirs(path, exist_ok=True)
+            for file_path in (
+                self._placements_path,
+                self._blobs_path,
+                self._index_path,
+            ):
+                open(file_path, "wb").close()
+            np.save(
+                self._header_path,
+                np.empty(0, dtype=PlacementExporter.DTYPE),
+                allow_pickle=False,
+            )
+        self.dtype = np.load(self._header_path, allow_pickle=False).dtype
+        if mode != "r":
+            self._recover()
+        self._update_keys()
+
+    def __len__(self) -> int:
+        """Returns the number of committed worlds.
+
+        Returns:
+            (int): Number of worlds in the dataset
+        """
+        return os.path.getsize(self._index_path) // WorldDataset.INDEX_DTYPE.itemsize
+
+    def __getitem__(self, index: int) -> dict[str, np.ndarray]:
+        """Returns the placements of a world like pitapy.load_placements, as views into the
+        memory-mapped placements of the dataset.
+
+        Parameters:
+            index (int): Index of the world in the order it was appended
+
+        Returns:
+            (dict[str, np.ndarray]): Columns of the placements, the string tables and the "random_seed"
+        """
+        record = self._get_record(index)
+        start = record["placements_start"]
+        placements = self._get_map(self._placements_path, self.dtype)[
+            start : start + record["placements_count"]
+        ]
+        tables_start = record["blob_start"] + record["xml_length"]
+        tables = json.loads(
+            self._get_map(self._blobs_path, np.uint8)[
+                tables_start : tables_start + record["tables_length"]
+            ].tobytes()
+        )
+        columns = {name: placements[name] for name in placements.dtype.names}
+        for name, table in tables.items():
+            columns[name] = np.array(table, dtype=str)
+        columns["random_seed"] = int(record["random_seed"])
+        return columns
+
+    def get_xml(self, index: int) -> str:
+        """Returns the xml of a world.
+
+        Parameters:
+            index (int): Index of the world in the order it was appended
+
+        Returns:
+            (str): Cleaned xml string of the world
+        """
+        record = self._get_record(index)
+        start = record["blob_start"]
+        return (
+            self._get_map(self._blobs_path, np.uint8)[
+                start : start + record["xml_length"]
+            ]
+            .tobytes()
+            .decode("utf-8")
+        )
+
+    def contains(
+        self, config_hash: str, random_seed: int, asset_hash: str = ""
+    ) -> bool:
+        """Returns whether a world of the given config, seed and assets is in the dataset.
+
+        Parameters:
+            config_hash (str): Hash of the config (with overrides applied)
+            random_seed (int): Seed of the world
+            asset_hash (str): Hash of the asset files
+
+        Returns:
+            (bool): True if the world was appended
+        """
+        self._update_keys()
+        return (
+            config_hash.encode("ascii"),
+            int(random_seed),
+            asset_hash.encode("ascii"),
+        ) in self._keys
+
+    def append(
+        self,
+        placements: np.ndarray,
+        tables: dict[str, list[str]],
+        xml: str = "",
+        random_seed: int = -1,
+        config_hash: str = "",
+        asset_hash: str = "",
+    ) -> int:
+        """Appends a world to the dataset.
+
+        Parameters:
+            placements (np.ndarray): Placements as returned by PlacementExporter.to_columns
+            tables (dict[str, list[str]]): String tables as returned by PlacementExporter.to_columns
+            xml (str): Cleaned xml string of the world
+            random_seed (int): Seed of the world
+            config_hash (str): Hash of the config (with overrides applied)
+            asset_hash (str): Hash of the asset files
+
+        Returns:
+            (int): Index of the appended world
+        """
+        if self.mode == "r":
+            logging.getLogger().error(
+                f"Dataset in path '{self.path}' is opened for reading."
+            )
+            raise RuntimeError(f"Dataset in path '{self.path}' is opened for reading.")
+        xml_bytes = xml.encode("utf-8")
+        tables_bytes = json.dumps(tables).encode("utf-8")
+
+        record = np.zeros(1, dtype=WorldDataset.INDEX_DTYPE)
+        record["placements_start"] = (
+            os.path.getsize(self._placements_path) // self.dtype.itemsize
+        )
+        record["placements_count"] = len(placements)
+        record["blob_start"] = os.path.getsize(self._blobs_path)
+        record["xml_length"] = len(xml_bytes)
+        record["tables_length"] = len(tables_bytes)
+        record["random_seed"] = random_seed
+        record["config_hash"] = config_hash.encode("ascii")
+        record["asset_hash"] = asset_hash.encode("ascii")
+
+        # The data is synced before the index record that commits it
+        WorldDataset._write(
+            self._placements_path, placements.astype(self.dtype).tobytes()
+        )
+        WorldDataset._write(self._blobs_path, xml_bytes + tables_bytes)
+        WorldDataset._write(self._index_path, record.tobytes())
+        return len(self) - 1
+
+    def _update_keys(self) -> None:
+        """Adds the config hash and seed of the worlds appended since the last update, so
+        the index is read once instead of on every call of contains."""
+        length = len(self)
+        if length > self._keys_length:
+            index = self._get_map(self._index_path, WorldDataset.INDEX_DTYPE)
+            records = index[self._keys_length : length]
+            self._keys.update(
+                zip(
+                    records["config_hash"].tolist(),
+                    records["random_seed"].tolist(),
+                    records["asset_hash"].tolist(),
+                )
+            )
+            self._keys_length = length
+
+    def _get_record(self, index: int) -> np.void:
+        """Returns the index record of a world.
+
+        Parameters:
+            index (int): Index of the world, negative indices count from the end
+
+        Returns:
+            (np.void): Index record of the world
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(
+                f"World {index} is out of range of the dataset with {length} worlds."
+            )
+        return self._get_map(self._index_path, WorldDataset.INDEX_DTYPE)[index]
+
+    def _get_map(self, file_path: str, dtype: np.dtype) -> np.ndarray:
+        """Returns a read-only memory map of a file, mapped again once the file has grown.
+
+        Parameters:
+            file_path (str): Path of the file
+            dtype (np.dtype): Dtype of the records in the file
+
+        Returns:
+            (np.ndarray): Records of the file
+        """
+        size = os.path.getsize(file_path)
+        if file_path not in self._maps or self._maps[file_path][0] != size:
+            length = size // np.dtype(dtype).itemsize
+            # Empty files cannot be memory-mapped
+            records = (
+                np.memmap(file_path, dtype=dtype, mode="r", shape=(length,))
+                if length
+                else np.empty(0, dtype=dtype)
+            )
+            self._maps[file_path] = (size, records)
+        return self._maps[file_path][1]
+
+    def _recover(self) -> None:
+        """Cuts off a partially written index record and all data that no record commits."""
+        length = len(self)
+        self._truncate(self._index_path, length * WorldDataset.INDEX_DTYPE.itemsize)
+        placements_end, blobs_end = 0, 0
+        if length:
+            record = self._get_record(length - 1)
+            placements_end = (
+                record["placements_start"] + record["placements_count"]
+            ) * self.dtype.itemsize
+            blobs_end = (
+                record["blob_start"] + record["xml_length"] + record["tables_length"]
+            )
+        self._truncate(self._placements_path, int(placements_end))
+        self._truncate(self._blobs_path, int(blobs_end))
+
+    @staticmethod
+    def _truncate(file_path: str, size: int) -> None:
+        """Truncates a file to the given size if it is longer.
+
+        Parameters:
+            file_path (str): Path of the file
+            size (int): Size in bytes
+        """
+        if os.path.getsize(file_path) > size:
+            logging.getLogger().warning(
+                f"Cutting off data of an interrupted write in '{file_path}'."
+            )
+            os.truncate(file_path, size)
+
+    @staticmethod
+    def _write(file_path: str, content: bytes) -> None:
+        """Appends bytes to a file and syncs it to disk.
+
+        Parameters:
+            file_path (str): Path of the file
+            content (bytes): Bytes to append
+        """
+        with open(file_path, "ab") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
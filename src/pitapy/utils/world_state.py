@@ -0,0 +1,106 @@
+import os
+import copy
+import json
+import logging
+from typing import Union
+
+from pitapy.utils.general_utils import Utils
+from pitapy.utils.result_cache import ResultCache
+
+
+class WorldState:
+    """Exports the placement state of a world next to its outputs, so that a later run can
+    restore the sites whose config did not change and only place the changed ones again.
+
+    Every site (environment and areas) is hashed by its objects config. Everything else
+    (environment size, borders, rules, the layout of the areas), the seed and the assets
+    form the hash of the world; if it changed, the whole world is generated again.
+    """
+
+    @staticmethod
+    def get_site_hashes(config: dict, random_seed: int, xml_dir: str) -> dict[str, str]:
+        """Returns the hash of the world and of the objects config of every site.
+
+        Parameters:
+            config (dict): Dictionary of user defined configurations
+            random_seed (int): Seed of the world
+            xml_dir (str): Folder where all xml files are located
+
+        Returns:
+            site_hashes (dict[str, str]): Hashes keyed by "World", "Environment" and the area names
+        """
+        world_config = copy.deepcopy(config)
+        site_hashes = {
+            "Environment": Utils.hash_config(
+                {"Objects": world_config["Environment"].pop("Objects", None)}
+            )
+        }
+        for area_name, area_config in (world_config.get("Areas") or {}).items():
+            site_hashes[area_name] = Utils.hash_config(
+                {"Objects": area_config.pop("Objects", None)}
+            )
+        site_hashes["World"] = Utils.hash_config(
+            {
+                "config": world_config,
+                "random_seed": random_seed,
+                "assets": ResultCache.hash_assets(xml_dir),
+            }
+        )
+        return site_hashes
+
+    @staticmethod
+    def export(
+        export_path: str, site_hashes: dict[str, str], placements: list[dict]
+    ) -> None:
+        """Exports the state of a world to '<export_path>.state.json'.
+
+        Parameters:
+            export_path (str): Path of the exported world, without file extension
+            site_hashes (dict[str, str]): Hashes as returned by get_site_hashes
+            placements (list[dict]): Placements as returned by ObjectPlacer.get_state
+        """
+        with open(export_path + ".state.json", "w") as file:
+            json.dump({"site_hashes": site_hashes, "placements": placements}, file)
+
+    @staticmethod
+    def get_reusable_placements(
+        export_path: str, site_hashes: dict[str, str]
+    ) -> Union[list[dict], None]:
+        """Returns the exported placements of all sites whose config did not change.
+
+        Parameters:
+            export_path (str): Path of the exported world, without file extension
+            site_hashes (dict[str, str]): Hashes of the current run as returned by get_site_hashes
+
+        Returns:
+            (Union[list[dict], None]): Reusable placements, None if the world has to be generated completely
+        """
+        logger = logging.getLogger()
+        state_path = export_path + ".state.json"
+        if not os.path.isfile(state_path):
+            logger.info("No previous state found, generating the whole world.")
+            return None
+        with open(state_path, "r") as file:
+            state = json.load(file)
+
+        previous_hashes = state["site_hashes"]
+        if previous_hashes.get("World") != site_hashes["World"]:
+            logger.info(
+                "Seed, assets or environment settings changed, generating the whole world."
+            )
+            return None
+
+        unchanged_sites = {
+            site_key
+            for site_key, site_hash in site_hashes.items()
+            if previous_hashes.get(site_key) == site_hash
+        }
+        logger.info(
+            "Regenerating site(s) "
+            f"{sorted(set(site_hashes) - unchanged_sites)}, reusing the others."
+        )
+        return [
+            placement
+            for placement in state["placements"]
+            if placement["site_key"] in unchanged_sites
+        ]
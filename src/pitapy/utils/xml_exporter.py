@@ -1,15 +1,125 @@
+import os
 import re
 import xml
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from importlib_resources import files
+from typing import Union
+from pitapy.base.world_sites.area import Area
+from pitapy.base.world_sites.environment import Environment
 
 
 class XMLExporter:
     """Exports all object information to a JSON file."""
 
+    # Sections whose elements belong to single objects and move with them in split exports
+    SPLIT_SECTIONS = (
+        "worldbody",
+        "actuator",
+        "sensor",
+        "contact",
+        "equality",
+        "tendon",
+    )
+
     @staticmethod
     def to_xml(xml_string: str, export_path: str) -> None:
         """Clean mjcf changes on a given xml string and export it to an .xml file.
+
+        Parameters:
+            xml_string (str): String representation of the environment mjcf model
+            export_path (str): Path of the file to be exported
+        """
+        with open(export_path + ".xml", "w") as f:
+            f.write(XMLExporter.clean_xml(xml_string=xml_string))
+
+    @staticmethod
+    def to_split_xml(
+        xml_string: str,
+        export_path: str,
+        environment: Environment,
+        areas: list[Area],
+        max_workers: Union[int, None] = None,
+    ) -> list[str]:
+        """Clean mjcf changes on a given xml string and export it split by sites. The root
+        file holds the shared parts (defaults, assets, lights, the base plane) and includes one
+        file per area and one for the objects of the environment, which are written concurrently.
+
+        Parameters:
+            xml_string (str): String representation of the environment mjcf model
+            export_path (str): Path of the root file to be exported, the site files are named after it
+            environment (Environment): Environment class instance
+            areas (list[Area]): List of Area class instances
+            max_workers (Union[int, None]): Number of threads writing the site files
+
+        Returns:
+            (list[str]): Paths of the exported site files
+        """
+        root = ET.fromstring(XMLExporter.clean_xml(xml_string=xml_string))
+        sites = {"environment": environment, **{area.name: area for area in areas}}
+        # Mjcf prefixes all elements of an attached object with the model name of the object
+        owners = {
+            mujoco_object.mjcf_obj.model: site_name
+            for site_name, site in sites.items()
+            for mujoco_object in site.mujoco_objects.values()
+        }
+        fragments = {
+            site_name: ET.Element("mujoco", model=site_name) for site_name in sites
+        }
+        for section in root:
+            if section.tag not in XMLExporter.SPLIT_SECTIONS:
+                continue
+            for element in list(section):
+                site_name = owners.get(XMLExporter._get_model_name(element))
+                if site_name is None:
+                    continue
+                fragment_section = fragments[site_name].find(section.tag)
+                if fragment_section is None:
+                    fragment_section = ET.SubElement(fragments[site_name], section.tag)
+                section.remove(element)
+                fragment_section.append(element)
+        for section in list(root):
+            if section.tag in XMLExporter.SPLIT_SECTIONS and len(section) == 0:
+                root.remove(section)
+
+        # Included files are resolved relative to the root file
+        site_paths = [f"{export_path}_{site_name}.xml" for site_name in fragments]
+        for site_path in site_paths:
+            ET.SubElement(root, "include", file=os.path.basename(site_path))
+
+        def write(path: str, element: ET.Element) -> None:
+            with open(path, "w") as f:
+                f.write(ET.tostring(element, encoding="unicode"))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(write, site_path, fragment)
+                for site_path, fragment in zip(site_paths, fragments.values())
+            ]
+            futures.append(executor.submit(write, export_path + ".xml", root))
+            for future in futures:
+                future.result()
+        return site_paths
+
+    @staticmethod
+    def _get_model_name(element: ET.Element) -> Union[str, None]:
+        """Get the model name of the attached object an element belongs to.
+
+        Parameters:
+            element (ET.Element): Element of a top-level section
+
+        Returns:
+            (Union[str, None]): Model name or None if the element is not part of an attached object
+        """
+        for attribute in ("name", "class", "childclass"):
+            value = element.get(attribute)
+            if value is not None and "/" in value:
+                return value.split("/")[0]
+        return None
+
+    @staticmethod
+    def clean_xml(xml_string: str) -> str:
+        """Clean mjcf changes on a given xml string.
         The mjcf library creates a new asset for each object of type mesh that
         is attached and assigns an internal filename. This function bundles these
         assets to categories and removes duplicates. The names for meshes and
@@ -17,7 +127,9 @@ class XMLExporter:
 
         Parameters:
             xml_string (str): String representation of the environment mjcf model
-            export_path (str): Path of the file to be exported
+
+        Returns:
+            (str): Cleaned xml string
         """
         root = ET.fromstring(xml_string)
         asset = root.find("asset")
@@ -50,8 +162,65 @@ class XMLExporter:
             XMLExporter.apply_new_names_to_geoms(material_names, mesh_names, root)
 
         # Serialize XML
-        with open(export_path + ".xml", "w") as f:
-            f.write(ET.tostring(root, encoding="unicode"))
+        return ET.tostring(root, encoding="unicode")
+
+    @staticmethod
+    def split_assets(xml_string: str) -> tuple[str, list[ET.Element]]:
+        """Clean mjcf changes on a given xml string and split off its assets. The remaining
+        xml can be included into a root xml that holds the assets of all included files
+        (see to_root_xml), as assets of the same name must not be defined twice.
+
+        Parameters:
+            xml_string (str): String representation of a mjcf model
+
+        Returns:
+            (tuple[str, list[ET.Element]]): Cleaned xml string without assets and the removed assets
+        """
+        root = ET.fromstring(XMLExporter.clean_xml(xml_string=xml_string))
+        asset = root.find("asset")
+        assets = []
+        if asset is not None:
+            assets = list(asset)
+            root.remove(asset)
+
+        # Mjcf names the main default class of every model "/", which may only be defined once.
+        # An empty main class is dropped together with all references to it.
+        default = root.find("default")
+        main_class = None if default is None else default.find("default[@class='/']")
+        if main_class is not None and len(main_class) == 0:
+            default.remove(main_class)
+            for element in root.iter():
+                if element.get("class") == "/":
+                    del element.attrib["class"]
+        return ET.tostring(root, encoding="unicode"), assets
+
+    @staticmethod
+    def to_root_xml(
+        xml_string: str, assets: list[ET.Element], include_files: list[str]
+    ) -> str:
+        """Clean mjcf changes on the xml string of a root model and add the assets and
+        includes of the files split off by split_assets. Assets are added once per name.
+
+        Parameters:
+            xml_string (str): String representation of the root mjcf model
+            assets (list[ET.Element]): Assets of the included files
+            include_files (list[str]): Paths of the included files, relative to the root xml
+
+        Returns:
+            (str): Cleaned xml string of the root model
+        """
+        root = ET.fromstring(XMLExporter.clean_xml(xml_string=xml_string))
+        asset = root.find("asset")
+        if asset is None:
+            asset = ET.SubElement(root, "asset")
+        names = {(element.tag, element.get("name")) for element in asset}
+        for element in assets:
+            if (element.tag, element.get("name")) not in names:
+                names.add((element.tag, element.get("name")))
+                asset.append(element)
+        for include_file in include_files:
+            ET.SubElement(root, "include", file=include_file)
+        return ET.tostring(root, encoding="unicode")
 
     @staticmethod
     def remove_duplicate_assets_fix_paths(
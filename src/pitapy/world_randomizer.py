@@ -0,0 +1,282 @@
+import mujoco
+import numpy as np
+from typing import Any, Union
+from dm_control import mjcf
+
+from pitapy.utils.general_utils import Utils
+from pitapy.utils.random_streams import RandomStreams
+from pitapy.utils.generation_worker import GenerationWorker
+from pitapy.base.asset_placement.validator import Validator
+from pitapy.base.asset_parsing.mujoco_object import MujocoObject
+from pitapy.base.asset_placement.rules.min_distance_rule import MinDistanceRule
+from pitapy.base.asset_placement.placer.object_placer import ObjectPlacer
+from pitapy.base.asset_placement.placer.random_placer import RandomPlacer
+from pitapy.base.asset_placement.rules.min_distance_mujoco_physics_rule import (
+    MinDistanceMujocoPhysicsRule,
+)
+from pitapy.utils.object_property_randomization import (
+    ObjectPropertyRandomization,
+)
+
+
+class WorldRandomizer:
+    """Assembles and compiles a world once and re-randomizes it in place.
+
+    On every call of randomize, the positions (of randomly placed objects), z-rotations,
+    colors and sizes of the existing objects are sampled again with the settings of the
+    config and written straight into the arrays of the compiled mujoco model. No new mjcf
+    model is assembled and nothing is recompiled. The number of objects and the assets
+    drawn from asset pools stay the same as in the initial world.
+
+    Placements are validated on the 2d representation only, i.e. the MinAllDistance rule
+    is checked as point distance (MinDistanceRule) instead of with the mujoco physics.
+    """
+
+    def __init__(
+        self,
+        config: Union[str, dict],
+        random_seed: Union[int, None] = None,
+        xml_dir: Union[str, None] = None,
+        overrides: Union[dict[str, Any], None] = None,
+    ):
+        """Constructor of the WorldRandomizer class.
+
+        Parameters:
+            config (Union[str, dict]): Path to the yaml config or the config itself
+            random_seed (Union[int, None]): Seed of the initial world
+            xml_dir (Union[str, None]): Folder where all xml files are located
+            overrides (Union[dict[str, Any], None]): Dotted config paths mapped to new values
+        """
+        self.config = GenerationWorker.load_config(config=config, overrides=overrides)
+        random_seed = Utils.resolve_random_seed(
+            random_seed=random_seed, config=self.config
+        )
+        assembler = GenerationWorker.get_assembler(
+            config=self.config, xml_dir=GenerationWorker.get_xml_dir(xml_dir)
+        )
+        self.environment, self.areas = assembler.assemble_world(random_seed=random_seed)
+        self._placements = assembler.placements
+        self._site_rules = list(
+            assembler.rule_assembler.assemble_site_rules_pairs(
+                self.environment.size
+            ).values()
+        )
+        self.physics = mjcf.Physics.from_mjcf_model(self.environment.mjcf_model)
+        # Sizes and bounding volumes of the geoms as compiled from the initial world
+        self._compiled_geom_size = self.model.geom_size.copy()
+        self._compiled_geom_rbound = self.model.geom_rbound.copy()
+        self._compiled_geom_aabb = self.model.geom_aabb.copy()
+
+    @property
+    def model(self) -> mujoco.MjModel:
+        """Get compiled model.
+
+        Returns:
+            model (mujoco.MjModel): Compiled model of the world, updated in place by randomize
+        """
+        return self.physics.model.ptr
+
+    def randomize(self, random_seed: Union[int, None] = None) -> None:
+        """Samples new properties for all objects and writes them into the compiled model.
+        The data of the physics is reset afterward, a separately created mujoco.MjData has
+        to be reset with mujoco.mj_resetData.
+
+        Parameters:
+            random_seed (Union[int, None]): Root seed of the random streams, fresh entropy if None
+        """
+        random_streams = RandomStreams(self.config, random_seed=random_seed)
+        validators = self._create_validators()
+
+        for placement in self._placements:
+            site = placement["site"]
+            placer_params = placement["placer_params"]
+            mujoco_objects = placement["mujoco_objects"]
+            site_validators = [
+                validators[index] for index in placement["validator_indices"]
+            ]
+            rng = random_streams.get(
+                ObjectPlacer._get_site_key(site), placement["object_name"]
+            )
+
+            colors_for_placement = ObjectPropertyRandomization.get_random_colors(
+                amount=len(mujoco_objects),
+                color_groups=placer_params["color_groups"],
+                rng=rng,
+            )
+            sizes_for_placement = ObjectPropertyRandomization.get_random_sizes(
+                amount=len(mujoco_objects),
+                size_groups=placer_params["size_groups"],
+                size_value_range=placer_params["size_value_range"],
+                rng=rng,
+            )
+            z_rotation_for_placement = ObjectPropertyRandomization.get_random_rotation(
+                amount=len(mujoco_objects),
+                z_rotation_range=placer_params["z_rotation_range"],
+                rng=rng,
+            )
+            if not placement["is_fixed"]:
+                distribution_class, distr_parameters = RandomPlacer._get_distribution(
+                    distribution_config=placer_params["distribution"], site=site
+                )
+
+            for i, mujoco_object in enumerate(mujoco_objects):
+                if colors_for_placement is not None:
+                    mujoco_object.color = colors_for_placement[i]
+                if sizes_for_placement is not None:
+                    mujoco_object.size = sizes_for_placement[i]
+                if z_rotation_for_placement is not None:
+                    self._set_z_rotation(mujoco_object, z_rotation_for_placement[i])
+
+                if not placement["is_fixed"]:
+                    if not RandomPlacer.sample_valid_position(
+                        site=site,
+                        mujoco_object=mujoco_object,
+                        validators=site_validators,
+                        distribution_class=distribution_class,
+                        distr_parameters=distr_parameters,
+                        rng=rng,
+                    ):
+                        RandomPlacer.raise_placement_error(
+                            mujoco_object=mujoco_object, site=site
+                        )
+                for validator in site_validators:
+                    validator.add(mujoco_object)
+
+                self._write_to_model(
+                    mujoco_object,
+                    write_color=colors_for_placement is not None,
+                    write_size=sizes_for_placement is not None,
+                )
+
+        self.physics.reset()
+
+    def _create_validators(self) -> list[Validator]:
+        """Creates validators with the 2d counterparts of the site rules and adds the borders.
+
+        Returns:
+            validators (list[Validator]): One validator per site, in the order of the assembler
+        """
+        validators = []
+        for rules in self._site_rules:
+            validators.append(
+                Validator(
+                    [
+                        MinDistanceRule(dist=rule.distance)
+                        if isinstance(rule, MinDistanceMujocoPhysicsRule)
+                        else rule
+                        for rule in rules
+                    ]
+                )
+            )
+
+        border_config_dict = {
+            k: v
+            for dict_ in self.config["Environment"]["Borders"]
+            for k, v in dict_.items()
+        }
+        if border_config_dict["place"]:
+            validators[0].map_2D["Border"] = [
+                ObjectPlacer.get_border_shape(self.environment)
+            ]
+        return validators
+
+    def _set_z_rotation(self, mujoco_object: MujocoObject, z_rotation: float) -> None:
+        """Sets the z-rotation of an object. Objects with a free joint are rotated by their
+        attachment frame (see Environment.add).
+
+        Parameters:
+            mujoco_object (MujocoObject): Placed mujoco object
+            z_rotation (float): Rotation around the z-axis in degrees
+        """
+        if self._has_free_joint(mujoco_object):
+            element = mjcf.get_attachment_frame(mujoco_object.mjcf_obj)
+        else:
+            element = mujoco_object.mjcf_obj.find("body", mujoco_object.name.lower())
+        if element.euler is None:
+            element.euler = [0, 0, z_rotation]
+        else:
+            element.euler = [element.euler[0], element.euler[1], z_rotation]
+
+    def _has_free_joint(self, mujoco_object: MujocoObject) -> bool:
+        """Returns whether the attachment frame of an object has a free joint.
+
+        Parameters:
+            mujoco_object (MujocoObject): Placed mujoco object
+
+        Returns:
+            (bool): True if the object is attached with a free joint
+        """
+        frame_id = self.model.body_parentid[self._get_body_id(mujoco_object)]
+        joint_id = self.model.body_jntadr[frame_id]
+        return (
+            joint_id >= 0
+            and self.model.jnt_type[joint_id] == mujoco.mjtJoint.mjJNT_FREE
+        )
+
+    def _get_body_id(self, mujoco_object: MujocoObject) -> int:
+        """Returns the id of the body of an object in the compiled model.
+
+        Parameters:
+            mujoco_object (MujocoObject): Placed mujoco object
+
+        Returns:
+            (int): Body id
+        """
+        return self.model.body(mujoco_object.xml_id).id
+
+    def _write_to_model(
+        self, mujoco_object: MujocoObject, write_color: bool, write_size: bool
+    ) -> None:
+        """Writes position, rotation, color and size of an object into the compiled model.
+
+        Parameters:
+            mujoco_object (MujocoObject): Placed mujoco object
+            write_color (bool): True if the color of the object was sampled
+            write_size (bool): True if the size of the object was sampled
+        """
+        model = self.model
+        body_id = self._get_body_id(mujoco_object)
+        geom_id = model.body_geomadr[body_id]
+        model.body_pos[body_id] = mujoco_object.position
+
+        if self._has_free_joint(mujoco_object):
+            # The rotation is kept by the attachment frame and the initial state of its free joint
+            frame_id = model.body_parentid[body_id]
+            euler = mjcf.get_attachment_frame(mujoco_object.mjcf_obj).euler
+            if euler is not None:
+                mujoco.mju_euler2Quat(
+                    model.body_quat[frame_id], np.deg2rad(euler), "xyz"
+                )
+                qpos_address = model.jnt_qposadr[model.body_jntadr[frame_id]]
+                model.qpos0[qpos_address + 3 : qpos_address + 7] = model.body_quat[
+                    frame_id
+                ]
+        elif mujoco_object.rotation is not None:
+            mujoco.mju_euler2Quat(
+                model.body_quat[body_id], np.deg2rad(mujoco_object.rotation), "xyz"
+            )
+
+        if geom_id < 0:
+            return
+        if write_color and mujoco_object.color is not None:
+            model.geom_rgba[geom_id] = mujoco_object.color
+        # Mujoco derives the size of mesh geoms from the mesh and ignores their size
+        if (
+            write_size
+            and mujoco_object.size is not None
+            and model.geom_type[geom_id] != mujoco.mjtGeom.mjGEOM_MESH
+        ):
+            size = np.asarray(mujoco_object.size, dtype=float)
+            model.geom_size[geom_id, : len(size)] = size
+            compiled_size = self._compiled_geom_size[geom_id, : len(size)]
+            if np.any(compiled_size > 0):
+                # The bounding volumes of the broadphase grow with the size, but never shrink
+                # below the compiled ones, so no contact is missed
+                scale = max(
+                    1.0,
+                    np.max(size[compiled_size > 0] / compiled_size[compiled_size > 0]),
+                )
+                model.geom_rbound[geom_id] = self._compiled_geom_rbound[geom_id] * scale
+                model.geom_aabb[geom_id, 3:] = (
+                    self._compiled_geom_aabb[geom_id, 3:] * scale
+                )
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import multiprocessing
+from collections import deque
+from typing import Any, AsyncIterator, Iterable, Iterator, Union
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from pitapy.utils.generation_worker import GenerationWorker
+
+
+class WorldStream:
+    """Generates worlds on background processes and yields them in seed order.
+
+    While a consumer (e.g. the reset of a reinforcement learning environment) works on a
+    world, the next worlds are already generated. At most workers + prefetch worlds are
+    generated or buffered at once, so an infinite iterable of seeds can be used.
+
+    Example:
+        with WorldStream(config="config.yml", seeds=itertools.count(), workers=4) as stream:
+            for world in stream:
+                model = mujoco.MjModel.from_xml_string(world["xml"])
+    """
+
+    def __init__(
+        self,
+        config: Union[str, dict],
+        seeds: Iterable[int],
+        workers: int = 1,
+        prefetch: int = 2,
+        overrides: Union[dict[str, Any], None] = None,
+        xml_dir: Union[str, None] = None,
+    ):
+        """Constructor of the WorldStream class.
+
+        Parameters:
+            config (Union[str, dict]): Path to the yaml config or the config itself
+            seeds (Iterable[int]): Seeds of the worlds, may be infinite
+            workers (int): Number of worker processes
+            prefetch (int): Number of finished worlds buffered in addition to the ones being generated
+            overrides (Union[dict[str, Any], None]): Dotted config paths mapped to new values
+            xml_dir (Union[str, None]): Folder where all xml files are located
+        """
+        if workers < 1 or prefetch < 0:
+            logging.getLogger().error(
+                f"Invalid stream size with workers={workers} and prefetch={prefetch}."
+            )
+            raise ValueError("workers must be at least 1 and prefetch not negative.")
+        self.config = config
+        self.overrides = overrides
+        self.xml_dir = xml_dir
+        self.max_pending = workers + prefetch
+        self._seeds = iter(seeds)
+        self._pending: deque[Future] = deque()
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=GenerationWorker.warm_up,
+            initargs=(config if isinstance(config, str) else None, xml_dir),
+        )
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yields the generated worlds in seed order.
+
+        Returns:
+            (Iterator[dict]): Worlds with "random_seed", "xml" and "placements"
+        """
+        while True:
+            self._fill()
+            if not self._pending:
+                return
+            yield self._pending.popleft().result()
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """Yields the generated worlds in seed order without blocking the event loop.
+
+        Returns:
+            (AsyncIterator[dict]): Worlds with "random_seed", "xml" and "placements"
+        """
+        while True:
+            self._fill()
+            if not self._pending:
+                return
+            yield await asyncio.wrap_future(self._pending.popleft())
+
+    def __enter__(self) -> "WorldStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the worker processes and discards all worlds that were not consumed."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+
+    def _fill(self) -> None:
+        """Submits the next seeds until the buffer is full or the seeds are exhausted."""
+        while len(self._pending) < self.max_pending:
+            random_seed = next(self._seeds, None)
+            if random_seed is None:
+                return
+            self._pending.append(
+                self._executor.submit(
+                    GenerationWorker.generate,
+                    config=self.config,
+                    random_seed=int(random_seed),
+                    overrides=self.overrides,
+                    xml_dir=self.xml_dir,
+                )
+            )
@@ -0,0 +1,12 @@
+import pytest
+from importlib_resources import files
+
+
+@pytest.fixture
+def config_dir() -> str:
+    return str(files("pitapy.examples").joinpath("config_files"))
+
+
+@pytest.fixture
+def xml_dir() -> str:
+    return str(files("pitapy.examples").joinpath("xml_objects"))
@@ -0,0 +1,110 @@
+import os
+import re
+from pitapy.sweep import Sweep
+from pitapy.utils.build_manifest import BuildManifest
+
+
+def write_outputs(export_path: str, content: str) -> list[str]:
+    os.makedirs(os.path.dirname(export_path), exist_ok=True)
+    file_paths = [export_path + ".xml", export_path + ".json"]
+    for file_path in file_paths:
+        BuildManifest.write_atomic(file_path, content)
+    return file_paths
+
+
+def test_resume_skips_recorded_worlds(tmp_path):
+    path = str(tmp_path / "manifest.jsonl")
+    export_path = str(tmp_path / "seed_0" / "output")
+    manifest = BuildManifest(path)
+    manifest.record(export_path, "config", "assets", 0, write_outputs(export_path, "a"))
+
+    resumed = BuildManifest(path)
+    assert len(resumed) == 1
+    assert resumed.is_complete(export_path, "config", "assets", 0)
+    assert not resumed.is_complete(export_path, "config", "assets", 1)
+    assert not resumed.is_complete(export_path, "other config", "assets", 0)
+    assert not resumed.is_complete(export_path, "config", "changed assets", 0)
+    assert not resumed.is_complete(str(tmp_path / "moved"), "config", "assets", 0)
+
+
+def test_missing_or_corrupt_outputs_are_incomplete(tmp_path):
+    manifest = BuildManifest(str(tmp_path / "manifest.jsonl"))
+    export_path = str(tmp_path / "output")
+    manifest.record(export_path, "config", "assets", 0, write_outputs(export_path, "a"))
+
+    with open(export_path + ".json", "w") as file:
+        file.write("b")
+    assert not manifest.is_complete(export_path, "config", "assets", 0)
+    os.remove(export_path + ".json")
+    assert not manifest.is_complete(export_path, "config", "assets", 0)
+
+
+def test_truncated_last_line_is_skipped(tmp_path):
+    path = str(tmp_path / "manifest.jsonl")
+    first, second = str(tmp_path / "first"), str(tmp_path / "second")
+    manifest = BuildManifest(path)
+    manifest.record(first, "config", "assets", 0, write_outputs(first, "a"))
+    manifest.record(second, "config", "assets", 1, write_outputs(second, "b"))
+    with open(path) as file:
+        content = file.read()
+    with open(path, "w") as file:
+        file.write(content[: -len(content.split("\n")[1]) // 2])
+
+    resumed = BuildManifest(path)
+    assert resumed.is_complete(first, "config", "assets", 0)
+    assert not resumed.is_complete(second, "config", "assets", 1)
+
+    # A new record starts on its own line after the truncated one
+    resumed.record(second, "config", "assets", 1, write_outputs(second, "b"))
+    assert BuildManifest(path).is_complete(second, "config", "assets", 1)
+
+
+def test_latest_record_of_an_export_path_counts(tmp_path):
+    path = str(tmp_path / "manifest.jsonl")
+    export_path = str(tmp_path / "output")
+    manifest = BuildManifest(path)
+    manifest.record(export_path, "first", "assets", 0, write_outputs(export_path, "a"))
+    manifest.record(export_path, "second", "assets", 0, write_outputs(export_path, "b"))
+
+    resumed = BuildManifest(path)
+    assert not resumed.is_complete(export_path, "first", "assets", 0)
+    assert resumed.is_complete(export_path, "second", "assets", 0)
+
+
+def get_modification_times(export_dir: str) -> dict[str, int]:
+    return {
+        os.path.join(root, file_name): os.stat(
+            os.path.join(root, file_name)
+        ).st_mtime_ns
+        for root, _, file_names in os.walk(export_dir)
+        for file_name in file_names
+        if file_name.startswith("output")
+    }
+
+
+def test_sweep_resumes_and_regenerates_reordered_variants(
+    tmp_path, config_dir, xml_dir
+):
+    config_path = os.path.join(config_dir, "simple-config.yml")
+    export_dir = str(tmp_path / "sweep")
+    variants = [
+        {"Environment.Objects.Tree01.amount": [1, 1]},
+        {"Environment.Objects.Tree01.amount": [3, 3]},
+    ]
+    Sweep(config_path, variants=variants, seeds=[0], xml_dir=xml_dir).run(export_dir)
+    modification_times = get_modification_times(export_dir)
+    assert len(modification_times) == 4
+
+    Sweep(config_path, variants=variants, seeds=[0], xml_dir=xml_dir).run(export_dir)
+    assert get_modification_times(export_dir) == modification_times
+
+    # Swapped variants must not be mistaken for the worlds at their new paths
+    Sweep(config_path, variants=variants[::-1], seeds=[0], xml_dir=xml_dir).run(
+        export_dir
+    )
+    assert all(
+        modification_times[file_path] != modification_time
+        for file_path, modification_time in get_modification_times(export_dir).items()
+    )
+    with open(Sweep.get_export_path(export_dir, 0, 0) + ".xml") as file:
+        assert len(re.findall(r'<body name="tree01[_0-9]*/tree01"', file.read())) == 3
@@ -0,0 +1,93 @@
+import os
+import hashlib
+import numpy as np
+from pitapy.base.asset_parsing.obj_reader import ObjReader
+
+
+def parse_naive(content: str) -> tuple[np.ndarray, np.ndarray]:
+    vertices, faces = [], []
+    for line in content.splitlines():
+        tokens = line.split("#")[0].split()
+        if tokens and tokens[0] == "v":
+            vertices.append([float(value) for value in tokens[1:4]])
+        elif tokens and tokens[0] == "f":
+            corners = [int(token.split("/")[0]) for token in tokens[1:]]
+            corners = [c - 1 if c > 0 else c + len(vertices) for c in corners]
+            faces += [
+                [corners[0], corners[i], corners[i + 1]]
+                for i in range(1, len(corners) - 1)
+            ]
+    return np.array(vertices).reshape(-1, 3), np.array(faces).reshape(-1, 3)
+
+
+def test_comments_line_endings_and_face_formats():
+    content = (
+        b"# header\r\n"
+        b"v 0 0 0 # c\r\n"
+        b"v 1 0 0 1.0\r\n"
+        b"vt 0 0\r\n"
+        b"vn 0 0 1 # normal\r\n"
+        b"v 0 1 0#no space\r\n"
+        b"v 1 1 0 0.5 0.5 0.5\r\n"
+        b"f 1/1/1 2/1/1 3/1/1 # tri\r\n"
+        b"f 2//1 4//1 3//1\r\n"
+        b"f -4/1 -3/1 -2/1 -1/1#quad"
+    )
+    vertices, faces = ObjReader.parse(content)
+    assert np.array_equal(vertices, [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]])
+    assert np.array_equal(faces, [[0, 1, 2], [1, 3, 2], [0, 1, 2], [0, 2, 3]])
+
+
+def test_example_meshes_match_naive_parser(xml_dir):
+    mesh_dir = os.path.join(xml_dir, "3D_Assets")
+    for file_name in os.listdir(mesh_dir):
+        if not file_name.endswith(".obj"):
+            continue
+        path = os.path.join(mesh_dir, file_name)
+        with open(path) as file:
+            expected_vertices, expected_faces = parse_naive(file.read())
+        vertices, faces = ObjReader.read(path)
+        assert np.allclose(vertices, expected_vertices)
+        assert np.array_equal(faces, expected_faces)
+
+
+def test_large_files_are_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(ObjReader, "MMAP_THRESHOLD", 0)
+    path = tmp_path / "quad.obj"
+    path.write_bytes(b"v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0 # last\nf 1 2 3 4\n")
+    vertices, faces = ObjReader.read(str(path))
+    assert vertices.shape == (4, 3)
+    assert np.array_equal(faces, [[0, 1, 2], [0, 2, 3]])
+    assert not vertices.flags.writeable
+
+
+def test_relative_indices_of_interleaved_faces():
+    content = (
+        "v 0 0 0\nv 1 0 0\nv 0 1 0\nf -3 -2 -1\n"
+        "v 1 1 0\nv 2 1 0\nf -3 -2 -1\nf 1 -1 -2\n"
+        "v 2 2 0\nf -1/1/1 -2/1/1 -4/1/1 -3/1/1\n"
+    )
+    vertices, faces = ObjReader.parse(content.encode())
+    expected_vertices, expected_faces = parse_naive(content)
+    assert np.array_equal(vertices, expected_vertices)
+    assert np.array_equal(faces, expected_faces)
+    assert np.array_equal(faces[:3], [[0, 1, 2], [2, 3, 4], [0, 4, 3]])
+
+
+def test_cache_drops_least_recently_used(monkeypatch):
+    monkeypatch.setattr(ObjReader, "_cache", type(ObjReader._cache)())
+    monkeypatch.setattr(ObjReader, "_cache_bytes", 0)
+    # Three vertices and one triangle take 3 * 3 * 8 + 3 * 8 = 96 bytes
+    monkeypatch.setattr(ObjReader, "CACHE_SIZE", 200)
+    meshes = [
+        f"v {index} 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n".encode() for index in range(3)
+    ]
+    first = ObjReader.parse(meshes[0])[0]
+    ObjReader.parse(meshes[1])
+    assert ObjReader.parse(meshes[0])[0] is first
+    ObjReader.parse(meshes[2])
+    assert len(ObjReader._cache) == 2
+    assert ObjReader._cache_bytes == 192
+    # The second mesh was used least recently and is dropped
+    assert hashlib.sha1(meshes[1]).hexdigest() not in ObjReader._cache
+    assert ObjReader.parse(meshes[0])[0] is first
@@ -0,0 +1,31 @@
+import os
+import sys
+import subprocess
+import pitapy
+
+
+def test_import_does_not_load_mujoco():
+    # The package may not be installed, so the child gets its location on the path
+    environment = {
+        **os.environ,
+        "PYTHONPATH": os.path.dirname(os.path.dirname(pitapy.__file__)),
+    }
+    modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pitapy; print('dm_control' in sys.modules, 'mujoco' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=environment,
+    ).stdout
+    assert modules.split() == ["False", "False"]
+
+
+def test_public_names_are_importable():
+    from pitapy import WorldDataset, load_placements
+
+    assert load_placements == pitapy.PlacementExporter.load
+    assert WorldDataset.__module__ == "pitapy.utils.world_dataset"
@@ -0,0 +1,26 @@
+import os
+import pytest
+from pitapy.portfolio import Portfolio
+from pitapy.utils.config_reader import ConfigReader
+
+
+def get_config(config_dir: str, **environment) -> dict:
+    config = ConfigReader.execute(
+        config_path=os.path.join(config_dir, "simple-config.yml")
+    )
+    config["Environment"].update(environment)
+    return config
+
+
+def test_first_complete_world_wins(config_dir, xml_dir):
+    world = Portfolio(
+        config=get_config(config_dir), attempts=2, xml_dir=xml_dir
+    ).generate(random_seed=3)
+    assert "incomplete" not in world["placements"]
+    assert world["placements"]["portfolio"]["root_seed"] == 3
+
+
+def test_partial_worlds_do_not_win(config_dir, xml_dir):
+    config = get_config(config_dir, time_budget=1e-9, on_time_budget="partial")
+    with pytest.raises(RuntimeError, match="Time budget ran out"):
+        Portfolio(config=config, attempts=2, xml_dir=xml_dir).generate(random_seed=3)
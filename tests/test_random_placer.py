@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from pitapy.base.world_sites.environment import Environment
+from pitapy.base.asset_placement.validator import Validator
+from pitapy.base.asset_placement.rules.abstract_rule import Rule
+from pitapy.base.asset_placement.rules.min_distance_rule import MinDistanceRule
+from pitapy.base.asset_placement.placer.random_placer import RandomPlacer
+from pitapy.base.asset_parsing.mujoco_loader import MujocoLoader
+
+
+class MaxObjectsRule(Rule):
+    """Rejects every position once the given number of objects is placed."""
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def __call__(self, map_2D, shape_object, mujoco_object, site) -> bool:
+        return sum(len(shapes) for shapes in map_2D.values()) < self.count
+
+
+class RejectOnceRule(Rule):
+    """Rejects the first MAX_TRIES positions sampled while the given number of objects is
+    placed, every placed object lies within its distance."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.distance = 100.0
+        self.rejections = 0
+
+    def __call__(self, map_2D, shape_object, mujoco_object, site) -> bool:
+        if sum(len(shapes) for shapes in map_2D.values()) != self.count:
+            return True
+        self.rejections += 1
+        return self.rejections > RandomPlacer.MAX_TRIES
+
+
+def get_blueprints(xml_dir: str) -> dict:
+    config = {
+        "Environment": {
+            "Objects": {
+                "Tree01": [{"xml_name": "Tree01.xml"}],
+                "Tree02": [{"xml_name": "Tree02.xml"}],
+            }
+        }
+    }
+    return MujocoLoader(config_file=config, xml_dir=xml_dir).get_mujoco_objects()
+
+
+def test_blocking_objects_are_near_rejected_positions():
+    placed = [
+        SimpleNamespace(position=(0.0, 0.0, 1.0)),
+        SimpleNamespace(position=(10.0, 10.0, 1.0)),
+        SimpleNamespace(position=(0.5, -0.5, 1.0)),
+    ]
+    validators = [Validator(rules=[MinDistanceRule(dist=1.0)])]
+    blocking = RandomPlacer._get_blocking_objects(
+        mujoco_object=SimpleNamespace(),
+        placed_mujoco_objects=placed,
+        rejected_positions=[(0.2, 0.1), (-0.3, 0.4)],
+        validators=validators,
+    )
+    assert blocking == [placed[0], placed[2]]
+    assert not RandomPlacer._get_blocking_objects(
+        mujoco_object=SimpleNamespace(),
+        placed_mujoco_objects=placed,
+        rejected_positions=[(-20.0, 20.0)],
+        validators=validators,
+    )
+
+
+def test_placement_blocked_by_other_types_fails_without_backtracking(
+    xml_dir, monkeypatch
+):
+    monkeypatch.setattr(RandomPlacer, "MAX_TRIES", 50)
+    blueprints = get_blueprints(xml_dir)
+    environment = Environment(size=((20, 20),), rng=np.random.default_rng(0))
+    validators = [Validator(rules=[MaxObjectsRule(count=2)])]
+    rng = np.random.default_rng(0)
+    RandomPlacer().add(
+        site=environment,
+        mujoco_object_blueprint=blueprints["Tree02"],
+        validators=validators,
+        rng=rng,
+    )
+
+    failures = []
+    sample_valid_position = RandomPlacer.sample_valid_position
+
+    def count_failures(*args, **kwargs):
+        tries = sample_valid_position(*args, **kwargs)
+        failures.extend([] if tries else [1])
+        return tries
+
+    monkeypatch.setattr(
+        RandomPlacer, "sample_valid_position", staticmethod(count_failures)
+    )
+    with pytest.raises(RuntimeError):
+        RandomPlacer().add(
+            site=environment,
+            mujoco_object_blueprint=blueprints["Tree01"],
+            validators=validators,
+            amount=(2, 2),
+            rng=rng,
+        )
+    # The placed tree of the same type does not block, so it is not removed and retried
+    assert len(failures) == 1
+    assert len(environment.mujoco_objects) == 2
+
+
+def test_backtracking_replaces_blocking_object(xml_dir, monkeypatch):
+    monkeypatch.setattr(RandomPlacer, "MAX_TRIES", 50)
+    blueprints = get_blueprints(xml_dir)
+    environment = Environment(size=((20, 20),), rng=np.random.default_rng(0))
+    validators = [Validator(rules=[RejectOnceRule(count=3)])]
+
+    placed = RandomPlacer().add(
+        site=environment,
+        mujoco_object_blueprint=blueprints["Tree01"],
+        validators=validators,
+        amount=(5, 5),
+        colors=[(index / 4, 0.0, 0.0, 1.0) for index in range(5)],
+        rng=np.random.default_rng(0),
+    )
+    # The fourth tree only fits once the third is removed, which is placed again with its color
+    assert len(placed) == 5
+    assert len(environment.mujoco_objects) == 5
+    assert sorted(mujoco_object.color[0] for mujoco_object in placed) == [
+        index / 4 for index in range(5)
+    ]
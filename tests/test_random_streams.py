@@ -0,0 +1,60 @@
+import os
+import json
+import numpy as np
+from pitapy.pita import PITA
+from pitapy.utils.random_streams import RandomStreams
+
+CONFIG = {
+    "Environment": {"Objects": {"Tree": [], "Rock": []}},
+    "Areas": {"Area1": {"Objects": {"Tree": []}}, "Area2": {"Objects": {"Box": []}}},
+}
+
+
+def test_same_seed_gives_same_draws():
+    first, second = RandomStreams(CONFIG, 7), RandomStreams(CONFIG, 7)
+    assert first.world.random() == second.world.random()
+    for key in (("Environment", "Tree"), ("Area1", "Tree"), ("Area2", "Box")):
+        assert np.array_equal(first.get(*key).random(5), second.get(*key).random(5))
+
+
+def test_different_seeds_give_different_draws():
+    first, second = RandomStreams(CONFIG, 7), RandomStreams(CONFIG, 8)
+    assert first.get("Area1", "Tree").random() != second.get("Area1", "Tree").random()
+
+
+def test_streams_are_independent():
+    streams = RandomStreams(CONFIG, 7)
+    draws = {
+        key: streams.get(*key).random()
+        for key in (("Environment", "Tree"), ("Environment", "Rock"), ("Area1", "Tree"))
+    }
+    assert len(set(draws.values())) == len(draws)
+
+    # Draining other streams does not change the draws of a stream
+    reference = RandomStreams(CONFIG, 7)
+    streams = RandomStreams(CONFIG, 7)
+    streams.world.random(1000)
+    streams.get("Environment", "Rock").random(1000)
+    streams.get("Area2", "Box").random(1000)
+    assert np.array_equal(
+        streams.get("Area1", "Tree").random(5),
+        reference.get("Area1", "Tree").random(5),
+    )
+
+
+def test_entropy_reproduces_unseeded_streams():
+    streams = RandomStreams(CONFIG)
+    reproduced = RandomStreams(CONFIG, streams.entropy)
+    assert (
+        streams.get("Area2", "Box").random() == reproduced.get("Area2", "Box").random()
+    )
+
+
+def test_generated_world_is_deterministic(config_dir, xml_dir):
+    config_path = os.path.join(config_dir, "simple-config.yml")
+    worlds = [
+        PITA().generate(config=config_path, random_seed=3, xml_dir=xml_dir)
+        for _ in range(2)
+    ]
+    assert json.dumps(worlds[0][1]) == json.dumps(worlds[1][1])
+    assert worlds[0][0].to_xml_string() == worlds[1][0].to_xml_string()
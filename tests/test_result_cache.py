@@ -0,0 +1,40 @@
+import os
+import builtins
+from pitapy.utils.result_cache import ResultCache
+
+
+def test_asset_hashes_are_kept_in_the_cache_directory(tmp_path, monkeypatch):
+    xml_dir, cache_dir = tmp_path / "xmls", str(tmp_path / "cache")
+    xml_dir.mkdir()
+    (xml_dir / "Tree.xml").write_text("<mujoco/>")
+    digest = ResultCache.hash_assets(str(xml_dir), cache_dir=cache_dir)
+
+    # A new process starts without digests in memory and must not read the assets again
+    monkeypatch.setattr(ResultCache, "_file_hashes", {})
+    opened = []
+    original_open = builtins.open
+    monkeypatch.setattr(
+        builtins,
+        "open",
+        lambda path, *args, **kwargs: opened.append(str(path))
+        or original_open(path, *args, **kwargs),
+    )
+    assert ResultCache.hash_assets(str(xml_dir), cache_dir=cache_dir) == digest
+    assert opened == [os.path.join(cache_dir, ResultCache.ASSET_HASHES_FILE)]
+    monkeypatch.undo()
+
+    (xml_dir / "Tree.xml").write_text("<mujoco model='tree'/>")
+    assert ResultCache.hash_assets(str(xml_dir), cache_dir=cache_dir) != digest
+
+
+def test_evicted_entry_is_a_miss(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    export_path = str(tmp_path / "output")
+    for extension in (".xml", ".json"):
+        (tmp_path / ("output" + extension)).write_text("world")
+    cache.put("key", export_path)
+    assert cache.get("key", export_path)
+
+    # The entry loses its files between the directory check and the copy
+    os.remove(os.path.join(cache.cache_dir, "key", "output.json"))
+    assert not cache.get("key", export_path)
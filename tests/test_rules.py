@@ -0,0 +1,47 @@
+import numpy as np
+from pitapy.base.asset_placement.rules.abstract_rule import Rule
+from pitapy.base.asset_placement.rules.height_rule import HeightRule
+from pitapy.base.asset_placement.rules.min_distance_rule import MinDistanceRule
+from pitapy.base.asset_placement.rules.min_distance_mujoco_physics_rule import (
+    MinDistanceMujocoPhysicsRule,
+    _SphereGrid,
+)
+
+
+def test_min_distance_of_rules():
+    assert Rule.get_min_distance([]) == 0
+    assert Rule.get_min_distance([HeightRule(ground_level=0.0)]) == 0
+    assert (
+        Rule.get_min_distance(
+            [MinDistanceRule(dist=1.5), MinDistanceMujocoPhysicsRule(distance=2.0)]
+        )
+        == 2.0
+    )
+
+
+def test_rules_without_distance_require_none():
+    rules = [MinDistanceMujocoPhysicsRule(distance=None), MinDistanceRule(dist=None)]
+    assert Rule.get_min_distance(rules) == 0
+
+
+def test_sphere_grid_matches_linear_scan():
+    rng = np.random.default_rng(0)
+    grid = _SphereGrid(cell_size=2.0)
+    spheres = {}
+    for index in range(300):
+        center = rng.uniform(-50, 50, size=3)
+        radius = float(rng.uniform(0.1, 3)) if index != 1 else 200.0
+        spheres[index] = (center, radius)
+        grid.add(index, f"model_{index}", center, radius)
+    for index in range(0, 300, 3):
+        grid.remove(index)
+        del spheres[index]
+
+    for _ in range(50):
+        center, reach = rng.uniform(-50, 50, size=3), float(rng.uniform(0, 5))
+        expected = [
+            (index, f"model_{index}")
+            for index, (neighbor_center, radius) in spheres.items()
+            if np.linalg.norm(neighbor_center - center) < reach + radius
+        ]
+        assert grid.query(center, reach) == expected
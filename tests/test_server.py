@@ -0,0 +1,16 @@
+import os
+from pitapy.server import GenerationServer
+
+
+def test_workers_start_before_first_request(config_dir, xml_dir):
+    config_path = os.path.join(config_dir, "simple-config.yml")
+    server = GenerationServer(workers=2, config_path=config_path, xml_dir=xml_dir)
+    try:
+        # Every worker takes one start job, so all of them are running and warmed up
+        pids = server.start_workers()
+        assert len(pids) == 2
+        status, response = server.handle({"config_path": config_path, "random_seed": 3})
+        assert status == 200
+        assert response["random_seed"] == 3
+    finally:
+        server._executor.shutdown()
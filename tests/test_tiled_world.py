@@ -0,0 +1,65 @@
+import os
+import json
+from pitapy.tiled_world import TiledWorld
+from pitapy.utils.placement_exporter import PlacementExporter
+from pitapy.utils.config_reader import ConfigReader
+
+
+def get_config(config_dir: str) -> dict:
+    config = ConfigReader.execute(config_path=os.path.join(config_dir, "ballpit.yml"))
+    config.pop("Areas")
+    return config
+
+
+def load_objects(export_dir: str, index: dict) -> dict:
+    objects = {}
+    for tile in index["tiles"]:
+        with open(os.path.join(export_dir, tile["json"])) as file:
+            objects.update(json.load(file)["objects"])
+    return objects
+
+
+def test_color_groups_span_tiles(config_dir, xml_dir, tmp_path):
+    # Four of the five balls lie in the first tile, the fifth alone in the center tile
+    index = TiledWorld(get_config(config_dir), tiles=9, xml_dir=xml_dir).generate(
+        export_dir=str(tmp_path), random_seed=3
+    )
+    balls = [
+        values
+        for values in load_objects(str(tmp_path), index).values()
+        if values["class"] == "Ball"
+    ]
+    assert len(balls) == 5
+    # Groups of two to four members leave at most two distinct colors for five balls
+    assert len({tuple(ball["color"]) for ball in balls}) <= 2
+    assert all(1 <= value <= 2 for ball in balls for value in ball["size"])
+
+
+def test_split_skips_tiles_without_objects(config_dir, xml_dir, tmp_path):
+    index = TiledWorld(get_config(config_dir), tiles=16, xml_dir=xml_dir).generate(
+        export_dir=str(tmp_path), random_seed=3
+    )
+    classes = [
+        values["class"] for values in load_objects(str(tmp_path), index).values()
+    ]
+    assert classes.count("Ball") == 5
+    assert classes.count("Agent") == 10
+
+
+def test_tiled_example_config(config_dir, xml_dir, tmp_path):
+    index = TiledWorld(
+        os.path.join(config_dir, "tiled-config.yml"), tiles=4, xml_dir=xml_dir
+    ).generate(export_dir=str(tmp_path), random_seed=3)
+    assert len(index["tiles"]) == 4
+    assert sum(tile["objects"] for tile in index["tiles"]) > 0
+
+
+def test_columnar_tiles(config_dir, xml_dir, tmp_path):
+    index = TiledWorld(
+        get_config(config_dir), tiles=4, xml_dir=xml_dir, columnar=True
+    ).generate(export_dir=str(tmp_path), random_seed=3)
+    for tile in index["tiles"]:
+        columns = PlacementExporter.load(
+            os.path.join(str(tmp_path), tile["placements"])
+        )
+        assert len(columns["object_id"]) == tile["objects"]
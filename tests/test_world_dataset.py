@@ -0,0 +1,105 @@
+import os
+import shutil
+import numpy as np
+import pytest
+from pitapy.sweep import Sweep
+from pitapy.utils.placement_exporter import PlacementExporter
+from pitapy.utils.world_dataset import WorldDataset
+
+
+def make_placements(count: int) -> tuple[np.ndarray, dict[str, list[str]]]:
+    placements = np.zeros(count, dtype=PlacementExporter.DTYPE)
+    placements["object_id"] = np.arange(count)
+    placements["position"][:, 0] = np.arange(count)
+    tables = {
+        "names": [f"object_{index}" for index in range(count)],
+        "classes": ["Tree"],
+        "sites": ["environment"],
+    }
+    return placements, tables
+
+
+def test_append_and_read(tmp_path):
+    dataset = WorldDataset(str(tmp_path), mode="w")
+    for seed in range(3):
+        placements, tables = make_placements(seed + 1)
+        index = dataset.append(
+            placements, tables, xml=f"<mujoco seed='{seed}'/>", random_seed=seed
+        )
+        assert index == seed
+
+    dataset = WorldDataset(str(tmp_path))
+    assert len(dataset) == 3
+    world = dataset[2]
+    assert world["random_seed"] == 2
+    assert world["position"][:, 0].tolist() == [0, 1, 2]
+    assert world["names"].tolist() == ["object_0", "object_1", "object_2"]
+    assert dataset.get_xml(-1) == "<mujoco seed='2'/>"
+    with pytest.raises(IndexError):
+        dataset[3]
+    with pytest.raises(RuntimeError):
+        dataset.append(*make_placements(1))
+
+
+def test_contains(tmp_path):
+    dataset = WorldDataset(str(tmp_path), mode="w")
+    dataset.append(*make_placements(1), random_seed=1, config_hash="a" * 64)
+    assert dataset.contains("a" * 64, 1)
+    assert not dataset.contains("a" * 64, 2)
+    assert not dataset.contains("b" * 64, 1)
+
+    # Worlds appended after the dataset was opened are found as well
+    reader = WorldDataset(str(tmp_path))
+    dataset.append(*make_placements(1), random_seed=2, config_hash="b" * 64)
+    assert reader.contains("b" * 64, 2)
+    assert WorldDataset(str(tmp_path), mode="a").contains("a" * 64, 1)
+
+
+def test_recover_interrupted_write(tmp_path):
+    dataset = WorldDataset(str(tmp_path), mode="w")
+    dataset.append(*make_placements(2), xml="<mujoco/>", random_seed=1)
+    sizes = {
+        name: os.path.getsize(os.path.join(str(tmp_path), name))
+        for name in ("placements.bin", "blobs.bin", "index.bin")
+    }
+    # Data and half an index record of a world that was never committed
+    for name, size in (("placements.bin", 100), ("blobs.bin", 10), ("index.bin", 20)):
+        with open(os.path.join(str(tmp_path), name), "ab") as file:
+            file.write(b"\x01" * size)
+
+    dataset = WorldDataset(str(tmp_path), mode="a")
+    for name, size in sizes.items():
+        assert os.path.getsize(os.path.join(str(tmp_path), name)) == size
+    assert len(dataset) == 1
+    assert dataset.append(*make_placements(3), random_seed=2) == 1
+    assert dataset[1]["random_seed"] == 2
+    assert dataset.get_xml(0) == "<mujoco/>"
+
+
+def test_contains_checks_assets(tmp_path):
+    dataset = WorldDataset(str(tmp_path), mode="w")
+    dataset.append(
+        *make_placements(1), random_seed=1, config_hash="a" * 64, asset_hash="c" * 64
+    )
+    assert dataset.contains("a" * 64, 1, asset_hash="c" * 64)
+    assert not dataset.contains("a" * 64, 1, asset_hash="d" * 64)
+
+
+def test_sweep_dataset_regenerates_changed_assets(tmp_path, config_dir, xml_dir):
+    config_path = os.path.join(config_dir, "simple-config.yml")
+    xml_copy = str(tmp_path / "xml_objects")
+    shutil.copytree(xml_dir, xml_copy)
+    export_dir = str(tmp_path / "sweep")
+
+    # Three seeds on one worker are more than it gets submitted at a time
+    sweep = Sweep(config_path, seeds=[0, 1, 2], xml_dir=xml_copy, dataset=True)
+    sweep.run(export_dir)
+    sweep.run(export_dir)
+    assert len(WorldDataset(os.path.join(export_dir, "dataset"))) == 3
+
+    with open(os.path.join(xml_copy, "Tree01.xml"), "a") as file:
+        file.write("<!-- changed -->\n")
+    sweep.run(export_dir)
+    dataset = WorldDataset(os.path.join(export_dir, "dataset"))
+    assert len(dataset) == 6
+    assert sorted(dataset[index]["random_seed"] for index in range(3, 6)) == [0, 1, 2]
@@ -0,0 +1,25 @@
+import os
+import numpy as np
+import pytest
+from dm_control import mjcf
+from pitapy.world_randomizer import WorldRandomizer
+
+
+@pytest.mark.parametrize("config_name", ["simple-config.yml", "complex-config.yml"])
+def test_model_matches_recompile(config_dir, xml_dir, config_name):
+    world_randomizer = WorldRandomizer(
+        os.path.join(config_dir, config_name), random_seed=1, xml_dir=xml_dir
+    )
+    world_randomizer.randomize(5)
+    model = world_randomizer.model
+    recompiled = mjcf.Physics.from_mjcf_model(
+        world_randomizer.environment.mjcf_model
+    ).model.ptr
+
+    for name in ("body_pos", "body_quat", "geom_size", "geom_rgba", "qpos0"):
+        np.testing.assert_allclose(
+            getattr(model, name), getattr(recompiled, name), atol=1e-9, err_msg=name
+        )
+    # The bounding volumes of the broadphase may be larger, but never smaller
+    assert np.all(model.geom_rbound >= recompiled.geom_rbound - 1e-9)
+    assert np.all(model.geom_aabb[:, 3:] >= recompiled.geom_aabb[:, 3:] - 1e-9)